@@ -9,14 +9,19 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.colors as pc
+import sqlite3
 import sys
 import os
+import threading
+from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
-from database import get_connection, DB_PATH
+from database import DB_PATH
 from analysis import (
     get_dem_vote_share_by_election,
+    get_avg_vote_share_by_election,
     get_precinct_shift,
     get_competitive_races,
     get_turnout_analysis,
@@ -38,6 +43,7 @@ from analysis import (
     get_election_overview,
     get_area_election_summary,
     get_2026_target_races,
+    shrink_dtypes,
 )
 from census_acs import get_area_demographics, get_tract_detail
 from campaign_finance import (
@@ -63,24 +69,345 @@ st.set_page_config(
 st.title("Boone County Democrats - Election Data Dashboard")
 st.markdown("*Data-driven strategy for Democratic success in Boone County, Indiana*")
 
+# ============================================================
+# CACHED QUERIES
+# ============================================================
+# Every widget interaction reruns the script; these keep the small
+# lookup/browser queries from reopening SQLite on each rerun.
+# Each takes the _data_version() as its last argument, like the analysis
+# caches below, so a re-import shows up in them right away.
+
+def _data_version():
+    """Database file mtime; analysis caches take it as an argument so a re-import invalidates them."""
+    return os.path.getmtime(DB_PATH)
+
+
+@st.cache_resource
+def _shared_conn():
+    """One read-only connection for the whole server process."""
+    # mode=ro as in analysis._read_conn: SQLite opens the file without
+    # write access, so reads skip the journal/lock bookkeeping for writes
+    conn = sqlite3.connect(Path(DB_PATH).as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA cache_size = -20000")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+
+# Sessions run on separate threads; serialize use of the shared connection
+_conn_lock = threading.Lock()
+
+
+def _read_sql(query, params=None):
+    # Plain tuples (not sqlite3.Row) built straight into a frame: cheaper
+    # than read_sql_query for the larger result sets, same dtypes
+    with _conn_lock:
+        cur = _shared_conn().cursor()
+        cur.row_factory = None
+        cur.execute(query, params or ())
+        columns = [d[0] for d in cur.description]
+        rows = cur.fetchall()
+    return pd.DataFrame.from_records(rows, columns=columns)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_election_count(version):
+    with _conn_lock:
+        return _shared_conn().execute("SELECT COUNT(*) as cnt FROM elections").fetchone()["cnt"]
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_all_elections(version):
+    return _read_sql(
+        "SELECT id, election_type, election_date, election_name FROM elections ORDER BY election_date"
+    )
+
+
+# The election lists below are slices of the one cached query above
+def _fetch_elections(version):
+    return _fetch_all_elections(version).drop_duplicates(["election_date", "election_name"])[
+        ["election_date", "election_name"]
+    ]
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_election_dates(version):
+    """Election dates as a tuple for the date selectboxes, converted once."""
+    return tuple(_fetch_elections(version)["election_date"].tolist())
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_general_election_dates(version):
+    """2016+ general election dates as a plain list; it only feeds a multiselect."""
+    with _conn_lock:
+        rows = _shared_conn().execute("""
+            SELECT DISTINCT election_date FROM elections
+            WHERE election_type = 'general' AND election_date >= '2016-01-01'
+            ORDER BY election_date
+        """).fetchall()
+    return [row["election_date"] for row in rows]
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_election_races(election_id, version):
+    return _read_sql("""
+        SELECT
+            r.race_name,
+            COALESCE(r.normalized_name, r.race_name) as normalized_name,
+            r.race_level,
+            r.race_type,
+            r.total_votes,
+            COUNT(DISTINCT c.id) as candidates,
+            COUNT(DISTINCT res.precinct_id) as precincts
+        FROM races r
+        LEFT JOIN results res ON res.race_id = r.id
+        LEFT JOIN candidates c ON res.candidate_id = c.id
+        WHERE r.election_id = ?
+        GROUP BY r.id
+        ORDER BY r.race_level, r.race_name
+    """, params=[election_id])
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_race_counts(election_id, version):
+    """Headline race counts for one election, without pulling the race rows."""
+    return _read_sql("""
+        SELECT
+            COUNT(*) as total,
+            COALESCE(SUM(CASE WHEN COALESCE(normalized_name, race_name) <> race_name
+                              THEN 1 ELSE 0 END), 0) as name_changed,
+            COUNT(DISTINCT race_level) as race_levels
+        FROM races
+        WHERE election_id = ?
+    """, params=[election_id]).iloc[0]
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_races(election_id, version):
+    return _read_sql("""
+        SELECT id, race_name, COALESCE(normalized_name, race_name) as display_name,
+               race_level, race_type
+        FROM races WHERE election_id = ?
+        ORDER BY race_level, race_name
+    """, params=[election_id])
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_race_results(race_id, version):
+    df = _read_sql("""
+        SELECT
+            c.name as candidate,
+            c.party,
+            COALESCE(p.precinct_name, 'TOTAL') as precinct,
+            res.votes,
+            res.vote_percentage
+        FROM results res
+        JOIN candidates c ON res.candidate_id = c.id
+        LEFT JOIN precincts p ON res.precinct_id = p.id
+        WHERE res.race_id = ?
+        ORDER BY c.party, c.name, p.precinct_name
+    """, params=[race_id])
+    return shrink_dtypes(df)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_race_summary(race_id, version):
+    return _read_sql("""
+        SELECT
+            c.name as candidate,
+            c.party,
+            SUM(res.votes) as votes,
+            ROUND(SUM(res.votes) * 100.0 / SUM(SUM(res.votes)) OVER (), 1) as share
+        FROM results res
+        JOIN candidates c ON res.candidate_id = c.id
+        WHERE res.race_id = ?
+        GROUP BY c.name, c.party
+        ORDER BY votes DESC
+    """, params=[race_id])
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_all_races_summary(election_id, version):
+    return _read_sql("""
+        SELECT
+            COALESCE(r.normalized_name, r.race_name) as race,
+            r.race_level as level,
+            GROUP_CONCAT(DISTINCT c.party) as parties,
+            COUNT(DISTINCT c.id) as candidates,
+            SUM(res.votes) as total_votes,
+            COUNT(DISTINCT res.precinct_id) as precincts
+        FROM races r
+        LEFT JOIN results res ON res.race_id = r.id
+        LEFT JOIN candidates c ON res.candidate_id = c.id
+        WHERE r.election_id = ?
+        GROUP BY r.id
+        ORDER BY r.race_level, r.race_name
+    """, params=[election_id])
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_stats(version):
+    return _read_sql("""
+        SELECT
+            (SELECT COUNT(*) FROM elections) as total_elections,
+            (SELECT COUNT(*) FROM races) as total_races,
+            (SELECT COUNT(*) FROM results) as total_results,
+            (SELECT COUNT(DISTINCT precinct_id) FROM results WHERE precinct_id IS NOT NULL) as total_precincts,
+            (SELECT COUNT(*) FROM data_quality WHERE overall_confidence = 'high') as high_count,
+            (SELECT COUNT(*) FROM data_quality) as assessed_count
+    """)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_dq_report(version):
+    df = _read_sql("""
+        SELECT
+            e.election_date as "Date",
+            e.election_name as "Election",
+            dq.overall_confidence as "Confidence",
+            dq.confidence_score as "Score",
+            dq.source_type as "Source",
+            CASE WHEN dq.cross_validated THEN 'Yes' ELSE 'No' END as "Cross-Validated",
+            CASE WHEN dq.race_names_clean THEN 'Yes' ELSE 'No' END as "Names Clean",
+            CASE WHEN dq.turnout_consistent THEN 'Yes' ELSE 'No' END as "Turnout OK",
+            CASE WHEN dq.precinct_count_match THEN 'Yes' ELSE 'No' END as "Precinct Match",
+            dq.notes as "Notes"
+        FROM data_quality dq
+        JOIN elections e ON e.id = dq.election_id
+        ORDER BY e.election_date
+    """)
+    return shrink_dtypes(df, category_cols=("Confidence", "Source"))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_import_log(version):
+    return _read_sql("""
+        SELECT
+            filename as "File",
+            file_type as "Type",
+            records_imported as "Records",
+            status as "Status",
+            notes as "Notes",
+            imported_at as "Imported"
+        FROM import_log
+        ORDER BY imported_at DESC
+    """)
+
+
+# Analysis results are pickled to Streamlit's disk cache as well as kept in
+# memory, so a restarted server (cold start) loads them instead of re-running
+# the SQL. They are keyed on _data_version(), which is what expires them;
+# persisted caches do not support a TTL.
+_persisted = st.cache_data(persist="disk", show_spinner=False)
+
+
+@_persisted
+def _fetch_avg_vote_share(version):
+    return get_avg_vote_share_by_election()
+
+
+@_persisted
+def _fetch_vote_shares(version):
+    return get_dem_vote_share_by_election()
+
+
+@_persisted
+def _fetch_summary_report(version):
+    return generate_summary_report()
+
+
+@_persisted
+def _fetch_headline_kpis(version):
+    return get_headline_kpis()
+
+
+@_persisted
+def _fetch_top_opportunities(version):
+    return get_top_opportunities()
+
+
+@_persisted
+def _fetch_typology(recent_elections, top_pctile, trend_threshold, version):
+    """Typology for one slider setting, plus its category counts and the rows in avg_d_share order."""
+    typology = get_precinct_typology(
+        recent_elections=recent_elections,
+        top_pctile=top_pctile,
+        trend_threshold=trend_threshold,
+    )
+    if typology.empty:
+        return typology, typology, typology
+    # category is categorical (shrink_dtypes): count its codes directly
+    category = typology["category"].astype("category")
+    counts = np.bincount(category.cat.codes.to_numpy(), minlength=len(category.cat.categories))
+    cat_counts = pd.DataFrame({"category": category.cat.categories, "count": counts})[counts > 0]
+    by_share = typology.iloc[np.argsort(typology["avg_d_share"].to_numpy(), kind="stable")]
+    return typology, cat_counts, by_share
+
+
+@_persisted
+def _fetch_2026_targets(version):
+    return get_2026_target_races()
+
+
+@_persisted
+def _fetch_heatmap(min_elections, version):
+    return get_precinct_heatmap_data(min_elections=min_elections)
+
+
+@_persisted
+def _fetch_turnout_vs_dem_share(election_date, turnout_cap, version):
+    return get_turnout_vs_dem_share(election_date=election_date, turnout_cap=turnout_cap)
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_caches(version):
+    """
+    Once per data version, fill the analysis caches above on a background
+    thread (default widget settings for the parameterized ones), so views
+    the user has not opened yet are already computed when they get there.
+    The caches lock per entry, so a view asking for the same result while
+    it is being warmed waits for it rather than computing it twice.
+    """
+    def warm():
+        for fetch, args in (
+            (_fetch_headline_kpis, ()),
+            (_fetch_top_opportunities, ()),
+            (_fetch_avg_vote_share, ()),
+            (_fetch_vote_shares, ()),
+            (_fetch_summary_report, ()),
+            (_fetch_typology, (8, 75, 1.0)),
+            (_fetch_heatmap, (3,)),
+            (_fetch_turnout_vs_dem_share, (None, 100.0)),
+            (_fetch_2026_targets, ()),
+        ):
+            try:
+                fetch(*args, version)
+            except Exception:
+                pass  # the view that needs it will raise and show the error
+
+    thread = threading.Thread(target=warm, name="warm-caches", daemon=True)
+    thread.start()
+    return thread
+
+
 # Check if database exists and has data
 if not os.path.exists(DB_PATH):
     st.warning("Database not initialized yet. Run `python src/database.py` first.")
     st.stop()
 
-conn = get_connection()
-election_count = conn.execute("SELECT COUNT(*) as cnt FROM elections").fetchone()["cnt"]
-conn.close()
+election_count = _fetch_election_count(_data_version())
 
 if election_count == 0:
     st.info("No election data loaded yet. Import data using the tools in src/")
     st.stop()
 
+_warm_caches(_data_version())
+
 # Sidebar filters
 st.sidebar.header("Filters")
-conn = get_connection()
-elections = pd.read_sql_query("SELECT DISTINCT election_date, election_name FROM elections ORDER BY election_date", conn)
-conn.close()
+elections = _fetch_elections(_data_version())
+election_dates = _fetch_election_dates(_data_version())
 
 # ============================================================
 # COLOR MAPS
@@ -127,30 +454,464 @@ DEPENDENCY_COLORS = {
     "Candidate-Dependent": "#2ecc71",
 }
 
+# Data-quality confidence levels as shown in tables (text, dark-mode friendly)
+CONFIDENCE_LABELS = {"high": "HIGH", "medium": "MEDIUM", "low": "LOW"}
+
+# Confidence score (0-100) drawn as a bar by the browser instead of preformatted text
+SCORE_COLUMN = st.column_config.ProgressColumn("Score", format="%d%%", min_value=0, max_value=100)
+
+# Continuous scales shared by several charts (tuples: immutable, stable cache keys)
+HEATMAP_SCALE = ("#922b21", "#e74c3c", "#f5b7b1", "#ffffff", "#aed6f1", "#3498db", "#1a5276")
+MARGIN_SCALE = ("#ff0000", "#ffffff", "#0000ff")
+VOLATILITY_SCALE = ("#2ecc71", "#f39c12", "#e74c3c")
+PVI_SCALE = ("#922b21", "#e74c3c", "#ffffff", "#3498db", "#1a5276")
+ROLLOFF_SCALE = ("#ffffff", "#f39c12", "#e74c3c")
+THIRD_PARTY_SCALE = ("#aed6f1", "#8e44ad")
+
+# ============================================================
+# CACHED FIGURE BUILDERS
+# ============================================================
+# Figures are memoized on a fingerprint of their input frame, so a rerun
+# triggered by an unrelated widget reuses the built figure instead of
+# re-running plotly's (slow) figure construction. Each figure carries a
+# fixed uirevision so plotly.js keeps zoom/pan and diffs the update in
+# place rather than relaying out the chart when it is re-sent.
+
+def _frame_fingerprint(df):
+    # The per-row hashes in row order, not their sum: a re-sorted frame (e.g.
+    # the heatmap's "Sort precincts by") must not reuse the other order's figure
+    return (df.shape, tuple(df.columns), pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+
+
+_FRAME_HASH = {pd.DataFrame: _frame_fingerprint}
+
+# Per-precinct charts grow with the row count; past this the browser stalls
+MAX_CHART_HEIGHT = 3000
+PRECINCT_PAGE = 50
+RASTER_HEATMAP_ROWS = 100
+
+
+def _chart_height(n_rows, minimum=500, per_row=16):
+    return min(MAX_CHART_HEIGHT, max(minimum, n_rows * per_row))
+
+
+def _limit_precincts(df, metric, key, per_row=16):
+    """
+    When a one-row-per-precinct chart would not fit in MAX_CHART_HEIGHT,
+    chart only the top/bottom PRECINCT_PAGE by `metric` unless the user
+    asks for all of them.
+    """
+    if len(df) * per_row <= MAX_CHART_HEIGHT:
+        return df
+    choice = st.selectbox(
+        "Show precincts",
+        [f"Top {PRECINCT_PAGE}", f"Bottom {PRECINCT_PAGE}", "All (slow)"],
+        key=key,
+    )
+    if choice.startswith("Top"):
+        return df.nlargest(PRECINCT_PAGE, metric)
+    if choice.startswith("Bottom"):
+        return df.nsmallest(PRECINCT_PAGE, metric)
+    return df
+
+
+def _imshow_precincts(z, x, y, scale, zmin, zmax, labels, **kwargs):
+    """
+    px.imshow for a precinct x election grid. Up to RASTER_HEATMAP_ROWS rows
+    it is the usual per-cell heatmap; past that the cells are colored here
+    and shipped as a single PNG (binary_string), with an empty scatter trace
+    carrying the color bar. The image has no per-cell hover; precincts and
+    elections are read off the axis ticks. Cells go out as float32, half
+    the payload of float64; hover rounds them to two decimals.
+    """
+    z = np.asarray(z, dtype=np.float32)
+    if len(y) <= RASTER_HEATMAP_ROWS:
+        fig = px.imshow(
+            z, x=x, y=y,
+            color_continuous_scale=scale, zmin=zmin, zmax=zmax,
+            labels=labels, aspect="auto", **kwargs,
+        )
+        fig.update_traces(hovertemplate=fig.data[0].hovertemplate.replace("%{z}", "%{z:.2f}"))
+        return fig
+    kwargs.pop("color_continuous_midpoint", None)
+    lut = np.array([
+        [int(float(v)) for v in c[c.index("(") + 1:-1].split(",")[:3]]
+        for c in pc.sample_colorscale(list(scale), np.linspace(0, 1, 256), colortype="rgb")
+    ], dtype=np.uint8)
+    codes = np.rint(np.clip((z - zmin) / (zmax - zmin), 0, 1) * 255)
+    rgb = lut[np.nan_to_num(codes).astype(np.intp)]
+    rgb[np.isnan(z)] = 240
+    fig = px.imshow(rgb, binary_string=True, labels=labels, aspect="auto", **kwargs)
+    # Image traces only take numeric coordinates, so the names go on the ticks
+    fig.update_traces(hoverinfo="skip")
+    fig.update_xaxes(tickmode="array", tickvals=np.arange(len(x)), ticktext=list(x))
+    fig.update_yaxes(tickmode="array", tickvals=np.arange(len(y)), ticktext=list(y))
+    fig.add_trace(go.Scatter(
+        x=[None], y=[None], mode="markers", showlegend=False, hoverinfo="skip",
+        marker=dict(
+            colorscale=list(scale), cmin=zmin, cmax=zmax, showscale=True,
+            colorbar=dict(title=labels.get("color")),
+        ),
+    ))
+    return fig
+
+
+def _label_top_points(fig, df, x, y, by, n=15):
+    """Add text labels for the top-n rows by `by` only; every point still names its precinct on hover."""
+    top = df.nlargest(n, by)
+    fig.add_trace(go.Scatter(
+        x=top[x],
+        y=top[y],
+        text=top["precinct"],
+        mode="text",
+        textposition="top center",
+        textfont_size=7,
+        hoverinfo="skip",
+        showlegend=False,
+    ))
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_typology_pie(cat_counts):
+    fig = px.pie(
+        cat_counts,
+        values="count",
+        names="category",
+        color="category",
+        color_discrete_map=CATEGORY_COLORS,
+        hole=0.4,
+        title="Precinct Distribution",
+    )
+    fig.update_layout(height=400)
+    fig.update_layout(uirevision="typology_pie")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_typology_bar(typology):
+    fig = px.bar(
+        typology.iloc[np.argsort(typology["avg_d_share"].to_numpy(), kind="stable")],
+        x="avg_d_share",
+        y="precinct",
+        color="category",
+        color_discrete_map=CATEGORY_COLORS,
+        orientation="h",
+        title="Precincts by Avg Democratic Vote Share",
+        hover_data={"d_trend": ":.2f", "latest_d_share": ":.2f", "elections_counted": True},
+    )
+    fig.add_vline(x=50, line_dash="dash", line_color="gray", opacity=0.5)
+    fig.update_layout(height=_chart_height(len(typology)))
+    fig.update_layout(uirevision="typology_bar")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_heatmap(heatmap):
+    fig = _imshow_precincts(
+        heatmap.to_numpy(dtype=np.float32),
+        x=heatmap.columns,
+        y=heatmap.index,
+        scale=HEATMAP_SCALE,
+        zmin=-60,
+        zmax=60,
+        color_continuous_midpoint=0,
+        title="D Margin by Precinct and Election",
+        labels=dict(x="Election Date", y="Precinct", color="D Margin %"),
+    )
+    fig.update_layout(
+        height=_chart_height(len(heatmap), minimum=600),
+        xaxis=dict(tickangle=45),
+    )
+    fig.update_layout(uirevision="heatmap")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_rolloff_heatmap(heatmap_df):
+    fig = _imshow_precincts(
+        heatmap_df.to_numpy(dtype=np.float32),
+        x=heatmap_df.columns,
+        y=heatmap_df.index,
+        scale=ROLLOFF_SCALE,
+        zmin=0,
+        zmax=50,
+        title="Average Rolloff % by Precinct and Election",
+        labels=dict(x="Election Date", y="Precinct", color="Rolloff %"),
+    )
+    fig.update_layout(
+        height=_chart_height(len(heatmap_df), minimum=600),
+        xaxis=dict(tickangle=45),
+    )
+    fig.update_layout(uirevision="rolloff_heatmap")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_straight_ticket_heatmap(valid_pct):
+    # precinct x election mean grid filled straight into an array (no pivot frame)
+    rows, precincts = pd.factorize(valid_pct["precinct"], sort=True)
+    cols, elections = pd.factorize(valid_pct["election_date"], sort=True)
+    cells = rows * len(elections) + cols
+    size = len(precincts) * len(elections)
+    sums = np.bincount(cells, weights=valid_pct["d_straight_pct"].to_numpy(dtype=np.float64), minlength=size)
+    counts = np.bincount(cells, minlength=size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        grid = (sums / counts).reshape(len(precincts), len(elections))
+    # Most D-leaning precincts first
+    order = np.argsort(-np.nanmean(grid, axis=1), kind="stable")
+
+    fig = _imshow_precincts(
+        grid[order],
+        x=np.asarray(elections),
+        y=np.asarray(precincts)[order],
+        scale=MARGIN_SCALE,
+        zmin=0,
+        zmax=100,
+        color_continuous_midpoint=50,
+        title="Straight-Ticket D% by Precinct Over Time",
+        labels=dict(x="Election", y="Precinct", color="D Straight %"),
+    )
+    fig.update_layout(height=_chart_height(len(precincts), per_row=14))
+    fig.update_layout(uirevision="straight_ticket_heatmap")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_shift_bar(shifts, date1, date2):
+    # Arrays in shift order go straight to plotly; no sorted frame copy
+    shift = shifts["shift"].to_numpy()
+    order = np.argsort(shift, kind="stable")
+    fig = px.bar(
+        x=shift[order],
+        y=shifts["precinct"].to_numpy()[order],
+        orientation="h",
+        color=shift[order],
+        labels=dict(x="shift", y="precinct", color="shift"),
+        color_continuous_scale=MARGIN_SCALE,
+        color_continuous_midpoint=0,
+        title=f"Precinct Shift: {date1} \u2192 {date2}"
+    )
+    fig.update_traces(hovertemplate="shift=%{marker.color:.2f}<br>precinct=%{y}<extra></extra>")
+    fig.update_layout(height=_chart_height(len(shifts), minimum=400, per_row=15))
+    fig.update_layout(uirevision="shift_bar")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_volatility_bar(volatility_df):
+    fig = px.bar(
+        volatility_df.sort_values("volatility", ascending=True),
+        x="volatility",
+        y="precinct",
+        orientation="h",
+        color="volatility",
+        color_continuous_scale=VOLATILITY_SCALE,
+        title="Precinct Volatility Index (pp swing per election)",
+        hover_data={"volatility": ":.2f", "max_swing": ":.2f", "avg_d_share": ":.2f", "latest_d_share": ":.2f"},
+    )
+    fig.update_layout(height=_chart_height(len(volatility_df)))
+    fig.update_layout(uirevision="volatility_bar")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_volatility_scatter(volatility_df):
+    fig = px.scatter(
+        volatility_df,
+        x="avg_d_share",
+        y="volatility",
+        color="volatility",
+        color_continuous_scale=VOLATILITY_SCALE,
+        title="Volatility vs. Avg D Share (top-right = high value persuasion targets)",
+        hover_name="precinct",
+        hover_data={"volatility": ":.2f", "latest_d_share": ":.2f", "max_swing": ":.2f"},
+    )
+    _label_top_points(fig, volatility_df, "avg_d_share", "volatility", by="volatility")
+    fig.update_layout(
+        xaxis_title="Avg D Vote Share %",
+        yaxis_title="Volatility (pp swing/election)",
+        height=500,
+    )
+    fig.update_layout(uirevision="volatility_scatter")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_pvi_bar(pvi_df):
+    fig = px.bar(
+        pvi_df.sort_values("pvi"),
+        x="pvi",
+        y="precinct",
+        orientation="h",
+        color="pvi",
+        color_continuous_scale=PVI_SCALE,
+        color_continuous_midpoint=0,
+        title="Precinct PVI (positive = more D than county avg)",
+        hover_data={"pvi": ":.2f", "pvi_label": True, "avg_d_share": ":.2f", "elections_counted": True},
+    )
+    fig.add_vline(x=0, line_dash="dash", line_color="gray", opacity=0.5,
+                  annotation_text="County Average")
+    fig.update_layout(height=_chart_height(len(pvi_df)))
+    fig.update_layout(uirevision="pvi_bar")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_surge_scatter(surge_df, med_growth, med_d):
+    fig = px.scatter(
+        surge_df,
+        x="reg_growth_pct",
+        y="d_share_change",
+        color="quadrant",
+        color_discrete_map=SURGE_COLORS,
+        hover_name="precinct",
+        hover_data=["earliest_registered", "latest_registered"],
+        title="Registration Growth vs. D Share Change by Precinct",
+    )
+    _label_top_points(fig, surge_df, "reg_growth_pct", "d_share_change", by="reg_growth_pct")
+    fig.add_hline(y=med_d, line_dash="dash", line_color="gray", opacity=0.5,
+                  annotation_text=f"Median D change: {med_d:.1f} pp")
+    fig.add_vline(x=med_growth, line_dash="dash", line_color="gray", opacity=0.5,
+                  annotation_text=f"Median growth: {med_growth:.0f}%")
+    fig.update_layout(
+        xaxis_title="Registration Growth %",
+        yaxis_title="D Share Change (pp)",
+        height=600,
+    )
+    fig.update_layout(uirevision="surge_scatter")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_competitive_scatter(competitive, margin_threshold):
+    # Built as a go.Scatter straight from arrays (what px.scatter would emit,
+    # without its frame parsing); margin colors are mapped by the browser
+    margin = competitive["margin"].to_numpy()
+    size = competitive["total_votes"].abs().to_numpy()
+    fig = go.Figure(
+        go.Scatter(
+            x=competitive["election_date"].to_numpy(),
+            y=margin,
+            mode="markers",
+            marker=dict(
+                color=margin,
+                coloraxis="coloraxis",
+                size=size,
+                sizemode="area",
+                sizeref=2.0 * max(size.max(), 1) / 20 ** 2,
+            ),
+            customdata=competitive[["race_name", "dem_votes", "rep_votes"]].to_numpy(),
+            hovertemplate=(
+                "election_date=%{x}<br>margin=%{marker.color:.2f}<br>total_votes=%{marker.size}"
+                "<br>race_name=%{customdata[0]}<br>dem_votes=%{customdata[1]}"
+                "<br>rep_votes=%{customdata[2]}<extra></extra>"
+            ),
+        ),
+        layout=dict(
+            title=f"Races Within {margin_threshold} Points",
+            xaxis_title="election_date",
+            yaxis_title="margin",
+            coloraxis=dict(colorscale=MARGIN_SCALE, cmid=0, colorbar=dict(title="margin")),
+        ),
+    )
+    fig.add_hline(y=0, line_dash="dash", line_color="gray")
+    fig.update_layout(uirevision="competitive_scatter")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_geo_bar(filtered, geo_election):
+    fig = px.bar(
+        filtered,
+        x="straight_d_pct_of_total",
+        y="precinct",
+        orientation="h",
+        color="dependency",
+        color_discrete_map=DEPENDENCY_COLORS,
+        title=f"Straight-Ticket D as % of Total D Votes ({geo_election})",
+        hover_data=["straight_d_votes", "total_d_votes"],
+    )
+    fig.add_vline(x=40, line_dash="dash", line_color="#8e44ad", opacity=0.3,
+                  annotation_text="Brand-Dependent threshold")
+    fig.add_vline(x=20, line_dash="dash", line_color="#2ecc71", opacity=0.3,
+                  annotation_text="Candidate-Dependent threshold")
+    fig.update_layout(height=_chart_height(len(filtered)))
+    fig.update_layout(uirevision="geo_bar")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_straight_ticket_bar(trend_summary):
+    long_df = trend_summary.rename(columns={
+        "total_d_straight": "D Straight Ticket",
+        "total_r_straight": "R Straight Ticket",
+    }).melt(
+        id_vars="election_date",
+        value_vars=["D Straight Ticket", "R Straight Ticket"],
+        var_name="party",
+        value_name="votes",
+    )
+    fig = px.bar(
+        long_df,
+        x="election_date",
+        y="votes",
+        color="party",
+        barmode="group",
+        color_discrete_map={"D Straight Ticket": "blue", "R Straight Ticket": "red"},
+        title="Straight-Ticket Voting Over Time",
+        labels={"election_date": "Election", "votes": "Total Straight-Ticket Votes"},
+    )
+    fig.update_layout(legend_title_text="", uirevision="straight_ticket_bar")
+    return fig
+
+
+@st.cache_data(hash_funcs=_FRAME_HASH, show_spinner=False)
+def _build_straight_ticket_line(trend, y, title, yaxis_title):
+    fig = px.line(trend, x="election_date", y=y, title=title, markers=True)
+    if y == "d_straight_pct":
+        fig.add_hline(y=50, line_dash="dash", line_color="gray", opacity=0.5)
+    fig.update_layout(yaxis_title=yaxis_title, uirevision=y)
+    return fig
+
+
+# ============================================================
+# LAZY RAW-DATA TABLES
+# ============================================================
+RAW_TABLE_ROWS = 500
+
+
+def _lazy_table(data, key, **kwargs):
+    """
+    Render a raw-data table inside an expander only after the user asks for it.
+    Expander bodies run (and ship their rows to the browser) even when closed,
+    so the table sits behind a checkbox. `data` may be a DataFrame or a
+    zero-argument loader so the query itself is deferred too. Underscore-
+    prefixed helper columns (e.g. stored medians) are not shown.
+    """
+    if not st.checkbox("Load table", key=key):
+        return
+    df = data() if callable(data) else data
+    df = df.loc[:, ~df.columns.astype(str).str.startswith("_")]
+    if len(df) > RAW_TABLE_ROWS:
+        st.caption(f"Showing the first {RAW_TABLE_ROWS:,} of {len(df):,} rows.")
+    st.dataframe(df.head(RAW_TABLE_ROWS), **kwargs)
+
 # ============================================================
-# TABS (4 tabs)
+# VIEWS
 # ============================================================
-tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs([
-    "The Big Picture",
-    "Precinct Intel",
-    "Where to Win",
-    "Voting Patterns",
-    "Data Explorer",
-    "Demographics",
-    "Campaign Finance",
-    "2026 Prep",
-    "Voter File",
-])
+# Each former tab is a render function; only the view picked in the
+# sidebar runs on a rerun (st.tabs ran all nine bodies every time).
+# The dispatch is at the bottom of the file.
 
 # ============================================================
 # TAB 1: THE BIG PICTURE
 # ============================================================
-with tab1:
+def _render_big_picture():
     st.header("The Big Picture")
 
     # --- Headline KPIs with deltas ---
-    report = generate_summary_report()
-    kpis = get_headline_kpis()
+    report = _fetch_summary_report(_data_version())
+    kpis = _fetch_headline_kpis(_data_version())
 
     if kpis:
         col1, col2, col3, col4, col5, col6 = st.columns(6)
@@ -180,7 +941,7 @@ with tab1:
     # --- Top 3 Strategic Opportunities ---
     st.divider()
     st.subheader("Top 3 Strategic Opportunities")
-    opps = get_top_opportunities()
+    opps = _fetch_top_opportunities(_data_version())
     if opps:
         opp_cols = st.columns(len(opps))
         for i, opp in enumerate(opps):
@@ -196,35 +957,34 @@ with tab1:
     st.subheader("Blue Shift Trends")
     st.markdown("*Tracking the blue shift in Boone County*")
 
-    vote_shares = get_dem_vote_share_by_election()
-
-    if not vote_shares.empty:
-        avg_by_election = vote_shares.groupby("election_date").agg({
-            "dem_share": "mean",
-            "rep_share": "mean",
-            "margin": "mean"
-        }).reset_index()
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=avg_by_election["election_date"],
-            y=avg_by_election["dem_share"],
-            name="Democratic %",
-            line=dict(color="blue", width=3),
-            mode="lines+markers"
-        ))
-        fig.add_trace(go.Scatter(
-            x=avg_by_election["election_date"],
-            y=avg_by_election["rep_share"],
-            name="Republican %",
-            line=dict(color="red", width=3),
-            mode="lines+markers"
-        ))
-        fig.update_layout(
-            title="Average Vote Share Across All Races",
-            yaxis_title="Vote Share %",
-            xaxis_title="Election Date",
-            hovermode="x unified"
+    avg_by_election = _fetch_avg_vote_share(_data_version())
+
+    if not avg_by_election.empty:
+        # One Figure(data=[...]) call validates both traces in a single pass
+        x = avg_by_election["election_date"].to_numpy()
+        fig = go.Figure(
+            data=[
+                go.Scatter(
+                    x=x,
+                    y=avg_by_election["dem_share"].to_numpy(dtype=np.float32),
+                    name="Democratic %",
+                    line=dict(color="blue", width=3),
+                    mode="lines+markers"
+                ),
+                go.Scatter(
+                    x=x,
+                    y=avg_by_election["rep_share"].to_numpy(dtype=np.float32),
+                    name="Republican %",
+                    line=dict(color="red", width=3),
+                    mode="lines+markers"
+                ),
+            ],
+            layout=dict(
+                title="Average Vote Share Across All Races",
+                yaxis_title="Vote Share %",
+                xaxis_title="Election Date",
+                hovermode="x unified"
+            ),
         )
         st.plotly_chart(fig, use_container_width=True)
 
@@ -233,14 +993,15 @@ with tab1:
             x="election_date",
             y="margin",
             color="margin",
-            color_continuous_scale=["red", "white", "blue"],
+            color_continuous_scale=MARGIN_SCALE,
             color_continuous_midpoint=0,
+            hover_data={"margin": ":.2f"},
             title="D-R Margin Over Time (positive = Democratic advantage)"
         )
         st.plotly_chart(fig2, use_container_width=True)
 
         with st.expander("View raw vote share data"):
-            st.dataframe(vote_shares)
+            _lazy_table(lambda: _fetch_vote_shares(_data_version()), key="load_vote_share_raw")
     else:
         st.info("No vote share data available yet.")
 
@@ -248,303 +1009,452 @@ with tab1:
 # ============================================================
 # TAB 2: PRECINCT INTEL
 # ============================================================
-with tab2:
-    st.header("Precinct Intel")
-    st.markdown("*Deep dive into every precinct's political DNA*")
+# Each section is a fragment: moving one of its own widgets reruns only
+# that section instead of the whole page.
+
+# --- Typology ---
+@st.fragment
+def _typology_section():
+    st.subheader("Precinct Targeting Typology")
+    st.markdown("*Classifies each precinct for strategic resource allocation*")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        typ_recent = st.slider("Recent elections to consider", 3, 15, 8, key="typ_recent")
+    with col2:
+        typ_top_pct = st.slider("Top tier percentile", 60, 90, 75, key="typ_top_pct",
+                                help="Precincts above this percentile of D share = 'Best D'")
+    with col3:
+        typ_trend = st.slider("Trend sensitivity (pp/election)", 0.5, 5.0, 1.0, step=0.5, key="typ_trend")
+
+    typology, cat_counts, by_share = _fetch_typology(typ_recent, typ_top_pct, typ_trend, _data_version())
+
+    if not typology.empty:
+        col_left, col_right = st.columns([1, 2])
+
+        with col_left:
+            st.plotly_chart(_build_typology_pie(cat_counts), use_container_width=True)
+
+        with col_right:
+            st.plotly_chart(
+                _build_typology_bar(_limit_precincts(by_share, "avg_d_share", key="typ_show")),
+                use_container_width=True,
+            )
 
-    intel_section = st.radio(
-        "Section",
-        ["Typology", "Heatmap", "Shift Comparison", "Volatility Index", "PVI", "Growth Analysis"],
-        horizontal=True,
-        key="intel_section"
-    )
+        top_t = typology.attrs.get("top_threshold", "N/A")
+        mid_t = typology.attrs.get("mid_threshold", "N/A")
+        st.caption(f"Thresholds (from data): Best D \u2265 {top_t}% D share | "
+                   f"Competitive/Trending D \u2265 {mid_t}% | Below = Lean R / Strong R")
 
-    # --- Typology ---
-    if intel_section == "Typology":
-        st.subheader("Precinct Targeting Typology")
-        st.markdown("*Classifies each precinct for strategic resource allocation*")
+        with st.expander("View typology data"):
+            _lazy_table(typology, key="load_typology_raw", hide_index=True)
+    else:
+        st.info("No precinct data available for typology analysis.")
+
+
+# --- Heatmap ---
+@st.fragment
+def _heatmap_section():
+    st.subheader("Precinct Heatmap Over Time")
+    st.markdown("*D margin by precinct across every election (blue = D advantage, red = R advantage)*")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        heatmap_min_elections = st.slider("Min elections for a precinct to appear", 1, 15, 3, key="hm_min")
+    with col2:
+        heatmap_sort = st.radio("Sort precincts by", ["Avg D margin", "Latest D margin", "Alphabetical"], key="hm_sort")
+
+    heatmap = _fetch_heatmap(heatmap_min_elections, _data_version())
+
+    if not heatmap.empty:
+        # Reorder rows by position; NaN margins sort last as before
+        if heatmap_sort == "Latest D margin":
+            latest = heatmap.iloc[:, -1].to_numpy(dtype=np.float64)
+            heatmap = heatmap.iloc[np.argsort(-latest, kind="stable")]
+        elif heatmap_sort == "Alphabetical":
+            heatmap = heatmap.iloc[heatmap.index.argsort()]
+
+        st.plotly_chart(_build_heatmap(heatmap), use_container_width=True)
+
+        with st.expander("View heatmap data"):
+            # Formatted by the browser; a Styler would format every cell in Python
+            margin_format = st.column_config.NumberColumn(format="%.1f")
+            _lazy_table(heatmap, key="load_heatmap_raw",
+                        column_config={col: margin_format for col in heatmap.columns})
+    else:
+        st.info("No data available for heatmap.")
 
-        col1, col2, col3 = st.columns(3)
+
+# --- Shift Comparison ---
+@st.fragment
+def _shift_section():
+    st.subheader("Precinct-Level Shift Analysis")
+    st.markdown("*Compare Democratic performance between two elections*")
+
+    if len(elections) >= 2:
+        col1, col2 = st.columns(2)
         with col1:
-            typ_recent = st.slider("Recent elections to consider", 3, 15, 8, key="typ_recent")
+            date1 = st.selectbox("Earlier election", election_dates, index=0, key="shift_date1")
         with col2:
-            typ_top_pct = st.slider("Top tier percentile", 60, 90, 75, key="typ_top_pct",
-                                    help="Precincts above this percentile of D share = 'Best D'")
-        with col3:
-            typ_trend = st.slider("Trend sensitivity (pp/election)", 0.5, 5.0, 1.0, step=0.5, key="typ_trend")
+            date2 = st.selectbox("Later election", election_dates,
+                                index=min(1, len(elections)-1), key="shift_date2")
+
+        if date1 != date2:
+            shifts = get_precinct_shift(date1, date2)
+            if not shifts.empty:
+                st.plotly_chart(_build_shift_bar(shifts, date1, date2), use_container_width=True)
+
+                with st.expander("View shift data"):
+                    _lazy_table(shifts, key="load_shift_raw")
+    else:
+        st.info("Need at least 2 elections to compare precinct shifts.")
 
-        typology = get_precinct_typology(
-            recent_elections=typ_recent,
-            top_pctile=typ_top_pct,
-            trend_threshold=typ_trend,
+
+# --- Volatility Index (NEW) ---
+@st.fragment
+def _volatility_section():
+    st.subheader("Precinct Volatility Index")
+    st.markdown("*Measures average election-to-election D share swing per precinct. "
+                 "High volatility = persuadable voters who change behavior.*")
+
+    vol_min_elections = st.slider("Min elections", 3, 15, 4, key="vol_min")
+    volatility_df = get_precinct_volatility(min_elections=vol_min_elections)
+
+    if not volatility_df.empty:
+        st.plotly_chart(
+            _build_volatility_bar(_limit_precincts(volatility_df, "volatility", key="vol_show")),
+            use_container_width=True,
         )
 
-        if not typology.empty:
-            col_left, col_right = st.columns([1, 2])
-
-            with col_left:
-                cat_counts = typology["category"].value_counts().reset_index()
-                cat_counts.columns = ["category", "count"]
-                fig_pie = px.pie(
-                    cat_counts,
-                    values="count",
-                    names="category",
-                    color="category",
-                    color_discrete_map=CATEGORY_COLORS,
-                    hole=0.4,
-                    title="Precinct Distribution",
-                )
-                fig_pie.update_layout(height=400)
-                st.plotly_chart(fig_pie, use_container_width=True)
-
-            with col_right:
-                fig_bar = px.bar(
-                    typology.sort_values("avg_d_share"),
-                    x="avg_d_share",
-                    y="precinct",
-                    color="category",
-                    color_discrete_map=CATEGORY_COLORS,
-                    orientation="h",
-                    title="Precincts by Avg Democratic Vote Share",
-                    hover_data=["d_trend", "latest_d_share", "elections_counted"],
-                )
-                fig_bar.add_vline(x=50, line_dash="dash", line_color="gray", opacity=0.5)
-                fig_bar.update_layout(height=max(500, len(typology) * 16))
-                st.plotly_chart(fig_bar, use_container_width=True)
+        # Context: scatter of volatility vs D share
+        st.plotly_chart(_build_volatility_scatter(volatility_df), use_container_width=True)
 
-            top_t = typology.attrs.get("top_threshold", "N/A")
-            mid_t = typology.attrs.get("mid_threshold", "N/A")
-            st.caption(f"Thresholds (from data): Best D \u2265 {top_t}% D share | "
-                       f"Competitive/Trending D \u2265 {mid_t}% | Below = Lean R / Strong R")
+        with st.expander("View volatility data"):
+            _lazy_table(volatility_df, key="load_volatility_raw", hide_index=True)
+    else:
+        st.info("No data available for volatility analysis.")
 
-            with st.expander("View typology data"):
-                st.dataframe(typology, hide_index=True)
-        else:
-            st.info("No precinct data available for typology analysis.")
 
-    # --- Heatmap ---
-    elif intel_section == "Heatmap":
-        st.subheader("Precinct Heatmap Over Time")
-        st.markdown("*D margin by precinct across every election (blue = D advantage, red = R advantage)*")
+# --- PVI (NEW) ---
+@st.fragment
+def _pvi_section():
+    st.subheader("Precinct Partisan Voting Index")
+    st.markdown("*Local Cook PVI: each precinct compared to the county average "
+                 "using presidential races only. Positive = more D than county, negative = more R.*")
 
-        col1, col2 = st.columns(2)
-        with col1:
-            heatmap_min_elections = st.slider("Min elections for a precinct to appear", 1, 15, 3, key="hm_min")
-        with col2:
-            heatmap_sort = st.radio("Sort precincts by", ["Avg D margin", "Latest D margin", "Alphabetical"], key="hm_sort")
-
-        heatmap = get_precinct_heatmap_data(min_elections=heatmap_min_elections)
-
-        if not heatmap.empty:
-            if heatmap_sort == "Latest D margin":
-                last_col = heatmap.columns[-1]
-                heatmap = heatmap.sort_values(last_col, ascending=False)
-            elif heatmap_sort == "Alphabetical":
-                heatmap = heatmap.sort_index(ascending=True)
-
-            fig = px.imshow(
-                heatmap,
-                color_continuous_scale=["#922b21", "#e74c3c", "#f5b7b1", "white", "#aed6f1", "#3498db", "#1a5276"],
-                color_continuous_midpoint=0,
-                zmin=-60,
-                zmax=60,
-                title="D Margin by Precinct and Election",
-                labels=dict(x="Election Date", y="Precinct", color="D Margin %"),
-                aspect="auto",
-            )
-            fig.update_layout(
-                height=max(600, len(heatmap) * 16),
-                xaxis=dict(tickangle=45),
-            )
-            st.plotly_chart(fig, use_container_width=True)
+    pvi_df = get_precinct_pvi()
 
-            with st.expander("View heatmap data"):
-                st.dataframe(heatmap.style.format(precision=1, na_rep="-"))
-        else:
-            st.info("No data available for heatmap.")
+    if not pvi_df.empty:
+        st.plotly_chart(
+            _build_pvi_bar(_limit_precincts(pvi_df, "pvi", key="pvi_show")),
+            use_container_width=True,
+        )
 
-    # --- Shift Comparison ---
-    elif intel_section == "Shift Comparison":
-        st.subheader("Precinct-Level Shift Analysis")
-        st.markdown("*Compare Democratic performance between two elections*")
+        # Summary stats
+        col1, col2, col3 = st.columns(3)
+        d_lean = len(pvi_df[pvi_df["pvi"] > 0])
+        r_lean = len(pvi_df[pvi_df["pvi"] < 0])
+        col1.metric("D-Leaning Precincts", d_lean)
+        col2.metric("R-Leaning Precincts", r_lean)
+        col3.metric("Presidential Elections Used", pvi_df["elections_counted"].max())
+
+        with st.expander("View PVI data"):
+            _lazy_table(pvi_df, key="load_pvi_raw", hide_index=True)
+    else:
+        st.info("No presidential race data available for PVI calculation.")
 
-        if len(elections) >= 2:
-            col1, col2 = st.columns(2)
-            with col1:
-                date1 = st.selectbox("Earlier election", elections["election_date"].tolist(), index=0, key="shift_date1")
-            with col2:
-                date2 = st.selectbox("Later election", elections["election_date"].tolist(),
-                                    index=min(1, len(elections)-1), key="shift_date2")
-
-            if date1 != date2:
-                shifts = get_precinct_shift(date1, date2)
-                if not shifts.empty:
-                    fig = px.bar(
-                        shifts.sort_values("shift"),
-                        x="shift",
-                        y="precinct",
-                        orientation="h",
-                        color="shift",
-                        color_continuous_scale=["red", "white", "blue"],
-                        color_continuous_midpoint=0,
-                        title=f"Precinct Shift: {date1} \u2192 {date2}"
-                    )
-                    fig.update_layout(height=max(400, len(shifts) * 15))
-                    st.plotly_chart(fig, use_container_width=True)
 
-                    with st.expander("View shift data"):
-                        st.dataframe(shifts)
-        else:
-            st.info("Need at least 2 elections to compare precinct shifts.")
+# --- Growth Analysis (NEW) ---
+@st.fragment
+def _growth_section():
+    st.subheader("Surge Voter / Growth Analysis")
+    st.markdown("*Tracks registration growth vs. D share change over time. "
+                 "'Growing + Bluing' precincts are long-term strategic investments.*")
 
-    # --- Volatility Index (NEW) ---
-    elif intel_section == "Volatility Index":
-        st.subheader("Precinct Volatility Index")
-        st.markdown("*Measures average election-to-election D share swing per precinct. "
-                     "High volatility = persuadable voters who change behavior.*")
+    surge_df = get_surge_voter_analysis()
 
-        vol_min_elections = st.slider("Min elections", 3, 15, 4, key="vol_min")
-        volatility_df = get_precinct_volatility(min_elections=vol_min_elections)
+    if not surge_df.empty:
+        med_growth = surge_df["_med_growth"].iloc[0]
+        med_d = surge_df["_med_d_change"].iloc[0]
 
-        if not volatility_df.empty:
-            fig = px.bar(
-                volatility_df.sort_values("volatility", ascending=True),
-                x="volatility",
-                y="precinct",
-                orientation="h",
-                color="volatility",
-                color_continuous_scale=["#2ecc71", "#f39c12", "#e74c3c"],
-                title="Precinct Volatility Index (pp swing per election)",
-                hover_data=["max_swing", "avg_d_share", "latest_d_share"],
-            )
-            fig.update_layout(height=max(500, len(volatility_df) * 16))
-            st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_build_surge_scatter(surge_df, med_growth, med_d), use_container_width=True)
 
-            # Context: scatter of volatility vs D share
-            fig2 = px.scatter(
-                volatility_df,
-                x="avg_d_share",
-                y="volatility",
-                text="precinct",
-                color="volatility",
-                color_continuous_scale=["#2ecc71", "#f39c12", "#e74c3c"],
-                title="Volatility vs. Avg D Share (top-right = high value persuasion targets)",
-                hover_data=["latest_d_share", "max_swing"],
-            )
-            fig2.update_traces(textposition="top center", textfont_size=7)
-            fig2.update_layout(
-                xaxis_title="Avg D Vote Share %",
-                yaxis_title="Volatility (pp swing/election)",
-                height=500,
+        # Quadrant summary
+        quad_counts = (
+            surge_df.groupby("quadrant", observed=True, sort=False).size().sort_values(ascending=False)
+        )
+        cols = st.columns(4)
+        for i, (quad, count) in enumerate(quad_counts.items()):
+            cols[i % 4].metric(quad, count)
+
+        # Growing + Bluing detail table
+        growing_blue = surge_df[surge_df["quadrant"] == "Growing + Bluing"].sort_values(
+            "reg_growth_pct", ascending=False
+        )
+        if not growing_blue.empty:
+            st.subheader(f"Growing + Bluing Precincts ({len(growing_blue)})")
+            st.caption("These precincts are both gaining residents AND trending more Democratic.")
+            st.dataframe(
+                growing_blue[["precinct", "reg_growth_pct", "d_share_change",
+                              "earliest_registered", "latest_registered"]],
+                hide_index=True,
             )
-            st.plotly_chart(fig2, use_container_width=True)
 
-            with st.expander("View volatility data"):
-                st.dataframe(volatility_df, hide_index=True)
-        else:
-            st.info("No data available for volatility analysis.")
+        with st.expander("View all growth data"):
+            _lazy_table(surge_df, key="load_growth_raw", hide_index=True)
+    else:
+        st.info("No turnout/registration data available for growth analysis.")
+
+
+def _render_precinct_intel():
+    st.header("Precinct Intel")
+    st.markdown("*Deep dive into every precinct's political DNA*")
+
+    intel_section = st.radio(
+        "Section",
+        ["Typology", "Heatmap", "Shift Comparison", "Volatility Index", "PVI", "Growth Analysis"],
+        horizontal=True,
+        key="intel_section"
+    )
 
-    # --- PVI (NEW) ---
+    if intel_section == "Typology":
+        _typology_section()
+    elif intel_section == "Heatmap":
+        _heatmap_section()
+    elif intel_section == "Shift Comparison":
+        _shift_section()
+    elif intel_section == "Volatility Index":
+        _volatility_section()
     elif intel_section == "PVI":
-        st.subheader("Precinct Partisan Voting Index")
-        st.markdown("*Local Cook PVI: each precinct compared to the county average "
-                     "using presidential races only. Positive = more D than county, negative = more R.*")
+        _pvi_section()
+    elif intel_section == "Growth Analysis":
+        _growth_section()
 
-        pvi_df = get_precinct_pvi()
 
-        if not pvi_df.empty:
-            fig = px.bar(
-                pvi_df.sort_values("pvi"),
-                x="pvi",
-                y="precinct",
-                orientation="h",
-                color="pvi",
-                color_continuous_scale=["#922b21", "#e74c3c", "white", "#3498db", "#1a5276"],
-                color_continuous_midpoint=0,
-                title="Precinct PVI (positive = more D than county avg)",
-                hover_data=["pvi_label", "avg_d_share", "elections_counted"],
+# ============================================================
+# TAB 3: WHERE TO WIN
+# ============================================================
+# Sections are fragments, as in Precinct Intel.
+
+# --- Turnout Opportunities (existing) ---
+@st.fragment
+def _turnout_section():
+    st.subheader("Turnout Opportunity Analysis")
+    st.markdown("*Find precincts where low turnout + high D share = mobilization goldmine*")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        turnout_election = st.selectbox(
+            "Election",
+            ["All elections (average)", *election_dates],
+            key="turnout_election"
+        )
+    with col2:
+        turnout_cap = st.slider("Turnout cap (%)", 80, 120, 100, key="turnout_cap",
+                                help="Exclude outlier turnout records above this threshold")
+
+    election_filter = None if turnout_election == "All elections (average)" else turnout_election
+
+    turnout_dem = _fetch_turnout_vs_dem_share(election_filter, float(turnout_cap), _data_version())
+
+    if not turnout_dem.empty:
+        med_turnout = turnout_dem["_med_turnout"].iloc[0]
+        med_d_share = turnout_dem["_med_d_share"].iloc[0]
+
+        fig = px.scatter(
+            turnout_dem,
+            x="avg_turnout",
+            y="avg_d_share",
+            color="quadrant",
+            color_discrete_map=QUADRANT_COLORS,
+            size="avg_registered",
+            hover_data={"precinct": True, "potential_votes_gained": ":.1f"},
+            title="Turnout vs. Dem Vote Share by Precinct",
+        )
+        fig.add_hline(y=med_d_share, line_dash="dash", line_color="gray", opacity=0.5,
+                      annotation_text=f"Median D Share: {med_d_share:.1f}%")
+        fig.add_vline(x=med_turnout, line_dash="dash", line_color="gray", opacity=0.5,
+                      annotation_text=f"Median Turnout: {med_turnout:.1f}%")
+        fig.update_layout(
+            xaxis_title="Avg Turnout %",
+            yaxis_title="Avg D Vote Share %",
+            height=600,
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+        gold = turnout_dem.loc[turnout_dem["quadrant"].to_numpy() == "Mobilization Goldmine"]
+        if not gold.empty:
+            st.subheader(f"Mobilization Goldmine Precincts ({len(gold)})")
+            st.caption("These precincts have above-median D vote share but below-median turnout. "
+                       "Potential votes gained estimates additional D votes from raising turnout to the median.")
+            # Only the biggest opportunities are ranked unless the user asks for all
+            show = PRECINCT_PAGE
+            if len(gold) > PRECINCT_PAGE and st.checkbox(f"Show all {len(gold)}", key="goldmine_all"):
+                show = len(gold)
+            goldmines = gold.nlargest(show, "potential_votes_gained")
+            st.dataframe(
+                goldmines[["precinct", "avg_turnout", "avg_d_share", "avg_registered", "potential_votes_gained"]],
+                hide_index=True,
             )
-            fig.add_vline(x=0, line_dash="dash", line_color="gray", opacity=0.5,
-                          annotation_text="County Average")
-            fig.update_layout(height=max(500, len(pvi_df) * 16))
-            st.plotly_chart(fig, use_container_width=True)
 
-            # Summary stats
-            col1, col2, col3 = st.columns(3)
-            d_lean = len(pvi_df[pvi_df["pvi"] > 0])
-            r_lean = len(pvi_df[pvi_df["pvi"] < 0])
-            col1.metric("D-Leaning Precincts", d_lean)
-            col2.metric("R-Leaning Precincts", r_lean)
-            col3.metric("Presidential Elections Used", pvi_df["elections_counted"].max())
-
-            with st.expander("View PVI data"):
-                st.dataframe(pvi_df, hide_index=True)
-        else:
-            st.info("No presidential race data available for PVI calculation.")
+        with st.expander("View all precinct data"):
+            _lazy_table(turnout_dem, key="load_turnout_raw", hide_index=True)
 
-    # --- Growth Analysis (NEW) ---
-    elif intel_section == "Growth Analysis":
-        st.subheader("Surge Voter / Growth Analysis")
-        st.markdown("*Tracks registration growth vs. D share change over time. "
-                     "'Growing + Bluing' precincts are long-term strategic investments.*")
-
-        surge_df = get_surge_voter_analysis()
-
-        if not surge_df.empty:
-            med_growth = surge_df.attrs.get("median_growth", surge_df["reg_growth_pct"].median())
-            med_d = surge_df.attrs.get("median_d_change", surge_df["d_share_change"].median())
-
-            fig = px.scatter(
-                surge_df,
-                x="reg_growth_pct",
-                y="d_share_change",
-                color="quadrant",
-                color_discrete_map=SURGE_COLORS,
-                hover_data=["precinct", "earliest_registered", "latest_registered"],
-                title="Registration Growth vs. D Share Change by Precinct",
-                text="precinct",
-            )
-            fig.add_hline(y=med_d, line_dash="dash", line_color="gray", opacity=0.5,
-                          annotation_text=f"Median D change: {med_d:.1f} pp")
-            fig.add_vline(x=med_growth, line_dash="dash", line_color="gray", opacity=0.5,
-                          annotation_text=f"Median growth: {med_growth:.0f}%")
-            fig.update_traces(textposition="top center", textfont_size=7)
-            fig.update_layout(
-                xaxis_title="Registration Growth %",
-                yaxis_title="D Share Change (pp)",
-                height=600,
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        st.caption("Turnout records exceeding the cap have been excluded as data quality outliers.")
+    else:
+        st.info("No turnout + vote share data available.")
 
-            # Quadrant summary
-            quad_counts = surge_df["quadrant"].value_counts()
-            cols = st.columns(4)
-            for i, (quad, count) in enumerate(quad_counts.items()):
-                cols[i % 4].metric(quad, count)
 
-            # Growing + Bluing detail table
-            growing_blue = surge_df[surge_df["quadrant"] == "Growing + Bluing"].sort_values(
-                "reg_growth_pct", ascending=False
-            )
-            if not growing_blue.empty:
-                st.subheader(f"Growing + Bluing Precincts ({len(growing_blue)})")
-                st.caption("These precincts are both gaining residents AND trending more Democratic.")
-                st.dataframe(
-                    growing_blue[["precinct", "reg_growth_pct", "d_share_change",
-                                  "earliest_registered", "latest_registered"]],
-                    hide_index=True,
-                )
+# --- Competitive Races (existing) ---
+@st.fragment
+def _competitive_section():
+    st.subheader("Competitive Races")
+    margin_threshold = st.slider("Max margin (percentage points)", 5, 30, 15, key="comp_margin")
+
+    competitive = get_competitive_races(min_margin=margin_threshold)
+    if not competitive.empty:
+        st.plotly_chart(_build_competitive_scatter(competitive, margin_threshold), use_container_width=True)
+
+        st.dataframe(competitive)
+    else:
+        st.info("No competitive races found with current threshold.")
+
+
+# --- Uncontested Mapping (NEW) ---
+@st.fragment
+def _uncontested_section():
+    st.subheader("Uncontested Race Mapping")
+    st.markdown("*Races where only one major party fielded a candidate. "
+                 "Every uncontested R seat is a missed D opportunity.*")
+
+    summary_df, detail_df = get_uncontested_race_mapping()
+
+    if not summary_df.empty:
+        # Stacked bar: contested vs uncontested by year
+        status_cols = [c for c in summary_df.columns if c != "election_date"]
+        melt = summary_df.melt(
+            id_vars="election_date",
+            value_vars=status_cols,
+            var_name="status",
+            value_name="count"
+        )
+        fig = px.bar(
+            melt,
+            x="election_date",
+            y="count",
+            color="status",
+            barmode="stack",
+            color_discrete_map=CONTEST_COLORS,
+            title="Contested vs Uncontested Races by Election (General Elections Only)",
+        )
+        fig.update_layout(yaxis_title="Number of Races", xaxis_title="Election")
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Summary metrics
+        if "Uncontested R" in summary_df.columns:
+            total_unc_r = int(summary_df["Uncontested R"].sum())
+            latest_unc_r = int(summary_df.iloc[-1].get("Uncontested R", 0)) if len(summary_df) > 0 else 0
+            col1, col2 = st.columns(2)
+            col1.metric("Total Uncontested R Seats (All Years)", total_unc_r)
+            col2.metric("Uncontested R in Latest Election", latest_unc_r)
+
+    if not detail_df.empty and "estimated_latent_d_votes" in detail_df.columns:
+        st.subheader("Uncontested R Seats - Candidate Recruitment Targets")
+        st.caption("Latent D support estimated from D performance in contested "
+                   "races at the same level in the same election.")
+        display_cols = ["race_name", "race_level", "election_date",
+                       "total_votes", "baseline_d_share", "estimated_latent_d_votes"]
+        available = [c for c in display_cols if c in detail_df.columns]
+        st.dataframe(
+            detail_df[available].head(20),
+            hide_index=True,
+        )
+    elif summary_df.empty:
+        st.info("No uncontested race data available.")
+
+
+# --- Third-Party Persuadability (NEW) ---
+@st.fragment
+def _third_party_section():
+    st.subheader("Third-Party Persuadability")
+    st.markdown("*Precincts where L/I vote share is significant. "
+                 "'Flippable' = elections where third-party votes exceeded the D-R margin.*")
+
+    agg_df, detail_df = get_third_party_persuadability()
+
+    if not agg_df.empty:
+        chart_df = _limit_precincts(agg_df, "avg_third_party_pct", key="tp_show", per_row=14)
+        fig = px.bar(
+            chart_df.sort_values("avg_third_party_pct", ascending=True),
+            x="avg_third_party_pct",
+            y="precinct",
+            orientation="h",
+            color="avg_third_party_pct",
+            color_continuous_scale=THIRD_PARTY_SCALE,
+            title="Average Third-Party Vote Share by Precinct (General Elections)",
+            hover_data={"avg_third_party_pct": ":.2f", "avg_margin": ":.2f",
+                        "flippable_elections": True, "total_elections": True},
+        )
+        fig.update_layout(height=_chart_height(len(chart_df), per_row=14))
+        st.plotly_chart(fig, use_container_width=True)
 
-            with st.expander("View all growth data"):
-                st.dataframe(surge_df, hide_index=True)
+        # Flippable precincts highlight
+        flippable = agg_df[agg_df["flippable_elections"] > 0].sort_values(
+            "flippable_elections", ascending=False
+        )
+        if not flippable.empty:
+            st.subheader(f"Flippable Precincts ({len(flippable)})")
+            st.caption("Precincts where third-party vote exceeded D-R margin in at least one election. "
+                       "If these voters had chosen D, the result flips.")
+            st.dataframe(flippable, hide_index=True)
         else:
-            st.info("No turnout/registration data available for growth analysis.")
+            st.info("No flippable precincts found (third-party vote never exceeded D-R margin).")
+
+        with st.expander("View per-election detail"):
+            st.dataframe(detail_df, hide_index=True)
+    else:
+        st.info("No third-party voting data available.")
+
+
+# --- Rolloff Analysis (NEW) ---
+@st.fragment
+def _rolloff_section():
+    st.subheader("Ballot Rolloff Analysis")
+    st.markdown("*Rolloff = voters who cast a ballot but skip a downballot race. "
+                 "High rolloff in D-leaning precincts = cheapest marginal votes (they're already at the polls).*")
+
+    avg_df, heatmap_df = get_rolloff_analysis()
+
+    if not heatmap_df.empty:
+        st.plotly_chart(_build_rolloff_heatmap(heatmap_df), use_container_width=True)
+
+        # Top rolloff precincts
+        if not avg_df.empty:
+            # Per-precinct mean as two bincounts over the factorized precincts
+            codes, precincts = pd.factorize(avg_df["precinct"], sort=True)
+            rolloff = avg_df["avg_rolloff"].to_numpy(dtype=np.float64)
+            valid = (codes >= 0) & ~np.isnan(rolloff)
+            sums = np.bincount(codes[valid], weights=rolloff[valid], minlength=len(precincts))
+            counts = np.bincount(codes[valid], minlength=len(precincts))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means = sums / counts
+            overall_avg = pd.DataFrame({
+                "precinct": np.asarray(precincts),
+                "overall_avg_rolloff": means,
+            }).sort_values("overall_avg_rolloff", ascending=False)
+
+            st.subheader("Highest Average Rolloff Precincts")
+            st.caption("These precincts consistently have voters who skip downballot races. "
+                       "Voter education can capture these 'free' votes.")
+            st.dataframe(overall_avg.head(15), hide_index=True)
+
+        with st.expander("View full rolloff data"):
+            st.dataframe(avg_df, hide_index=True)
+    else:
+        st.info("No rolloff data available.")
 
 
-# ============================================================
-# TAB 3: WHERE TO WIN
-# ============================================================
-with tab3:
+def _render_where_to_win():
     st.header("Where to Win")
     st.markdown("*Identify concrete opportunities for Democratic gains*")
 
@@ -556,233 +1466,176 @@ with tab3:
         key="win_section"
     )
 
-    # --- Turnout Opportunities (existing) ---
     if win_section == "Turnout Opportunities":
-        st.subheader("Turnout Opportunity Analysis")
-        st.markdown("*Find precincts where low turnout + high D share = mobilization goldmine*")
+        _turnout_section()
+    elif win_section == "Competitive Races":
+        _competitive_section()
+    elif win_section == "Uncontested Mapping":
+        _uncontested_section()
+    elif win_section == "Third-Party Persuadability":
+        _third_party_section()
+    elif win_section == "Rolloff Analysis":
+        _rolloff_section()
 
-        col1, col2 = st.columns(2)
-        with col1:
-            turnout_election = st.selectbox(
-                "Election",
-                ["All elections (average)"] + elections["election_date"].tolist(),
-                key="turnout_election"
-            )
-        with col2:
-            turnout_cap = st.slider("Turnout cap (%)", 80, 120, 100, key="turnout_cap",
-                                    help="Exclude outlier turnout records above this threshold")
 
-        election_filter = None if turnout_election == "All elections (average)" else turnout_election
+# ============================================================
+# TAB 4: VOTING PATTERNS
+# ============================================================
+# Sections are fragments, as in Precinct Intel.
+
+# --- Downballot Drop-off (existing) ---
+@st.fragment
+def _downballot_section():
+    st.subheader("Downballot Drop-off Analysis")
+    st.markdown("*Where does Dem support erode going from federal to local races?*")
+
+    st.info("Race-level labels (federal/state/county/local) are only available for 2016+ general elections. "
+            "Earlier elections have all races categorized as 'other'.")
 
-        turnout_dem = get_turnout_vs_dem_share(
-            election_date=election_filter,
-            turnout_cap=float(turnout_cap),
+    general_dates = _fetch_general_election_dates(_data_version())
+
+    if general_dates:
+        db_elections = st.multiselect(
+            "Elections",
+            general_dates,
+            placeholder="All 2016+ general elections",
+            key="db_elections"
         )
 
-        if not turnout_dem.empty:
-            med_turnout = turnout_dem.attrs.get("median_turnout", turnout_dem["avg_turnout"].median())
-            med_d_share = turnout_dem.attrs.get("median_d_share", turnout_dem["avg_d_share"].median())
-
-            fig = px.scatter(
-                turnout_dem,
-                x="avg_turnout",
-                y="avg_d_share",
-                color="quadrant",
-                color_discrete_map=QUADRANT_COLORS,
-                size="avg_registered",
-                hover_data=["precinct", "potential_votes_gained"],
-                title="Turnout vs. Dem Vote Share by Precinct",
-            )
-            fig.add_hline(y=med_d_share, line_dash="dash", line_color="gray", opacity=0.5,
-                          annotation_text=f"Median D Share: {med_d_share:.1f}%")
-            fig.add_vline(x=med_turnout, line_dash="dash", line_color="gray", opacity=0.5,
-                          annotation_text=f"Median Turnout: {med_turnout:.1f}%")
-            fig.update_layout(
-                xaxis_title="Avg Turnout %",
-                yaxis_title="Avg D Vote Share %",
-                height=600,
+        detail_df, summary_df = get_downballot_dropoff(election_dates=db_elections)
+
+        if not detail_df.empty:
+            fig = px.bar(
+                detail_df,
+                x="election_date",
+                y="d_share",
+                color="race_level",
+                barmode="group",
+                color_discrete_map=LEVEL_COLORS,
+                title="Dem Vote Share by Race Level",
+                category_orders={"race_level": ["federal", "state", "county", "local"]},
             )
+            fig.update_layout(yaxis_title="D Vote Share %", xaxis_title="Election")
             st.plotly_chart(fig, use_container_width=True)
 
-            goldmines = turnout_dem[turnout_dem["quadrant"] == "Mobilization Goldmine"].sort_values(
-                "potential_votes_gained", ascending=False
+            fig2 = px.line(
+                detail_df,
+                x="race_level",
+                y="d_share",
+                color="election_date",
+                markers=True,
+                title="Dem Performance Drop-off: Federal \u2192 Local",
+                category_orders={"race_level": ["federal", "state", "county", "local"]},
             )
-            if not goldmines.empty:
-                st.subheader(f"Mobilization Goldmine Precincts ({len(goldmines)})")
-                st.caption("These precincts have above-median D vote share but below-median turnout. "
-                           "Potential votes gained estimates additional D votes from raising turnout to the median.")
+            fig2.update_layout(yaxis_title="D Vote Share %", xaxis_title="Race Level")
+            st.plotly_chart(fig2, use_container_width=True)
+
+            if not summary_df.empty:
+                st.subheader("Drop-off from Federal D Share (percentage points lost)")
+                dropoff_cols = [c for c in summary_df.columns if "dropoff" in c]
+                display_cols = ["election_date"] + [c for c in summary_df.columns if "d_share" in c] + dropoff_cols
+                available_cols = [c for c in display_cols if c in summary_df.columns]
                 st.dataframe(
-                    goldmines[["precinct", "avg_turnout", "avg_d_share", "avg_registered", "potential_votes_gained"]],
+                    summary_df[available_cols].style.format(precision=1, na_rep="No D candidate"),
                     hide_index=True,
                 )
 
-            with st.expander("View all precinct data"):
-                st.dataframe(turnout_dem, hide_index=True)
+            st.warning("Missing bars or 'No D candidate' indicates no Democrat ran at that level, "
+                       "not zero vote share.")
 
-            st.caption("Turnout records exceeding the cap have been excluded as data quality outliers.")
+            with st.expander("View detailed data"):
+                st.dataframe(detail_df, hide_index=True)
         else:
-            st.info("No turnout + vote share data available.")
+            st.info("No downballot data available for the selected election.")
+    else:
+        st.info("No general elections from 2016+ found in the database.")
 
-    # --- Competitive Races (existing) ---
-    elif win_section == "Competitive Races":
-        st.subheader("Competitive Races")
-        margin_threshold = st.slider("Max margin (percentage points)", 5, 30, 15, key="comp_margin")
 
-        competitive = get_competitive_races(min_margin=margin_threshold)
-        if not competitive.empty:
-            fig = px.scatter(
-                competitive,
-                x="election_date",
-                y="margin",
-                color="margin",
-                size=competitive["total_votes"].abs(),
-                hover_data=["race_name", "dem_votes", "rep_votes"],
-                color_continuous_scale=["red", "white", "blue"],
-                color_continuous_midpoint=0,
-                title=f"Races Within {margin_threshold} Points"
-            )
-            fig.add_hline(y=0, line_dash="dash", line_color="gray")
-            st.plotly_chart(fig, use_container_width=True)
+# --- Straight-Ticket Trends (existing) ---
+@st.fragment
+def _straight_ticket_section():
+    st.subheader("Straight-Ticket Voting Trends")
+    st.markdown("*Analyzing party loyalty and split-ticket behavior*")
 
-            st.dataframe(competitive)
-        else:
-            st.info("No competitive races found with current threshold.")
+    precinct_detail, trend_summary = get_straight_ticket_analysis()
 
-    # --- Uncontested Mapping (NEW) ---
-    elif win_section == "Uncontested Mapping":
-        st.subheader("Uncontested Race Mapping")
-        st.markdown("*Races where only one major party fielded a candidate. "
-                     "Every uncontested R seat is a missed D opportunity.*")
-
-        summary_df, detail_df = get_uncontested_race_mapping()
-
-        if not summary_df.empty:
-            # Stacked bar: contested vs uncontested by year
-            status_cols = [c for c in summary_df.columns if c != "election_date"]
-            melt = summary_df.melt(
-                id_vars="election_date",
-                value_vars=status_cols,
-                var_name="status",
-                value_name="count"
-            )
-            fig = px.bar(
-                melt,
-                x="election_date",
-                y="count",
-                color="status",
-                barmode="stack",
-                color_discrete_map=CONTEST_COLORS,
-                title="Contested vs Uncontested Races by Election (General Elections Only)",
+    if not trend_summary.empty:
+        # Figures are cached per trend frame; empty trends never build one
+        st.plotly_chart(_build_straight_ticket_bar(trend_summary), use_container_width=True)
+
+        valid_trend = trend_summary[trend_summary["d_straight_pct"].notna()]
+        if not valid_trend.empty:
+            fig2 = _build_straight_ticket_line(
+                valid_trend, "d_straight_pct",
+                "D Share of Straight-Ticket Votes Over Time", "D % of Straight-Ticket Votes",
             )
-            fig.update_layout(yaxis_title="Number of Races", xaxis_title="Election")
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig2, use_container_width=True)
 
-            # Summary metrics
-            if "Uncontested R" in summary_df.columns:
-                total_unc_r = int(summary_df["Uncontested R"].sum())
-                latest_unc_r = int(summary_df.iloc[-1].get("Uncontested R", 0)) if len(summary_df) > 0 else 0
-                col1, col2 = st.columns(2)
-                col1.metric("Total Uncontested R Seats (All Years)", total_unc_r)
-                col2.metric("Uncontested R in Latest Election", latest_unc_r)
-
-        if not detail_df.empty and "estimated_latent_d_votes" in detail_df.columns:
-            st.subheader("Uncontested R Seats - Candidate Recruitment Targets")
-            st.caption("Latent D support estimated from D performance in contested "
-                       "races at the same level in the same election.")
-            display_cols = ["race_name", "race_level", "election_date",
-                           "total_votes", "baseline_d_share", "estimated_latent_d_votes"]
-            available = [c for c in display_cols if c in detail_df.columns]
-            st.dataframe(
-                detail_df[available].head(20),
-                hide_index=True,
+        ballot_trend = trend_summary[trend_summary["straight_pct_of_ballots"].notna()]
+        if not ballot_trend.empty:
+            fig3 = _build_straight_ticket_line(
+                ballot_trend, "straight_pct_of_ballots",
+                "Straight-Ticket Votes as % of Total Ballots", "Straight-Ticket % of Ballots",
             )
-        elif summary_df.empty:
-            st.info("No uncontested race data available.")
+            st.plotly_chart(fig3, use_container_width=True)
 
-    # --- Third-Party Persuadability (NEW) ---
-    elif win_section == "Third-Party Persuadability":
-        st.subheader("Third-Party Persuadability")
-        st.markdown("*Precincts where L/I vote share is significant. "
-                     "'Flippable' = elections where third-party votes exceeded the D-R margin.*")
+        if not precinct_detail.empty:
+            st.subheader("Precinct-Level Straight-Ticket D%")
+            valid_pct = precinct_detail[precinct_detail["d_straight_pct"].notna()]
+            if not valid_pct.empty:
+                st.plotly_chart(_build_straight_ticket_heatmap(valid_pct), use_container_width=True)
 
-        agg_df, detail_df = get_third_party_persuadability()
+        with st.expander("View trend summary data"):
+            st.dataframe(trend_summary, hide_index=True)
 
-        if not agg_df.empty:
-            fig = px.bar(
-                agg_df.sort_values("avg_third_party_pct", ascending=True),
-                x="avg_third_party_pct",
-                y="precinct",
-                orientation="h",
-                color="avg_third_party_pct",
-                color_continuous_scale=["#aed6f1", "#8e44ad"],
-                title="Average Third-Party Vote Share by Precinct (General Elections)",
-                hover_data=["avg_margin", "flippable_elections", "total_elections"],
-            )
-            fig.update_layout(height=max(500, len(agg_df) * 14))
-            st.plotly_chart(fig, use_container_width=True)
+        with st.expander("View precinct detail data"):
+            st.dataframe(precinct_detail, hide_index=True)
+    else:
+        st.info("No straight-ticket voting data available.")
 
-            # Flippable precincts highlight
-            flippable = agg_df[agg_df["flippable_elections"] > 0].sort_values(
-                "flippable_elections", ascending=False
-            )
-            if not flippable.empty:
-                st.subheader(f"Flippable Precincts ({len(flippable)})")
-                st.caption("Precincts where third-party vote exceeded D-R margin in at least one election. "
-                           "If these voters had chosen D, the result flips.")
-                st.dataframe(flippable, hide_index=True)
-            else:
-                st.info("No flippable precincts found (third-party vote never exceeded D-R margin).")
 
-            with st.expander("View per-election detail"):
-                st.dataframe(detail_df, hide_index=True)
-        else:
-            st.info("No third-party voting data available.")
+# --- Straight-Ticket Geography (NEW) ---
+@st.fragment
+def _straight_geo_section():
+    st.subheader("Straight-Ticket Geography")
+    st.markdown("*Straight-ticket D votes as % of total D votes per precinct. "
+                 "High % = party brand carries candidates. Low % = voters choose individual Ds.*")
 
-    # --- Rolloff Analysis (NEW) ---
-    elif win_section == "Rolloff Analysis":
-        st.subheader("Ballot Rolloff Analysis")
-        st.markdown("*Rolloff = voters who cast a ballot but skip a downballot race. "
-                     "High rolloff in D-leaning precincts = cheapest marginal votes (they're already at the polls).*")
-
-        avg_df, heatmap_df = get_rolloff_analysis()
-
-        if not heatmap_df.empty:
-            fig = px.imshow(
-                heatmap_df,
-                color_continuous_scale=["white", "#f39c12", "#e74c3c"],
-                zmin=0,
-                zmax=50,
-                title="Average Rolloff % by Precinct and Election",
-                labels=dict(x="Election Date", y="Precinct", color="Rolloff %"),
-                aspect="auto",
-            )
-            fig.update_layout(
-                height=max(600, len(heatmap_df) * 16),
-                xaxis=dict(tickangle=45),
-            )
-            st.plotly_chart(fig, use_container_width=True)
+    geo_df = get_straight_ticket_geography()
 
-            # Top rolloff precincts
-            if not avg_df.empty:
-                overall_avg = avg_df.groupby("precinct")["avg_rolloff"].mean().reset_index()
-                overall_avg.columns = ["precinct", "overall_avg_rolloff"]
-                overall_avg = overall_avg.sort_values("overall_avg_rolloff", ascending=False)
+    if not geo_df.empty:
+        geo_elections = sorted(geo_df["election_date"].unique())
+        geo_election = st.selectbox(
+            "Election", geo_elections,
+            index=len(geo_elections)-1,
+            key="geo_election"
+        )
+        filtered = geo_df[geo_df["election_date"] == geo_election].sort_values(
+            "straight_d_pct_of_total"
+        )
 
-                st.subheader("Highest Average Rolloff Precincts")
-                st.caption("These precincts consistently have voters who skip downballot races. "
-                           "Voter education can capture these 'free' votes.")
-                st.dataframe(overall_avg.head(15), hide_index=True)
+        if not filtered.empty:
+            st.plotly_chart(_build_geo_bar(filtered, geo_election), use_container_width=True)
 
-            with st.expander("View full rolloff data"):
-                st.dataframe(avg_df, hide_index=True)
-        else:
-            st.info("No rolloff data available.")
+            # Dependency summary
+            dependency = filtered["dependency"].cat
+            codes = dependency.codes.to_numpy()
+            dep_counts = np.bincount(codes[codes >= 0], minlength=len(dependency.categories))
+            cols = st.columns(len(dep_counts))
+            for i, dep in enumerate(dependency.categories):
+                cols[i].metric(dep, int(dep_counts[i]))
 
+            st.caption("Brand-Dependent (\u226540%): Party label does the work. "
+                       "Candidate-Dependent (<20%): Individual candidate appeal matters most. "
+                       "Mixed (20-40%): Both factors contribute.")
 
-# ============================================================
-# TAB 4: VOTING PATTERNS
-# ============================================================
-with tab4:
+        with st.expander("View all geography data"):
+            st.dataframe(geo_df, hide_index=True)
+    else:
+        st.info("No straight-ticket geography data available.")
+
+
+def _render_voting_patterns():
     st.header("Voting Patterns")
     st.markdown("*Understand party loyalty, ticket-splitting, and downballot behavior*")
 
@@ -793,221 +1646,234 @@ with tab4:
         key="pattern_section"
     )
 
-    # --- Downballot Drop-off (existing) ---
     if pattern_section == "Downballot Drop-off":
-        st.subheader("Downballot Drop-off Analysis")
-        st.markdown("*Where does Dem support erode going from federal to local races?*")
+        _downballot_section()
+    elif pattern_section == "Straight-Ticket Trends":
+        _straight_ticket_section()
+    elif pattern_section == "Straight-Ticket Geography":
+        _straight_geo_section()
 
-        st.info("Race-level labels (federal/state/county/local) are only available for 2016+ general elections. "
-                "Earlier elections have all races categorized as 'other'.")
 
-        conn = get_connection()
-        general_elections = pd.read_sql_query(
-            "SELECT DISTINCT election_date, election_name FROM elections "
-            "WHERE election_type = 'general' AND election_date >= '2016-01-01' ORDER BY election_date",
-            conn
+# ============================================================
+# TAB 5: DATA EXPLORER
+# ============================================================
+# Sections are fragments, as in Precinct Intel.
+
+# --- Elections Overview ---
+@st.fragment
+def _elections_overview_section():
+    st.subheader("All Elections")
+
+    overview = get_election_overview()
+
+    if not overview.empty:
+        # Format for display
+        display_df = overview[[
+            "election_date", "election_type", "election_name",
+            "race_count", "result_count", "precinct_count",
+            "turnout_precincts", "confidence_level", "confidence_score"
+        ]].copy()
+        display_df.columns = [
+            "Date", "Type", "Name", "Races", "Results",
+            "Precincts", "Turnout Precincts", "Confidence", "Score"
+        ]
+
+        confidence = display_df["Confidence"].astype(object)
+        display_df["Confidence"] = confidence.str.lower().map(CONFIDENCE_LABELS).fillna(confidence)
+        display_df["Score"] = (display_df["Score"] * 100).round()
+
+        st.dataframe(
+            display_df,
+            use_container_width=True,
+            hide_index=True,
+            height=min(800, 35 * len(display_df) + 38),
+            column_config={
+                "Score": SCORE_COLUMN,
+                "Confidence": st.column_config.TextColumn("Confidence"),
+            },
         )
-        conn.close()
 
-        if not general_elections.empty:
-            db_election = st.selectbox(
-                "Election",
-                ["All 2016+ general elections"] + general_elections["election_date"].tolist(),
-                key="db_election"
-            )
+        # Drill-down: select an election to see its races
+        st.divider()
+        st.subheader("Election Detail")
+        # Options are election ids; labels are only looked up for display
+        election_options = dict(zip(
+            overview["election_id"].astype(int).tolist(),
+            overview["election_date"].astype(str) + " — " + overview["election_name"].astype(str),
+        ))
+        sel_election_id = st.selectbox(
+            "Select election to inspect",
+            list(election_options),
+            format_func=election_options.get,
+            key="explorer_election"
+        )
 
-            election_filter = None if db_election == "All 2016+ general elections" else db_election
-            detail_df, summary_df = get_downballot_dropoff(election_date=election_filter)
-
-            if not detail_df.empty:
-                fig = px.bar(
-                    detail_df,
-                    x="election_date",
-                    y="d_share",
-                    color="race_level",
-                    barmode="group",
-                    color_discrete_map=LEVEL_COLORS,
-                    title="Dem Vote Share by Race Level",
-                    category_orders={"race_level": ["federal", "state", "county", "local"]},
-                )
-                fig.update_layout(yaxis_title="D Vote Share %", xaxis_title="Election")
-                st.plotly_chart(fig, use_container_width=True)
-
-                fig2 = px.line(
-                    detail_df,
-                    x="race_level",
-                    y="d_share",
-                    color="election_date",
-                    markers=True,
-                    title="Dem Performance Drop-off: Federal \u2192 Local",
-                    category_orders={"race_level": ["federal", "state", "county", "local"]},
-                )
-                fig2.update_layout(yaxis_title="D Vote Share %", xaxis_title="Race Level")
-                st.plotly_chart(fig2, use_container_width=True)
-
-                if not summary_df.empty:
-                    st.subheader("Drop-off from Federal D Share (percentage points lost)")
-                    dropoff_cols = [c for c in summary_df.columns if "dropoff" in c]
-                    display_cols = ["election_date"] + [c for c in summary_df.columns if "d_share" in c] + dropoff_cols
-                    available_cols = [c for c in display_cols if c in summary_df.columns]
-                    st.dataframe(
-                        summary_df[available_cols].style.format(precision=1, na_rep="No D candidate"),
-                        hide_index=True,
-                    )
+        if sel_election_id is not None:
+            counts = _fetch_race_counts(sel_election_id, _data_version())
 
-                st.warning("Missing bars or 'No D candidate' indicates no Democrat ran at that level, "
-                           "not zero vote share.")
+            if counts["total"] > 0:
+                changed_count = int(counts["name_changed"])
 
-                with st.expander("View detailed data"):
-                    st.dataframe(detail_df, hide_index=True)
-            else:
-                st.info("No downballot data available for the selected election.")
-        else:
-            st.info("No general elections from 2016+ found in the database.")
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Races", int(counts["total"]))
+                col2.metric("With Normalized Names", changed_count)
+                col3.metric("Race Levels", int(counts["race_levels"]))
 
-    # --- Straight-Ticket Trends (existing) ---
-    elif pattern_section == "Straight-Ticket Trends":
-        st.subheader("Straight-Ticket Voting Trends")
-        st.markdown("*Analyzing party loyalty and split-ticket behavior*")
-
-        precinct_detail, trend_summary = get_straight_ticket_analysis()
-
-        if not trend_summary.empty:
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=trend_summary["election_date"],
-                y=trend_summary["total_d_straight"],
-                name="D Straight Ticket",
-                marker_color="blue",
-            ))
-            fig.add_trace(go.Bar(
-                x=trend_summary["election_date"],
-                y=trend_summary["total_r_straight"],
-                name="R Straight Ticket",
-                marker_color="red",
-            ))
-            fig.update_layout(
-                barmode="group",
-                title="Straight-Ticket Voting Over Time",
-                yaxis_title="Total Straight-Ticket Votes",
-                xaxis_title="Election",
-            )
-            st.plotly_chart(fig, use_container_width=True)
+                def load_races():
+                    races_df = _fetch_election_races(sel_election_id, _data_version())
+                    display_races = races_df[[
+                        "race_name", "normalized_name", "race_level",
+                        "race_type", "total_votes", "candidates", "precincts"
+                    ]].copy()
+                    # Add a visual indicator column for changed names
+                    name_changed = races_df["race_name"].to_numpy() != races_df["normalized_name"].to_numpy()
+                    display_races["Changed"] = np.where(name_changed, "Yes", "")
+                    display_races.columns = [
+                        "Original Name", "Normalized Name", "Level",
+                        "Type", "Total Votes", "Candidates", "Precincts", "Changed"
+                    ]
+                    return display_races
 
-            valid_trend = trend_summary[trend_summary["d_straight_pct"].notna()]
-            if not valid_trend.empty:
-                fig2 = px.line(
-                    valid_trend,
-                    x="election_date",
-                    y="d_straight_pct",
-                    title="D Share of Straight-Ticket Votes Over Time",
-                    markers=True,
-                )
-                fig2.add_hline(y=50, line_dash="dash", line_color="gray", opacity=0.5)
-                fig2.update_layout(yaxis_title="D % of Straight-Ticket Votes")
-                st.plotly_chart(fig2, use_container_width=True)
-
-            ballot_trend = trend_summary[trend_summary["straight_pct_of_ballots"].notna()]
-            if not ballot_trend.empty:
-                fig3 = px.line(
-                    ballot_trend,
-                    x="election_date",
-                    y="straight_pct_of_ballots",
-                    title="Straight-Ticket Votes as % of Total Ballots",
-                    markers=True,
-                )
-                fig3.update_layout(yaxis_title="Straight-Ticket % of Ballots")
-                st.plotly_chart(fig3, use_container_width=True)
-
-            if not precinct_detail.empty:
-                st.subheader("Precinct-Level Straight-Ticket D%")
-                valid_pct = precinct_detail[precinct_detail["d_straight_pct"].notna()]
-                if not valid_pct.empty:
-                    pivot = valid_pct.pivot_table(
-                        index="precinct",
-                        columns="election_date",
-                        values="d_straight_pct",
-                    )
-                    pivot["_avg"] = pivot.mean(axis=1)
-                    pivot = pivot.sort_values("_avg", ascending=False)
-                    pivot = pivot.drop(columns=["_avg"])
-
-                    fig4 = px.imshow(
-                        pivot,
-                        color_continuous_scale=["red", "white", "blue"],
-                        color_continuous_midpoint=50,
-                        title="Straight-Ticket D% by Precinct Over Time",
-                        labels=dict(x="Election", y="Precinct", color="D Straight %"),
-                        aspect="auto",
+                # The full race list is only queried once asked for
+                with st.expander("Races"):
+                    _lazy_table(
+                        load_races,
+                        key="load_election_races",
+                        use_container_width=True,
+                        hide_index=True,
                     )
-                    fig4.update_layout(height=max(500, len(pivot) * 14))
-                    st.plotly_chart(fig4, use_container_width=True)
 
-            with st.expander("View trend summary data"):
-                st.dataframe(trend_summary, hide_index=True)
+                if changed_count > 0:
+                    st.caption("Rows marked 'Yes' in Changed column have normalized names that differ from the original PDF data.")
+            else:
+                st.info("No races found for this election.")
+    else:
+        st.info("No elections in database.")
 
-            with st.expander("View precinct detail data"):
-                st.dataframe(precinct_detail, hide_index=True)
-        else:
-            st.info("No straight-ticket voting data available.")
 
-    # --- Straight-Ticket Geography (NEW) ---
-    elif pattern_section == "Straight-Ticket Geography":
-        st.subheader("Straight-Ticket Geography")
-        st.markdown("*Straight-ticket D votes as % of total D votes per precinct. "
-                     "High % = party brand carries candidates. Low % = voters choose individual Ds.*")
-
-        geo_df = get_straight_ticket_geography()
-
-        if not geo_df.empty:
-            geo_elections = sorted(geo_df["election_date"].unique())
-            geo_election = st.selectbox(
-                "Election", geo_elections,
-                index=len(geo_elections)-1,
-                key="geo_election"
-            )
-            filtered = geo_df[geo_df["election_date"] == geo_election].sort_values(
-                "straight_d_pct_of_total"
+# --- Race & Result Browser ---
+@st.fragment
+def _race_browser_section():
+    st.subheader("Race & Result Browser")
+    st.markdown("*Drill into any race to see precinct-level results*")
+
+    all_elections = _fetch_all_elections(_data_version())
+
+    if not all_elections.empty:
+        election_labels = dict(zip(
+            all_elections["id"].astype(int).tolist(),
+            all_elections["election_date"].astype(str) + " — " + all_elections["election_name"].astype(str),
+        ))
+        sel_eid = st.selectbox(
+            "Election", list(election_labels), format_func=election_labels.get, key="explorer_election2"
+        )
+
+        # Get races for this election
+        race_list = _fetch_races(sel_eid, _data_version())
+
+        if not race_list.empty:
+            # Build race labels showing normalized name if different
+            level = race_list["race_level"].fillna("").astype(str)
+            display_name = race_list["display_name"].astype(str)
+            race_name = race_list["race_name"].astype(str)
+            prefix = ("[" + level + "] ").where(level != "", "")
+            suffix = (" (was: " + race_name + ")").where(display_name != race_name, "")
+            race_labels = dict(zip(race_list["id"].astype(int).tolist(), prefix + display_name + suffix))
+
+            sel_race_id = st.selectbox(
+                "Race", list(race_labels), format_func=race_labels.get, key="explorer_race"
             )
 
-            if not filtered.empty:
-                fig = px.bar(
-                    filtered,
-                    x="straight_d_pct_of_total",
-                    y="precinct",
-                    orientation="h",
-                    color="dependency",
-                    color_discrete_map=DEPENDENCY_COLORS,
-                    title=f"Straight-Ticket D as % of Total D Votes ({geo_election})",
-                    hover_data=["straight_d_votes", "total_d_votes"],
-                )
-                fig.add_vline(x=40, line_dash="dash", line_color="#8e44ad", opacity=0.3,
-                              annotation_text="Brand-Dependent threshold")
-                fig.add_vline(x=20, line_dash="dash", line_color="#2ecc71", opacity=0.3,
-                              annotation_text="Candidate-Dependent threshold")
-                fig.update_layout(height=max(500, len(filtered) * 16))
-                st.plotly_chart(fig, use_container_width=True)
-
-                # Dependency summary
-                dep_counts = filtered["dependency"].value_counts()
-                cols = st.columns(3)
-                for i, (dep, count) in enumerate(dep_counts.items()):
-                    cols[i % 3].metric(dep, count)
-
-                st.caption("Brand-Dependent (\u226540%): Party label does the work. "
-                           "Candidate-Dependent (<20%): Individual candidate appeal matters most. "
-                           "Mixed (20-40%): Both factors contribute.")
-
-            with st.expander("View all geography data"):
-                st.dataframe(geo_df, hide_index=True)
+            # Get results for this race
+            # Summary: total votes per candidate (aggregated in SQL)
+            summary = _fetch_race_summary(sel_race_id, _data_version())
+
+            if not summary.empty:
+                st.markdown("**Candidate Totals:**")
+                sum_cols = st.columns(min(len(summary), 6))
+                party = summary["party"].fillna("").astype(str)
+                party_str = ("(" + party + ")").where(party != "", "")
+                labels = (summary["candidate"].astype(str) + " " + party_str).str.rstrip()
+                votes = summary["votes"].astype("int64").map("{:,} votes".format)
+                # No delta for races with zero votes cast (share is NULL)
+                shares = (summary["share"].astype(str) + "%").astype(object)
+                shares = shares.where(summary["share"].notna(), None)
+                for i, (label, vote_str, share_str) in enumerate(zip(labels, votes, shares)):
+                    sum_cols[i % len(sum_cols)].metric(label, vote_str, share_str)
+
+                # Full precinct-level results, fetched only when asked for
+                with st.expander("Precinct-Level Results"):
+                    _lazy_table(
+                        lambda: _fetch_race_results(sel_race_id, _data_version()),
+                        key="load_race_results",
+                        use_container_width=True,
+                        hide_index=True,
+                    )
+            else:
+                st.info("No results found for this race.")
+
+            # All races summary for this election
+            with st.expander("View all races in this election"):
+                all_races_summary = _fetch_all_races_summary(sel_eid, _data_version())
+                st.dataframe(all_races_summary, use_container_width=True, hide_index=True)
         else:
-            st.info("No straight-ticket geography data available.")
+            st.info("No races found for this election.")
+    else:
+        st.info("No elections in database.")
 
 
-# ============================================================
-# TAB 5: DATA EXPLORER
-# ============================================================
-with tab5:
+# --- Data Quality Report ---
+@st.fragment
+def _data_quality_section():
+    st.subheader("Data Quality Report")
+
+    # KPI cards
+    stats = _fetch_stats(_data_version()).iloc[0]
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Elections", int(stats["total_elections"]))
+    high_pct = int(stats["high_count"] / stats["assessed_count"] * 100) if stats["assessed_count"] > 0 else 0
+    col2.metric("HIGH Confidence", f"{high_pct}%",
+                 f"{int(stats['high_count'])}/{int(stats['assessed_count'])} assessed")
+    col3.metric("Total Races", f"{int(stats['total_races']):,}")
+    col4.metric("Total Results", f"{int(stats['total_results']):,}")
+    col5.metric("Precincts", int(stats["total_precincts"]))
+
+    # Full data quality table
+    st.divider()
+    st.subheader("Confidence Scores by Election")
+    dq_df = _fetch_dq_report(_data_version())
+
+    if not dq_df.empty:
+        confidence = dq_df["Confidence"].astype(object)
+        dq_df["Confidence"] = confidence.str.lower().map(CONFIDENCE_LABELS).fillna(confidence)
+        dq_df["Score"] = (dq_df["Score"] * 100).round()
+
+        st.dataframe(
+            dq_df,
+            use_container_width=True,
+            hide_index=True,
+            height=min(800, 35 * len(dq_df) + 38),
+            column_config={
+                "Score": SCORE_COLUMN,
+                "Confidence": st.column_config.TextColumn("Confidence"),
+            },
+        )
+    else:
+        st.info("No data quality assessments found.")
+
+    # Import log
+    st.divider()
+    st.subheader("Import Log")
+    import_log = _fetch_import_log(_data_version())
+
+    if not import_log.empty:
+        st.dataframe(import_log, use_container_width=True, hide_index=True)
+    else:
+        st.info("No import records found.")
+
+
+def _render_data_explorer():
     st.header("Data Explorer")
     st.markdown("*Browse and verify all raw election data*")
 
@@ -1018,321 +1884,290 @@ with tab5:
         key="explorer_section"
     )
 
-    # --- Elections Overview ---
     if explorer_section == "Elections Overview":
-        st.subheader("All Elections")
-
-        overview = get_election_overview()
-
-        if not overview.empty:
-            # Format for display
-            display_df = overview[[
-                "election_date", "election_type", "election_name",
-                "race_count", "result_count", "precinct_count",
-                "turnout_precincts", "confidence_level", "confidence_score"
-            ]].copy()
-            display_df.columns = [
-                "Date", "Type", "Name", "Races", "Results",
-                "Precincts", "Turnout Precincts", "Confidence", "Score"
-            ]
+        _elections_overview_section()
+    elif explorer_section == "Race & Result Browser":
+        _race_browser_section()
+    elif explorer_section == "Data Quality Report":
+        _data_quality_section()
 
-            # Use emoji indicators for confidence (dark-mode friendly)
-            confidence_icons = {"high": "HIGH", "medium": "MEDIUM", "low": "LOW"}
-            display_df["Confidence"] = display_df["Confidence"].apply(
-                lambda x: confidence_icons.get(x.lower(), x) if isinstance(x, str) else x
-            )
-            display_df["Score"] = display_df["Score"].apply(lambda x: f"{x:.0%}")
 
-            st.dataframe(
-                display_df,
-                use_container_width=True,
-                hide_index=True,
-                height=min(800, 35 * len(display_df) + 38),
-                column_config={
-                    "Score": st.column_config.TextColumn("Score"),
-                    "Confidence": st.column_config.TextColumn("Confidence"),
-                },
+# ============================================================
+# TAB 6: DEMOGRAPHICS
+# ============================================================
+# Sections are fragments, as in Precinct Intel.
+
+# --- Community Profile ---
+@st.fragment
+def _community_profile_section(census_api_key):
+    st.subheader("Boone County Community Profile")
+    st.markdown("*Census ACS 5-Year estimates aggregated to geographic areas*")
+
+    @st.cache_data(ttl=86400)
+    def load_area_demographics(key):
+        return get_area_demographics(key)
+
+    area_demo = load_area_demographics(census_api_key)
+
+    if not area_demo.empty:
+        # KPI cards
+        total_pop = area_demo["population"].sum()
+        avg_income = int((area_demo["median_income"] * area_demo["population"] / total_pop).sum())
+        avg_ed = round((area_demo["pct_bachelors"] * area_demo["population"] / total_pop).sum(), 1)
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("County Population", f"{total_pop:,}")
+        col2.metric("Avg Median Income", f"${avg_income:,}")
+        col3.metric("Avg % Bachelor's+", f"{avg_ed}%")
+        col4.metric("Geographic Areas", len(area_demo))
+
+        st.divider()
+
+        # Side-by-side bar charts
+        col_left, col_right = st.columns(2)
+
+        with col_left:
+            fig_income = px.bar(
+                area_demo.sort_values("median_income"),
+                x="median_income",
+                y="area",
+                orientation="h",
+                color="median_income",
+                color_continuous_scale=["#f39c12", "#27ae60"],
+                title="Median Household Income by Area",
+                labels={"median_income": "Median Income", "area": ""},
             )
+            fig_income.update_layout(height=350, showlegend=False)
+            st.plotly_chart(fig_income, use_container_width=True)
 
-            # Drill-down: select an election to see its races
-            st.divider()
-            st.subheader("Election Detail")
-            election_options = overview.apply(
-                lambda r: f"{r['election_date']} — {r['election_name']}", axis=1
-            ).tolist()
-            selected_election = st.selectbox(
-                "Select election to inspect",
-                election_options,
-                key="explorer_election"
+        with col_right:
+            fig_ed = px.bar(
+                area_demo.sort_values("pct_bachelors"),
+                x="pct_bachelors",
+                y="area",
+                orientation="h",
+                color="pct_bachelors",
+                color_continuous_scale=["#e74c3c", "#3498db"],
+                title="% with Bachelor's Degree or Higher",
+                labels={"pct_bachelors": "% Bachelor's+", "area": ""},
             )
+            fig_ed.update_layout(height=350, showlegend=False)
+            st.plotly_chart(fig_ed, use_container_width=True)
 
-            if selected_election:
-                sel_idx = election_options.index(selected_election)
-                sel_election_id = int(overview.iloc[sel_idx]["election_id"])
-
-                conn = get_connection()
-                races_df = pd.read_sql_query("""
-                    SELECT
-                        r.race_name,
-                        COALESCE(r.normalized_name, r.race_name) as normalized_name,
-                        r.race_level,
-                        r.race_type,
-                        r.total_votes,
-                        COUNT(DISTINCT c.id) as candidates,
-                        COUNT(DISTINCT res.precinct_id) as precincts
-                    FROM races r
-                    LEFT JOIN results res ON res.race_id = r.id
-                    LEFT JOIN candidates c ON res.candidate_id = c.id
-                    WHERE r.election_id = ?
-                    GROUP BY r.id
-                    ORDER BY r.race_level, r.race_name
-                """, conn, params=[sel_election_id])
-                conn.close()
-
-                if not races_df.empty:
-                    # Flag rows where name was normalized
-                    races_df["name_changed"] = races_df["race_name"] != races_df["normalized_name"]
-                    changed_count = races_df["name_changed"].sum()
-
-                    col1, col2, col3 = st.columns(3)
-                    col1.metric("Races", len(races_df))
-                    col2.metric("With Normalized Names", int(changed_count))
-                    col3.metric("Race Levels", races_df["race_level"].nunique())
+        col_left2, col_right2 = st.columns(2)
 
-                    display_races = races_df[[
-                        "race_name", "normalized_name", "race_level",
-                        "race_type", "total_votes", "candidates", "precincts", "name_changed"
-                    ]].copy()
-                    # Add a visual indicator column for changed names
-                    display_races["Changed"] = display_races["name_changed"].apply(
-                        lambda x: "Yes" if x else ""
-                    )
-                    display_races = display_races.drop(columns=["name_changed"])
-                    display_races.columns = [
-                        "Original Name", "Normalized Name", "Level",
-                        "Type", "Total Votes", "Candidates", "Precincts", "Changed"
-                    ]
+        with col_left2:
+            fig_age = px.bar(
+                area_demo.sort_values("median_age"),
+                x="median_age",
+                y="area",
+                orientation="h",
+                color="median_age",
+                color_continuous_scale=["#3498db", "#8e44ad"],
+                title="Median Age by Area",
+                labels={"median_age": "Median Age", "area": ""},
+            )
+            fig_age.update_layout(height=350, showlegend=False)
+            st.plotly_chart(fig_age, use_container_width=True)
 
-                    st.dataframe(
-                        display_races,
-                        use_container_width=True,
-                        hide_index=True,
-                    )
+        with col_right2:
+            fig_home = px.bar(
+                area_demo.sort_values("median_home_value"),
+                x="median_home_value",
+                y="area",
+                orientation="h",
+                color="median_home_value",
+                color_continuous_scale=["#95a5a6", "#2ecc71"],
+                title="Median Home Value by Area",
+                labels={"median_home_value": "Median Home Value", "area": ""},
+            )
+            fig_home.update_layout(height=350, showlegend=False)
+            st.plotly_chart(fig_home, use_container_width=True)
+
+        # Full data table
+        with st.expander("View full area demographics data"):
+            display_demo = area_demo.copy()
+            display_demo["median_income"] = display_demo["median_income"].apply(lambda x: f"${x:,}")
+            display_demo["median_home_value"] = display_demo["median_home_value"].apply(lambda x: f"${x:,}")
+            display_demo["population"] = display_demo["population"].apply(lambda x: f"{x:,}")
+            st.dataframe(display_demo, use_container_width=True, hide_index=True)
+
+        st.caption("Source: U.S. Census Bureau, ACS 5-Year Estimates (2022). "
+                   "Areas are aggregations of census tracts mapped to Boone County geographic regions.")
+    else:
+        st.error("Failed to load Census data. Check your API key.")
+
+
+# --- Demographics vs. Voting ---
+@st.fragment
+def _demographics_vs_voting_section(census_api_key):
+    st.subheader("Demographics vs. Voting Patterns")
+    st.markdown("*How do community characteristics correlate with Democratic performance?*")
+
+    @st.cache_data(ttl=86400)
+    def load_demo_voting(key):
+        demos = get_area_demographics(key)
+        votes = get_area_election_summary()
+        if demos.empty or votes.empty:
+            return pd.DataFrame()
+        merged = demos.merge(votes, on="area", how="inner")
+        return merged
+
+    merged = load_demo_voting(census_api_key)
+
+    if not merged.empty and len(merged) >= 3:
+        # Variable selector
+        demo_variables = {
+            "Median Income": "median_income",
+            "% Bachelor's Degree": "pct_bachelors",
+            "Median Age": "median_age",
+            "% Homeowner": "pct_owner_occupied",
+            "Median Home Value": "median_home_value",
+            "% White": "pct_white",
+            "% Age 65+": "pct_65plus",
+        }
+
+        selected_var = st.selectbox(
+            "Demographic variable to compare",
+            list(demo_variables.keys()),
+            key="demo_variable"
+        )
+        var_col = demo_variables[selected_var]
+
+        # Main scatter: demographic vs D share
+        fig = px.scatter(
+            merged,
+            x=var_col,
+            y="overall_d_share",
+            text="area",
+            size="population",
+            color="overall_d_share",
+            color_continuous_scale=["#e74c3c", "#f39c12", "#3498db"],
+            title=f"{selected_var} vs. Democratic Vote Share by Area",
+            labels={var_col: selected_var, "overall_d_share": "D Vote Share %"},
+            trendline="ols",
+        )
+        fig.update_traces(textposition="top center", textfont_size=10)
+        fig.update_layout(height=500, showlegend=False)
+        st.plotly_chart(fig, use_container_width=True)
 
-                    if changed_count > 0:
-                        st.caption("Rows marked 'Yes' in Changed column have normalized names that differ from the original PDF data.")
-                else:
-                    st.info("No races found for this election.")
-        else:
-            st.info("No elections in database.")
+        # Compute correlation
+        corr = merged[var_col].corr(merged["overall_d_share"])
+        direction = "positive" if corr > 0 else "negative"
+        strength = "strong" if abs(corr) > 0.7 else "moderate" if abs(corr) > 0.4 else "weak"
 
-    # --- Race & Result Browser ---
-    elif explorer_section == "Race & Result Browser":
-        st.subheader("Race & Result Browser")
-        st.markdown("*Drill into any race to see precinct-level results*")
+        st.info(f"**Correlation: r = {corr:.2f}** ({strength} {direction}) — "
+                f"Areas with higher {selected_var.lower()} tend to have "
+                f"{'higher' if corr > 0 else 'lower'} Democratic vote share.")
 
-        conn = get_connection()
-        all_elections = pd.read_sql_query(
-            "SELECT id, election_date, election_name FROM elections ORDER BY election_date",
-            conn
-        )
-        conn.close()
-
-        if not all_elections.empty:
-            election_labels = all_elections.apply(
-                lambda r: f"{r['election_date']} — {r['election_name']}", axis=1
-            ).tolist()
-            selected_el = st.selectbox(
-                "Election", election_labels, key="explorer_election2"
+        # Secondary scatter: demographic vs turnout (if available)
+        if "avg_turnout" in merged.columns and merged["avg_turnout"].notna().any():
+            fig2 = px.scatter(
+                merged,
+                x=var_col,
+                y="avg_turnout",
+                text="area",
+                size="population",
+                color="avg_turnout",
+                color_continuous_scale=["#e74c3c", "#f39c12", "#2ecc71"],
+                title=f"{selected_var} vs. Average Turnout by Area",
+                labels={var_col: selected_var, "avg_turnout": "Avg Turnout %"},
+                trendline="ols",
             )
-            sel_idx = election_labels.index(selected_el)
-            sel_eid = int(all_elections.iloc[sel_idx]["id"])
-
-            # Get races for this election
-            conn = get_connection()
-            race_list = pd.read_sql_query("""
-                SELECT id, race_name, COALESCE(normalized_name, race_name) as display_name,
-                       race_level, race_type
-                FROM races WHERE election_id = ?
-                ORDER BY race_level, race_name
-            """, conn, params=[sel_eid])
-            conn.close()
-
-            if not race_list.empty:
-                # Build race labels showing normalized name if different
-                race_labels = []
-                for _, r in race_list.iterrows():
-                    label = r["display_name"]
-                    if r["race_level"]:
-                        label = f"[{r['race_level']}] {label}"
-                    if r["display_name"] != r["race_name"]:
-                        label += f" (was: {r['race_name']})"
-                    race_labels.append(label)
-
-                selected_race_label = st.selectbox(
-                    "Race", race_labels, key="explorer_race"
-                )
-                sel_race_idx = race_labels.index(selected_race_label)
-                sel_race_id = int(race_list.iloc[sel_race_idx]["id"])
-
-                # Get results for this race
-                conn = get_connection()
-                results_df = pd.read_sql_query("""
-                    SELECT
-                        c.name as candidate,
-                        c.party,
-                        COALESCE(p.precinct_name, 'TOTAL') as precinct,
-                        res.votes,
-                        res.vote_percentage
-                    FROM results res
-                    JOIN candidates c ON res.candidate_id = c.id
-                    LEFT JOIN precincts p ON res.precinct_id = p.id
-                    WHERE res.race_id = ?
-                    ORDER BY c.party, c.name, p.precinct_name
-                """, conn, params=[sel_race_id])
-                conn.close()
-
-                if not results_df.empty:
-                    # Summary: total votes per candidate
-                    summary = results_df.groupby(["candidate", "party"])["votes"].sum().reset_index()
-                    summary = summary.sort_values("votes", ascending=False)
-                    total_votes = summary["votes"].sum()
-                    summary["share"] = (summary["votes"] / total_votes * 100).round(1)
-
-                    st.markdown("**Candidate Totals:**")
-                    sum_cols = st.columns(min(len(summary), 6))
-                    for i, (_, row) in enumerate(summary.iterrows()):
-                        party_str = f" ({row['party']})" if row['party'] else ""
-                        sum_cols[i % len(sum_cols)].metric(
-                            f"{row['candidate']}{party_str}",
-                            f"{int(row['votes']):,} votes",
-                            f"{row['share']}%"
-                        )
-
-                    # Full precinct-level results
-                    st.markdown("**Precinct-Level Results:**")
-                    st.dataframe(
-                        results_df,
-                        use_container_width=True,
-                        hide_index=True,
-                        height=min(600, 35 * len(results_df) + 38),
-                    )
-                else:
-                    st.info("No results found for this race.")
-
-                # All races summary for this election
-                with st.expander("View all races in this election"):
-                    conn = get_connection()
-                    all_races_summary = pd.read_sql_query("""
-                        SELECT
-                            COALESCE(r.normalized_name, r.race_name) as race,
-                            r.race_level as level,
-                            GROUP_CONCAT(DISTINCT c.party) as parties,
-                            COUNT(DISTINCT c.id) as candidates,
-                            SUM(res.votes) as total_votes,
-                            COUNT(DISTINCT res.precinct_id) as precincts
-                        FROM races r
-                        LEFT JOIN results res ON res.race_id = r.id
-                        LEFT JOIN candidates c ON res.candidate_id = c.id
-                        WHERE r.election_id = ?
-                        GROUP BY r.id
-                        ORDER BY r.race_level, r.race_name
-                    """, conn, params=[sel_eid])
-                    conn.close()
-                    st.dataframe(all_races_summary, use_container_width=True, hide_index=True)
-            else:
-                st.info("No races found for this election.")
-        else:
-            st.info("No elections in database.")
+            fig2.update_traces(textposition="top center", textfont_size=10)
+            fig2.update_layout(height=500, showlegend=False)
+            st.plotly_chart(fig2, use_container_width=True)
 
-    # --- Data Quality Report ---
-    elif explorer_section == "Data Quality Report":
-        st.subheader("Data Quality Report")
+            corr2 = merged[var_col].corr(merged["avg_turnout"])
+            st.info(f"**Turnout correlation: r = {corr2:.2f}** — "
+                    f"Areas with higher {selected_var.lower()} tend to have "
+                    f"{'higher' if corr2 > 0 else 'lower'} turnout.")
+
+        # Summary table
+        with st.expander("View merged demographics + voting data"):
+            display_cols = ["area", "population", var_col, "overall_d_share",
+                            "precincts", "elections_counted"]
+            if "avg_turnout" in merged.columns:
+                display_cols.append("avg_turnout")
+            st.dataframe(merged[display_cols], use_container_width=True, hide_index=True)
+
+        st.caption("Note: Correlations are based on 5 geographic areas. "
+                   "With more granular precinct-to-tract mapping, these correlations will sharpen. "
+                   "D Vote Share calculated from D vs R votes in general election federal/state/county races.")
+    elif not merged.empty:
+        st.warning("Not enough matched areas for correlation analysis. Need at least 3 areas with both demographic and election data.")
+    else:
+        st.error("Failed to load or merge demographic and election data.")
 
-        conn = get_connection()
 
-        # KPI cards
-        stats = pd.read_sql_query("""
-            SELECT
-                (SELECT COUNT(*) FROM elections) as total_elections,
-                (SELECT COUNT(*) FROM races) as total_races,
-                (SELECT COUNT(*) FROM results) as total_results,
-                (SELECT COUNT(DISTINCT precinct_id) FROM results WHERE precinct_id IS NOT NULL) as total_precincts,
-                (SELECT COUNT(*) FROM data_quality WHERE overall_confidence = 'high') as high_count,
-                (SELECT COUNT(*) FROM data_quality) as assessed_count
-        """, conn).iloc[0]
-
-        col1, col2, col3, col4, col5 = st.columns(5)
-        col1.metric("Elections", int(stats["total_elections"]))
-        high_pct = int(stats["high_count"] / stats["assessed_count"] * 100) if stats["assessed_count"] > 0 else 0
-        col2.metric("HIGH Confidence", f"{high_pct}%",
-                     f"{int(stats['high_count'])}/{int(stats['assessed_count'])} assessed")
-        col3.metric("Total Races", f"{int(stats['total_races']):,}")
-        col4.metric("Total Results", f"{int(stats['total_results']):,}")
-        col5.metric("Precincts", int(stats["total_precincts"]))
-
-        # Full data quality table
-        st.divider()
-        st.subheader("Confidence Scores by Election")
-        dq_df = pd.read_sql_query("""
-            SELECT
-                e.election_date as "Date",
-                e.election_name as "Election",
-                dq.overall_confidence as "Confidence",
-                dq.confidence_score as "Score",
-                dq.source_type as "Source",
-                CASE WHEN dq.cross_validated THEN 'Yes' ELSE 'No' END as "Cross-Validated",
-                CASE WHEN dq.race_names_clean THEN 'Yes' ELSE 'No' END as "Names Clean",
-                CASE WHEN dq.turnout_consistent THEN 'Yes' ELSE 'No' END as "Turnout OK",
-                CASE WHEN dq.precinct_count_match THEN 'Yes' ELSE 'No' END as "Precinct Match",
-                dq.notes as "Notes"
-            FROM data_quality dq
-            JOIN elections e ON e.id = dq.election_id
-            ORDER BY e.election_date
-        """, conn)
-
-        if not dq_df.empty:
-            dq_df["Score"] = dq_df["Score"].apply(lambda x: f"{x:.0%}" if isinstance(x, (int, float)) else x)
+# --- Tract Detail ---
+@st.fragment
+def _tract_detail_section(census_api_key):
+    st.subheader("Census Tract Detail")
+    st.markdown("*All 11 Boone County census tracts with full demographic data*")
 
-            st.dataframe(
-                dq_df,
-                use_container_width=True,
-                hide_index=True,
-                height=min(800, 35 * len(dq_df) + 38),
-                column_config={
-                    "Score": st.column_config.TextColumn("Score"),
-                    "Confidence": st.column_config.TextColumn("Confidence"),
-                },
-            )
-        else:
-            st.info("No data quality assessments found.")
+    @st.cache_data(ttl=86400)
+    def load_tract_detail(key):
+        return get_tract_detail(key)
 
-        # Import log
-        st.divider()
-        st.subheader("Import Log")
-        import_log = pd.read_sql_query("""
-            SELECT
-                filename as "File",
-                file_type as "Type",
-                records_imported as "Records",
-                status as "Status",
-                notes as "Notes",
-                imported_at as "Imported"
-            FROM import_log
-            ORDER BY imported_at DESC
-        """, conn)
-        conn.close()
-
-        if not import_log.empty:
-            st.dataframe(import_log, use_container_width=True, hide_index=True)
-        else:
-            st.info("No import records found.")
+    tracts = load_tract_detail(census_api_key)
 
+    if not tracts.empty:
+        # Summary metrics
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Census Tracts", len(tracts))
+        col2.metric("Total Population", f"{tracts['total_population'].sum():,}")
+        col3.metric("Areas Covered", tracts["area"].nunique())
+
+        # Bar chart: population by tract
+        fig = px.bar(
+            tracts.sort_values("total_population"),
+            x="total_population",
+            y="area_detail",
+            orientation="h",
+            color="area",
+            title="Population by Census Tract",
+            labels={"total_population": "Population", "area_detail": "Tract"},
+        )
+        fig.update_layout(height=450)
+        st.plotly_chart(fig, use_container_width=True)
 
-# ============================================================
-# TAB 6: DEMOGRAPHICS
-# ============================================================
-with tab6:
+        # Scatter: income vs education by tract
+        fig2 = px.scatter(
+            tracts,
+            x="median_income",
+            y="pct_bachelors",
+            text="area_detail",
+            size="total_population",
+            color="area",
+            title="Median Income vs. Education Level by Census Tract",
+            labels={"median_income": "Median Household Income",
+                    "pct_bachelors": "% Bachelor's Degree+"},
+        )
+        fig2.update_traces(textposition="top center", textfont_size=8)
+        fig2.update_layout(height=500)
+        st.plotly_chart(fig2, use_container_width=True)
+
+        # Full data table
+        display_tracts = tracts[[
+            "area_detail", "area", "total_population", "median_income",
+            "median_age", "pct_bachelors", "pct_white", "pct_65plus",
+            "pct_owner_occupied", "median_home_value"
+        ]].copy()
+        display_tracts.columns = [
+            "Tract", "Area", "Population", "Median Income",
+            "Median Age", "% Bachelor's+", "% White", "% 65+",
+            "% Owner-Occupied", "Median Home Value"
+        ]
+        st.dataframe(display_tracts, use_container_width=True, hide_index=True)
+
+        st.caption("Source: U.S. Census Bureau, ACS 5-Year Estimates (2022). "
+                   "Tract codes: 8101-8107, with 8106 split into 4 sub-tracts (Zionsville/Whitestown growth area).")
+    else:
+        st.error("Failed to load tract data. Check your API key.")
+
+
+def _render_demographics():
     st.header("Demographics")
     st.markdown("*Census data correlated with voting patterns — what drives Democratic performance?*")
 
@@ -1347,7 +2182,7 @@ with tab6:
     if not census_api_key:
         st.warning("Census API key not configured. Add it to `.streamlit/secrets.toml` under `[census]`.")
         st.code('[census]\napi_key = "your_key_here"', language="toml")
-        st.stop()
+        return
 
     demo_section = st.radio(
         "Section",
@@ -1356,275 +2191,266 @@ with tab6:
         key="demo_section"
     )
 
-    # --- Community Profile ---
     if demo_section == "Community Profile":
-        st.subheader("Boone County Community Profile")
-        st.markdown("*Census ACS 5-Year estimates aggregated to geographic areas*")
-
-        @st.cache_data(ttl=86400)
-        def load_area_demographics(key):
-            return get_area_demographics(key)
-
-        area_demo = load_area_demographics(census_api_key)
-
-        if not area_demo.empty:
-            # KPI cards
-            total_pop = area_demo["population"].sum()
-            avg_income = int((area_demo["median_income"] * area_demo["population"] / total_pop).sum())
-            avg_ed = round((area_demo["pct_bachelors"] * area_demo["population"] / total_pop).sum(), 1)
-
-            col1, col2, col3, col4 = st.columns(4)
-            col1.metric("County Population", f"{total_pop:,}")
-            col2.metric("Avg Median Income", f"${avg_income:,}")
-            col3.metric("Avg % Bachelor's+", f"{avg_ed}%")
-            col4.metric("Geographic Areas", len(area_demo))
-
-            st.divider()
-
-            # Side-by-side bar charts
-            col_left, col_right = st.columns(2)
-
-            with col_left:
-                fig_income = px.bar(
-                    area_demo.sort_values("median_income"),
-                    x="median_income",
-                    y="area",
-                    orientation="h",
-                    color="median_income",
-                    color_continuous_scale=["#f39c12", "#27ae60"],
-                    title="Median Household Income by Area",
-                    labels={"median_income": "Median Income", "area": ""},
-                )
-                fig_income.update_layout(height=350, showlegend=False)
-                st.plotly_chart(fig_income, use_container_width=True)
-
-            with col_right:
-                fig_ed = px.bar(
-                    area_demo.sort_values("pct_bachelors"),
-                    x="pct_bachelors",
-                    y="area",
-                    orientation="h",
-                    color="pct_bachelors",
-                    color_continuous_scale=["#e74c3c", "#3498db"],
-                    title="% with Bachelor's Degree or Higher",
-                    labels={"pct_bachelors": "% Bachelor's+", "area": ""},
-                )
-                fig_ed.update_layout(height=350, showlegend=False)
-                st.plotly_chart(fig_ed, use_container_width=True)
-
-            col_left2, col_right2 = st.columns(2)
-
-            with col_left2:
-                fig_age = px.bar(
-                    area_demo.sort_values("median_age"),
-                    x="median_age",
-                    y="area",
-                    orientation="h",
-                    color="median_age",
-                    color_continuous_scale=["#3498db", "#8e44ad"],
-                    title="Median Age by Area",
-                    labels={"median_age": "Median Age", "area": ""},
-                )
-                fig_age.update_layout(height=350, showlegend=False)
-                st.plotly_chart(fig_age, use_container_width=True)
-
-            with col_right2:
-                fig_home = px.bar(
-                    area_demo.sort_values("median_home_value"),
-                    x="median_home_value",
-                    y="area",
-                    orientation="h",
-                    color="median_home_value",
-                    color_continuous_scale=["#95a5a6", "#2ecc71"],
-                    title="Median Home Value by Area",
-                    labels={"median_home_value": "Median Home Value", "area": ""},
-                )
-                fig_home.update_layout(height=350, showlegend=False)
-                st.plotly_chart(fig_home, use_container_width=True)
-
-            # Full data table
-            with st.expander("View full area demographics data"):
-                display_demo = area_demo.copy()
-                display_demo["median_income"] = display_demo["median_income"].apply(lambda x: f"${x:,}")
-                display_demo["median_home_value"] = display_demo["median_home_value"].apply(lambda x: f"${x:,}")
-                display_demo["population"] = display_demo["population"].apply(lambda x: f"{x:,}")
-                st.dataframe(display_demo, use_container_width=True, hide_index=True)
-
-            st.caption("Source: U.S. Census Bureau, ACS 5-Year Estimates (2022). "
-                       "Areas are aggregations of census tracts mapped to Boone County geographic regions.")
-        else:
-            st.error("Failed to load Census data. Check your API key.")
-
-    # --- Demographics vs. Voting ---
+        _community_profile_section(census_api_key)
     elif demo_section == "Demographics vs. Voting":
-        st.subheader("Demographics vs. Voting Patterns")
-        st.markdown("*How do community characteristics correlate with Democratic performance?*")
-
-        @st.cache_data(ttl=86400)
-        def load_demo_voting(key):
-            demos = get_area_demographics(key)
-            votes = get_area_election_summary()
-            if demos.empty or votes.empty:
-                return pd.DataFrame()
-            merged = demos.merge(votes, on="area", how="inner")
-            return merged
-
-        merged = load_demo_voting(census_api_key)
-
-        if not merged.empty and len(merged) >= 3:
-            # Variable selector
-            demo_variables = {
-                "Median Income": "median_income",
-                "% Bachelor's Degree": "pct_bachelors",
-                "Median Age": "median_age",
-                "% Homeowner": "pct_owner_occupied",
-                "Median Home Value": "median_home_value",
-                "% White": "pct_white",
-                "% Age 65+": "pct_65plus",
-            }
-
-            selected_var = st.selectbox(
-                "Demographic variable to compare",
-                list(demo_variables.keys()),
-                key="demo_variable"
-            )
-            var_col = demo_variables[selected_var]
+        _demographics_vs_voting_section(census_api_key)
+    elif demo_section == "Tract Detail":
+        _tract_detail_section(census_api_key)
 
-            # Main scatter: demographic vs D share
-            fig = px.scatter(
-                merged,
-                x=var_col,
-                y="overall_d_share",
-                text="area",
-                size="population",
-                color="overall_d_share",
-                color_continuous_scale=["#e74c3c", "#f39c12", "#3498db"],
-                title=f"{selected_var} vs. Democratic Vote Share by Area",
-                labels={var_col: selected_var, "overall_d_share": "D Vote Share %"},
-                trendline="ols",
-            )
-            fig.update_traces(textposition="top center", textfont_size=10)
-            fig.update_layout(height=500, showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
 
-            # Compute correlation
-            corr = merged[var_col].corr(merged["overall_d_share"])
-            direction = "positive" if corr > 0 else "negative"
-            strength = "strong" if abs(corr) > 0.7 else "moderate" if abs(corr) > 0.4 else "weak"
+# ============================================================
+# TAB 7: CAMPAIGN FINANCE
+# ============================================================
+# Sections are fragments, as in Precinct Intel.
+
+# --- Overview ---
+@st.fragment
+def _finance_overview_section(finance_data):
+    st.subheader("Boone County Donor Overview")
 
-            st.info(f"**Correlation: r = {corr:.2f}** ({strength} {direction}) — "
-                    f"Areas with higher {selected_var.lower()} tend to have "
-                    f"{'higher' if corr > 0 else 'lower'} Democratic vote share.")
-
-            # Secondary scatter: demographic vs turnout (if available)
-            if "avg_turnout" in merged.columns and merged["avg_turnout"].notna().any():
-                fig2 = px.scatter(
-                    merged,
-                    x=var_col,
-                    y="avg_turnout",
-                    text="area",
-                    size="population",
-                    color="avg_turnout",
-                    color_continuous_scale=["#e74c3c", "#f39c12", "#2ecc71"],
-                    title=f"{selected_var} vs. Average Turnout by Area",
-                    labels={var_col: selected_var, "avg_turnout": "Avg Turnout %"},
-                    trendline="ols",
-                )
-                fig2.update_traces(textposition="top center", textfont_size=10)
-                fig2.update_layout(height=500, showlegend=False)
-                st.plotly_chart(fig2, use_container_width=True)
-
-                corr2 = merged[var_col].corr(merged["avg_turnout"])
-                st.info(f"**Turnout correlation: r = {corr2:.2f}** — "
-                        f"Areas with higher {selected_var.lower()} tend to have "
-                        f"{'higher' if corr2 > 0 else 'lower'} turnout.")
-
-            # Summary table
-            with st.expander("View merged demographics + voting data"):
-                display_cols = ["area", "population", var_col, "overall_d_share",
-                                "precincts", "elections_counted"]
-                if "avg_turnout" in merged.columns:
-                    display_cols.append("avg_turnout")
-                st.dataframe(merged[display_cols], use_container_width=True, hide_index=True)
-
-            st.caption("Note: Correlations are based on 5 geographic areas. "
-                       "With more granular precinct-to-tract mapping, these correlations will sharpen. "
-                       "D Vote Share calculated from D vs R votes in general election federal/state/county races.")
-        elif not merged.empty:
-            st.warning("Not enough matched areas for correlation analysis. Need at least 3 areas with both demographic and election data.")
-        else:
-            st.error("Failed to load or merge demographic and election data.")
+    # KPI cards
+    total_amount = finance_data["Amount"].sum()
+    total_contributions = len(finance_data)
+    unique_donors = finance_data["Name"].nunique()
+    years_covered = sorted(finance_data["year"].unique())
 
-    # --- Tract Detail ---
-    elif demo_section == "Tract Detail":
-        st.subheader("Census Tract Detail")
-        st.markdown("*All 11 Boone County census tracts with full demographic data*")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total Contributions", f"${total_amount:,.0f}")
+    col2.metric("Donation Count", f"{total_contributions:,}")
+    col3.metric("Unique Donors", f"{unique_donors:,}")
+    col4.metric("Years Covered", f"{len(years_covered)}")
 
-        @st.cache_data(ttl=86400)
-        def load_tract_detail(key):
-            return get_tract_detail(key)
+    st.divider()
+
+    # Trend over time
+    yearly = finance_data.groupby("year").agg(
+        total=("Amount", "sum"),
+        count=("Amount", "count"),
+        donors=("Name", "nunique"),
+        avg=("Amount", "mean"),
+    ).reset_index()
+
+    col_left, col_right = st.columns(2)
+
+    with col_left:
+        fig = px.bar(
+            yearly,
+            x="year",
+            y="total",
+            color="total",
+            color_continuous_scale=["#3498db", "#2ecc71"],
+            title="Total Contributions by Year",
+            labels={"year": "Year", "total": "Total ($)"},
+            text=yearly["total"].apply(lambda x: f"${x:,.0f}"),
+        )
+        fig.update_traces(textposition="outside")
+        fig.update_layout(height=400, showlegend=False)
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col_right:
+        fig2 = px.bar(
+            yearly,
+            x="year",
+            y="donors",
+            color="donors",
+            color_continuous_scale=["#e74c3c", "#f39c12"],
+            title="Unique Donors by Year",
+            labels={"year": "Year", "donors": "Unique Donors"},
+            text="donors",
+        )
+        fig2.update_traces(textposition="outside")
+        fig2.update_layout(height=400, showlegend=False)
+        st.plotly_chart(fig2, use_container_width=True)
+
+    # Average contribution trend
+    fig3 = px.line(
+        yearly,
+        x="year",
+        y="avg",
+        markers=True,
+        title="Average Contribution Size Over Time",
+        labels={"year": "Year", "avg": "Avg Contribution ($)"},
+    )
+    fig3.update_layout(height=350)
+    st.plotly_chart(fig3, use_container_width=True)
+
+    st.caption("Source: Indiana Election Division bulk contribution data. "
+               "Filtered to core Boone County ZIP codes (46035, 46050, 46052, 46069, 46071, 46075, 46077).")
+
+
+# --- Party Breakdown ---
+@st.fragment
+def _party_breakdown_section(finance_data):
+    st.subheader("Estimated Party Breakdown")
+    st.markdown("*Contributions classified as D/R based on committee name keywords. "
+                "'Unknown' includes PACs, local races, and committees without clear party affiliation.*")
+
+    summary = get_contribution_summary(finance_data)
+
+    if not summary.empty:
+        # Stacked bar: D vs R vs Unknown by year
+        party_colors = {"D": "#3498db", "R": "#e74c3c", "Unknown": "#95a5a6"}
+
+        fig = px.bar(
+            summary,
+            x="year",
+            y="total_amount",
+            color="party_est",
+            barmode="stack",
+            color_discrete_map=party_colors,
+            title="Total Contributions by Party & Year",
+            labels={"year": "Year", "total_amount": "Total ($)", "party_est": "Party"},
+        )
+        fig.update_layout(height=450)
+        st.plotly_chart(fig, use_container_width=True)
 
-        tracts = load_tract_detail(census_api_key)
+        # Donor count comparison
+        fig2 = px.bar(
+            summary,
+            x="year",
+            y="unique_donors",
+            color="party_est",
+            barmode="group",
+            color_discrete_map=party_colors,
+            title="Unique Donors by Party & Year",
+            labels={"year": "Year", "unique_donors": "Unique Donors", "party_est": "Party"},
+        )
+        fig2.update_layout(height=400)
+        st.plotly_chart(fig2, use_container_width=True)
 
-        if not tracts.empty:
-            # Summary metrics
+        # D vs R comparison metrics
+        st.divider()
+        st.subheader("D vs R Summary (All Years Combined)")
+        d_total = summary[summary["party_est"] == "D"]["total_amount"].sum()
+        r_total = summary[summary["party_est"] == "R"]["total_amount"].sum()
+        d_donors = summary[summary["party_est"] == "D"]["unique_donors"].sum()
+        r_donors = summary[summary["party_est"] == "R"]["unique_donors"].sum()
+
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("D Total", f"${d_total:,.0f}")
+        col2.metric("R Total", f"${r_total:,.0f}")
+        col3.metric("D Donors", f"{d_donors:,}")
+        col4.metric("R Donors", f"{r_donors:,}")
+
+        if d_donors > 0 and r_donors > 0:
+            d_avg = d_total / d_donors
+            r_avg = r_total / r_donors
             col1, col2, col3 = st.columns(3)
-            col1.metric("Census Tracts", len(tracts))
-            col2.metric("Total Population", f"{tracts['total_population'].sum():,}")
-            col3.metric("Areas Covered", tracts["area"].nunique())
+            col1.metric("D Avg/Donor", f"${d_avg:,.0f}")
+            col2.metric("R Avg/Donor", f"${r_avg:,.0f}")
+            col3.metric("R:D Ratio", f"{r_total/d_total:.1f}x")
+
+            st.info(f"**Key insight:** Republican donors in Boone County give "
+                    f"${r_avg:,.0f} per donor on average vs ${d_avg:,.0f} for Democrats — "
+                    f"a {r_avg/d_avg:.1f}x difference. But Democrats have {d_donors:,} unique donors "
+                    f"vs {r_donors:,} for Republicans — a broader base.")
+
+        with st.expander("View party summary data"):
+            st.dataframe(summary, use_container_width=True, hide_index=True)
+
+
+# --- Top Recipients ---
+@st.fragment
+def _top_recipients_section(finance_data):
+    st.subheader("Top Recipient Committees")
+    st.markdown("*Where Boone County donors send their money*")
+
+    top_n = st.slider("Number of committees to show", 10, 30, 15, key="finance_top_n")
+    top = get_top_committees(finance_data, top_n=top_n)
+
+    if not top.empty:
+        party_colors = {"D": "#3498db", "R": "#e74c3c", "Unknown": "#95a5a6"}
+
+        fig = px.bar(
+            top.sort_values("total_amount"),
+            x="total_amount",
+            y="Committee",
+            orientation="h",
+            color="party_est",
+            color_discrete_map=party_colors,
+            title=f"Top {top_n} Recipient Committees (All Years)",
+            labels={"total_amount": "Total ($)", "Committee": "", "party_est": "Party"},
+            hover_data=["unique_donors", "contribution_count", "years_active"],
+        )
+        fig.update_layout(height=max(500, top_n * 28))
+        st.plotly_chart(fig, use_container_width=True)
 
-            # Bar chart: population by tract
-            fig = px.bar(
-                tracts.sort_values("total_population"),
-                x="total_population",
-                y="area_detail",
-                orientation="h",
-                color="area",
-                title="Population by Census Tract",
-                labels={"total_population": "Population", "area_detail": "Tract"},
-            )
-            fig.update_layout(height=450)
-            st.plotly_chart(fig, use_container_width=True)
+        with st.expander("View committee data"):
+            display_top = top.copy()
+            display_top["total_amount"] = display_top["total_amount"].apply(lambda x: f"${x:,.0f}")
+            st.dataframe(display_top, use_container_width=True, hide_index=True)
+
+
+# --- Donor Geography ---
+@st.fragment
+def _donor_geography_section(finance_data):
+    st.subheader("Donor Geography")
+    st.markdown("*Where in Boone County are political donors?*")
+
+    # Aggregate by area across all years
+    by_area_all = finance_data.groupby("area").agg(
+        total=("Amount", "sum"),
+        count=("Amount", "count"),
+        donors=("Name", "nunique"),
+        d_amount=("Amount", lambda x: x[finance_data.loc[x.index, "party_est"] == "D"].sum()),
+        r_amount=("Amount", lambda x: x[finance_data.loc[x.index, "party_est"] == "R"].sum()),
+    ).reset_index()
+    by_area_all["d_pct"] = (by_area_all["d_amount"] / by_area_all["total"] * 100).round(1)
+    by_area_all["avg_donation"] = (by_area_all["total"] / by_area_all["count"]).round(0)
+
+    col_left, col_right = st.columns(2)
+
+    with col_left:
+        fig = px.bar(
+            by_area_all.sort_values("total"),
+            x="total",
+            y="area",
+            orientation="h",
+            color="total",
+            color_continuous_scale=["#f39c12", "#2ecc71"],
+            title="Total Contributions by Area",
+            labels={"total": "Total ($)", "area": ""},
+        )
+        fig.update_layout(height=350, showlegend=False)
+        st.plotly_chart(fig, use_container_width=True)
 
-            # Scatter: income vs education by tract
-            fig2 = px.scatter(
-                tracts,
-                x="median_income",
-                y="pct_bachelors",
-                text="area_detail",
-                size="total_population",
-                color="area",
-                title="Median Income vs. Education Level by Census Tract",
-                labels={"median_income": "Median Household Income",
-                        "pct_bachelors": "% Bachelor's Degree+"},
-            )
-            fig2.update_traces(textposition="top center", textfont_size=8)
-            fig2.update_layout(height=500)
-            st.plotly_chart(fig2, use_container_width=True)
+    with col_right:
+        fig2 = px.bar(
+            by_area_all.sort_values("donors"),
+            x="donors",
+            y="area",
+            orientation="h",
+            color="donors",
+            color_continuous_scale=["#e74c3c", "#3498db"],
+            title="Unique Donors by Area",
+            labels={"donors": "Unique Donors", "area": ""},
+        )
+        fig2.update_layout(height=350, showlegend=False)
+        st.plotly_chart(fig2, use_container_width=True)
 
-            # Full data table
-            display_tracts = tracts[[
-                "area_detail", "area", "total_population", "median_income",
-                "median_age", "pct_bachelors", "pct_white", "pct_65plus",
-                "pct_owner_occupied", "median_home_value"
-            ]].copy()
-            display_tracts.columns = [
-                "Tract", "Area", "Population", "Median Income",
-                "Median Age", "% Bachelor's+", "% White", "% 65+",
-                "% Owner-Occupied", "Median Home Value"
-            ]
-            st.dataframe(display_tracts, use_container_width=True, hide_index=True)
+    # D share of donations by area
+    fig3 = px.bar(
+        by_area_all.sort_values("d_pct"),
+        x="d_pct",
+        y="area",
+        orientation="h",
+        color="d_pct",
+        color_continuous_scale=["#e74c3c", "#3498db"],
+        title="Democratic Share of Identifiable Donations by Area",
+        labels={"d_pct": "D Share %", "area": ""},
+    )
+    fig3.update_layout(height=350, showlegend=False)
+    st.plotly_chart(fig3, use_container_width=True)
 
-            st.caption("Source: U.S. Census Bureau, ACS 5-Year Estimates (2022). "
-                       "Tract codes: 8101-8107, with 8106 split into 4 sub-tracts (Zionsville/Whitestown growth area).")
-        else:
-            st.error("Failed to load tract data. Check your API key.")
+    with st.expander("View geographic data"):
+        st.dataframe(by_area_all, use_container_width=True, hide_index=True)
 
+    st.caption("Areas match the Census demographic areas. "
+               "D/R classification is estimated from committee names and may undercount both parties.")
 
-# ============================================================
-# TAB 7: CAMPAIGN FINANCE
-# ============================================================
-with tab7:
+
+def _render_campaign_finance():
     st.header("Campaign Finance")
     st.markdown("*Indiana state campaign contributions from Boone County donors (2018-2024)*")
 
@@ -1642,257 +2468,272 @@ with tab7:
             key="finance_section"
         )
 
-        # --- Overview ---
         if finance_section == "Overview":
-            st.subheader("Boone County Donor Overview")
-
-            # KPI cards
-            total_amount = finance_data["Amount"].sum()
-            total_contributions = len(finance_data)
-            unique_donors = finance_data["Name"].nunique()
-            years_covered = sorted(finance_data["year"].unique())
-
-            col1, col2, col3, col4 = st.columns(4)
-            col1.metric("Total Contributions", f"${total_amount:,.0f}")
-            col2.metric("Donation Count", f"{total_contributions:,}")
-            col3.metric("Unique Donors", f"{unique_donors:,}")
-            col4.metric("Years Covered", f"{len(years_covered)}")
-
-            st.divider()
-
-            # Trend over time
-            yearly = finance_data.groupby("year").agg(
-                total=("Amount", "sum"),
-                count=("Amount", "count"),
-                donors=("Name", "nunique"),
-                avg=("Amount", "mean"),
-            ).reset_index()
-
-            col_left, col_right = st.columns(2)
-
-            with col_left:
-                fig = px.bar(
-                    yearly,
-                    x="year",
-                    y="total",
-                    color="total",
-                    color_continuous_scale=["#3498db", "#2ecc71"],
-                    title="Total Contributions by Year",
-                    labels={"year": "Year", "total": "Total ($)"},
-                    text=yearly["total"].apply(lambda x: f"${x:,.0f}"),
-                )
-                fig.update_traces(textposition="outside")
-                fig.update_layout(height=400, showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col_right:
-                fig2 = px.bar(
-                    yearly,
-                    x="year",
-                    y="donors",
-                    color="donors",
-                    color_continuous_scale=["#e74c3c", "#f39c12"],
-                    title="Unique Donors by Year",
-                    labels={"year": "Year", "donors": "Unique Donors"},
-                    text="donors",
-                )
-                fig2.update_traces(textposition="outside")
-                fig2.update_layout(height=400, showlegend=False)
-                st.plotly_chart(fig2, use_container_width=True)
+            _finance_overview_section(finance_data)
+        elif finance_section == "Party Breakdown":
+            _party_breakdown_section(finance_data)
+        elif finance_section == "Top Recipients":
+            _top_recipients_section(finance_data)
+        elif finance_section == "Donor Geography":
+            _donor_geography_section(finance_data)
+    else:
+        st.error("Failed to load campaign finance data. Check your internet connection.")
 
-            # Average contribution trend
-            fig3 = px.line(
-                yearly,
-                x="year",
-                y="avg",
-                markers=True,
-                title="Average Contribution Size Over Time",
-                labels={"year": "Year", "avg": "Avg Contribution ($)"},
-            )
-            fig3.update_layout(height=350)
-            st.plotly_chart(fig3, use_container_width=True)
 
-            st.caption("Source: Indiana Election Division bulk contribution data. "
-                       "Filtered to core Boone County ZIP codes (46035, 46050, 46052, 46069, 46071, 46075, 46077).")
+# ============================================================
+# TAB 8: 2026 ELECTION PREP
+# ============================================================
+# Sections are fragments, as in Precinct Intel.
+
+@st.fragment
+def _target_board_section(races, top_opps, trend_races):
+    st.subheader("2026 Target Board")
+    st.markdown("All expected 2026 races, prioritized by D competitiveness.")
+
+    # KPI row
+    kpi1, kpi2, kpi3, kpi4 = st.columns(4)
+    with kpi1:
+        st.metric("Total Races", len(races))
+    with kpi2:
+        high_count = len(races[races["priority"] == "High"])
+        st.metric("High Priority", high_count)
+    with kpi3:
+        recruit_count = len(races[races["priority"] == "Recruit"])
+        st.metric("Need Candidate", recruit_count)
+    with kpi4:
+        trending = len(trend_races)
+        st.metric("Trending D", trending)
+
+    # Priority filter
+    priority_filter = st.multiselect(
+        "Filter by priority",
+        ["High", "Medium", "Recruit", "Low"],
+        default=["High", "Medium", "Recruit"],
+        key="prep_priority_filter",
+    )
 
-        # --- Party Breakdown ---
-        elif finance_section == "Party Breakdown":
-            st.subheader("Estimated Party Breakdown")
-            st.markdown("*Contributions classified as D/R based on committee name keywords. "
-                        "'Unknown' includes PACs, local races, and committees without clear party affiliation.*")
+    level_filter = st.multiselect(
+        "Filter by level",
+        sorted(races["level"].unique()),
+        default=sorted(races["level"].unique()),
+        key="prep_level_filter",
+    )
 
-            summary = get_contribution_summary(finance_data)
+    filtered = races[
+        (races["priority"].isin(priority_filter)) &
+        (races["level"].isin(level_filter))
+    ].copy()
+
+    # Display columns
+    display_cols = ["race", "level", "priority", "latest_d_pct", "d_trend", "d_contested", "action"]
+    display_df = filtered[display_cols].copy()
+    display_df = display_df.rename(columns={
+        "race": "Race",
+        "level": "Level",
+        "priority": "Priority",
+        "latest_d_pct": "Last D%",
+        "d_trend": "D Trend",
+        "d_contested": "D Contested",
+        "action": "Recommended Action",
+    })
+
+    st.dataframe(
+        display_df.sort_values(["Priority", "Last D%"], ascending=[True, False]),
+        use_container_width=True,
+        hide_index=True,
+        height=600,
+    )
 
-            if not summary.empty:
-                # Stacked bar: D vs R vs Unknown by year
-                party_colors = {"D": "#3498db", "R": "#e74c3c", "Unknown": "#95a5a6"}
-
-                fig = px.bar(
-                    summary,
-                    x="year",
-                    y="total_amount",
-                    color="party_est",
-                    barmode="stack",
-                    color_discrete_map=party_colors,
-                    title="Total Contributions by Party & Year",
-                    labels={"year": "Year", "total_amount": "Total ($)", "party_est": "Party"},
-                )
-                fig.update_layout(height=450)
-                st.plotly_chart(fig, use_container_width=True)
-
-                # Donor count comparison
-                fig2 = px.bar(
-                    summary,
-                    x="year",
-                    y="unique_donors",
-                    color="party_est",
-                    barmode="group",
-                    color_discrete_map=party_colors,
-                    title="Unique Donors by Party & Year",
-                    labels={"year": "Year", "unique_donors": "Unique Donors", "party_est": "Party"},
-                )
-                fig2.update_layout(height=400)
-                st.plotly_chart(fig2, use_container_width=True)
-
-                # D vs R comparison metrics
-                st.divider()
-                st.subheader("D vs R Summary (All Years Combined)")
-                d_total = summary[summary["party_est"] == "D"]["total_amount"].sum()
-                r_total = summary[summary["party_est"] == "R"]["total_amount"].sum()
-                d_donors = summary[summary["party_est"] == "D"]["unique_donors"].sum()
-                r_donors = summary[summary["party_est"] == "R"]["unique_donors"].sum()
-
-                col1, col2, col3, col4 = st.columns(4)
-                col1.metric("D Total", f"${d_total:,.0f}")
-                col2.metric("R Total", f"${r_total:,.0f}")
-                col3.metric("D Donors", f"{d_donors:,}")
-                col4.metric("R Donors", f"{r_donors:,}")
-
-                if d_donors > 0 and r_donors > 0:
-                    d_avg = d_total / d_donors
-                    r_avg = r_total / r_donors
-                    col1, col2, col3 = st.columns(3)
-                    col1.metric("D Avg/Donor", f"${d_avg:,.0f}")
-                    col2.metric("R Avg/Donor", f"${r_avg:,.0f}")
-                    col3.metric("R:D Ratio", f"{r_total/d_total:.1f}x")
-
-                    st.info(f"**Key insight:** Republican donors in Boone County give "
-                            f"${r_avg:,.0f} per donor on average vs ${d_avg:,.0f} for Democrats — "
-                            f"a {r_avg/d_avg:.1f}x difference. But Democrats have {d_donors:,} unique donors "
-                            f"vs {r_donors:,} for Republicans — a broader base.")
-
-                with st.expander("View party summary data"):
-                    st.dataframe(summary, use_container_width=True, hide_index=True)
-
-        # --- Top Recipients ---
-        elif finance_section == "Top Recipients":
-            st.subheader("Top Recipient Committees")
-            st.markdown("*Where Boone County donors send their money*")
-
-            top_n = st.slider("Number of committees to show", 10, 30, 15, key="finance_top_n")
-            top = get_top_committees(finance_data, top_n=top_n)
-
-            if not top.empty:
-                party_colors = {"D": "#3498db", "R": "#e74c3c", "Unknown": "#95a5a6"}
-
-                fig = px.bar(
-                    top.sort_values("total_amount"),
-                    x="total_amount",
-                    y="Committee",
-                    orientation="h",
-                    color="party_est",
-                    color_discrete_map=party_colors,
-                    title=f"Top {top_n} Recipient Committees (All Years)",
-                    labels={"total_amount": "Total ($)", "Committee": "", "party_est": "Party"},
-                    hover_data=["unique_donors", "contribution_count", "years_active"],
-                )
-                fig.update_layout(height=max(500, top_n * 28))
-                st.plotly_chart(fig, use_container_width=True)
+    # Top opportunities chart
+    chart_data = top_opps[top_opps["latest_d_pct"].notna()].copy()
+    if not chart_data.empty:
+        st.subheader("Top D Opportunities (by Last D Vote Share)")
+        fig = px.bar(
+            chart_data.sort_values("latest_d_pct"),
+            x="latest_d_pct",
+            y="race",
+            orientation="h",
+            color="latest_d_pct",
+            color_continuous_scale=["#e74c3c", "#f39c12", "#2ecc71"],
+            range_color=[25, 55],
+            title="",
+            labels={"latest_d_pct": "D Two-Party %", "race": ""},
+        )
+        fig.add_vline(x=50, line_dash="dash", line_color="gray",
+                      annotation_text="50% (Win)", annotation_position="top")
+        fig.update_layout(height=max(400, len(chart_data) * 35), showlegend=False)
+        st.plotly_chart(fig, use_container_width=True)
 
-                with st.expander("View committee data"):
-                    display_top = top.copy()
-                    display_top["total_amount"] = display_top["total_amount"].apply(lambda x: f"${x:,.0f}")
-                    st.dataframe(display_top, use_container_width=True, hide_index=True)
 
-        # --- Donor Geography ---
-        elif finance_section == "Donor Geography":
-            st.subheader("Donor Geography")
-            st.markdown("*Where in Boone County are political donors?*")
-
-            by_zip = finance_data.groupby(["zip_clean", "area", "year"]).agg(
-                total=("Amount", "sum"),
-                count=("Amount", "count"),
-                donors=("Name", "nunique"),
-            ).reset_index()
-
-            # Aggregate by area across all years
-            by_area_all = finance_data.groupby("area").agg(
-                total=("Amount", "sum"),
-                count=("Amount", "count"),
-                donors=("Name", "nunique"),
-                d_amount=("Amount", lambda x: x[finance_data.loc[x.index, "party_est"] == "D"].sum()),
-                r_amount=("Amount", lambda x: x[finance_data.loc[x.index, "party_est"] == "R"].sum()),
-            ).reset_index()
-            by_area_all["d_pct"] = (by_area_all["d_amount"] / by_area_all["total"] * 100).round(1)
-            by_area_all["avg_donation"] = (by_area_all["total"] / by_area_all["count"]).round(0)
-
-            col_left, col_right = st.columns(2)
-
-            with col_left:
-                fig = px.bar(
-                    by_area_all.sort_values("total"),
-                    x="total",
-                    y="area",
-                    orientation="h",
-                    color="total",
-                    color_continuous_scale=["#f39c12", "#2ecc71"],
-                    title="Total Contributions by Area",
-                    labels={"total": "Total ($)", "area": ""},
-                )
-                fig.update_layout(height=350, showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
-
-            with col_right:
-                fig2 = px.bar(
-                    by_area_all.sort_values("donors"),
-                    x="donors",
-                    y="area",
-                    orientation="h",
-                    color="donors",
-                    color_continuous_scale=["#e74c3c", "#3498db"],
-                    title="Unique Donors by Area",
-                    labels={"donors": "Unique Donors", "area": ""},
-                )
-                fig2.update_layout(height=350, showlegend=False)
-                st.plotly_chart(fig2, use_container_width=True)
+@st.fragment
+def _recruitment_section(uncontested):
+    st.subheader("Candidate Recruitment Targets")
+    st.markdown("""
+    These races had **no Democratic candidate in 2022**. Fielding a candidate — even in
+    a tough race — builds name recognition, develops the bench, and forces R to spend resources.
+    Races with historical D performance are higher-priority recruitment targets.
+    """)
 
-            # D share of donations by area
-            fig3 = px.bar(
-                by_area_all.sort_values("d_pct"),
-                x="d_pct",
-                y="area",
-                orientation="h",
-                color="d_pct",
-                color_continuous_scale=["#e74c3c", "#3498db"],
-                title="Democratic Share of Identifiable Donations by Area",
-                labels={"d_pct": "D Share %", "area": ""},
+    if uncontested.empty:
+        st.info("All 2022 races were contested by D candidates!")
+    else:
+        # Split into tiers
+        has_history = uncontested[uncontested["latest_d_pct"].notna()]
+        no_history = uncontested[uncontested["latest_d_pct"].isna()]
+
+        if not has_history.empty:
+            st.markdown("#### Previously Contested — Need Candidate Again")
+            st.markdown("These races had a D candidate in a prior cycle but went uncontested in 2022.")
+            display_cols = ["race", "level", "latest_d_pct", "latest_d_year", "d_contested", "action"]
+            display_df = has_history[display_cols].rename(columns={
+                "race": "Race", "level": "Level", "latest_d_pct": "Last D%",
+                "latest_d_year": "Last D Year", "d_contested": "D Contested",
+                "action": "Recommended Action",
+            })
+            st.dataframe(display_df, use_container_width=True, hide_index=True)
+
+        if not no_history.empty:
+            st.markdown("#### Never Contested — New Territory")
+            st.markdown("These races have never had a D challenger in our data (2014-2022). "
+                        "Township boards and trustees are often good entry-level races for new candidates.")
+            display_cols = ["race", "level", "action"]
+            display_df = no_history[display_cols].rename(columns={
+                "race": "Race", "level": "Level", "action": "Recommended Action",
+            })
+            st.dataframe(display_df, use_container_width=True, hide_index=True)
+
+        # Summary stats
+        st.markdown("---")
+        col1, col2 = st.columns(2)
+        with col1:
+            by_level = uncontested.groupby("level").size().reset_index(name="count")
+            fig = px.pie(
+                by_level,
+                names="level",
+                values="count",
+                title="Uncontested R Races by Level",
+                color_discrete_sequence=px.colors.qualitative.Set2,
             )
-            fig3.update_layout(height=350, showlegend=False)
-            st.plotly_chart(fig3, use_container_width=True)
+            fig.update_layout(height=350)
+            st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            st.markdown("#### Recruitment Priority")
+            st.markdown(f"- **{len(has_history)}** races with prior D performance — re-recruit")
+            st.markdown(f"- **{len(no_history)}** races never contested — build from scratch")
+            st.markdown(f"- **{len(uncontested)}** total recruitment targets")
+            st.markdown("")
+            st.markdown("**Tip:** Township trustee and board races are low-cost, high-value "
+                        "recruitment targets. They require minimal fundraising and build the "
+                        "local candidate pipeline.")
+
+
+@st.fragment
+def _trending_races_section(trend_races, history):
+    st.subheader("Races Trending Democratic")
+    st.markdown("These races show D vote share **increasing** across midterm cycles (2014→2018→2022).")
+
+    if trend_races.empty:
+        st.info("No races with measurable D trend across multiple cycles.")
+    else:
+        display_cols = ["race", "level", "latest_d_pct", "d_trend", "d_contested", "priority"]
+        display_df = trend_races[display_cols].rename(columns={
+            "race": "Race", "level": "Level", "latest_d_pct": "Last D%",
+            "d_trend": "D Trend (pts)", "d_contested": "D Contested", "priority": "Priority",
+        })
+        st.dataframe(display_df, use_container_width=True, hide_index=True)
+
+        # Trend chart: show D% across cycles for trending races
+        trending_names = trend_races["race"].head(10).tolist()
+        trend_history = history[
+            (history["normalized_name"].isin(trending_names)) &
+            (history["d_2party_pct"].notna()) &
+            (history["d_2party_pct"] > 0)
+        ].copy()
+
+        if not trend_history.empty:
+            fig = px.line(
+                trend_history,
+                x="year",
+                y="d_2party_pct",
+                color="normalized_name",
+                markers=True,
+                title="D Vote Share Trend Across Midterm Cycles",
+                labels={"d_2party_pct": "D Two-Party %", "year": "Election Year",
+                        "normalized_name": "Race"},
+            )
+            fig.add_hline(y=50, line_dash="dash", line_color="gray")
+            fig.update_layout(height=500)
+            st.plotly_chart(fig, use_container_width=True)
+
+            st.caption("Only races with D candidates in 2+ midterm cycles are shown. "
+                       "Trend = change from first to last contested midterm cycle.")
+
+
+@st.fragment
+def _historical_detail_section(races, history):
+    st.subheader("Full Historical Race Data")
+    st.markdown("Browse D performance for every race across midterm generals (2014, 2018, 2022).")
 
-            with st.expander("View geographic data"):
-                st.dataframe(by_area_all, use_container_width=True, hide_index=True)
+    # Pivot: race × year → D%
+    contested_history = history[
+        (history["d_2party_pct"].notna()) &
+        (history["d_2party_pct"] > 0)
+    ].copy()
 
-            st.caption("Areas match the Census demographic areas. "
-                       "D/R classification is estimated from committee names and may undercount both parties.")
+    if contested_history.empty:
+        st.info("No contested D vs R race data available.")
     else:
-        st.error("Failed to load campaign finance data. Check your internet connection.")
+        pivot = contested_history.pivot_table(
+            index=["normalized_name", "race_level"],
+            columns="year",
+            values="d_2party_pct",
+        ).reset_index()
+        pivot.columns.name = None
+        pivot = pivot.rename(columns={
+            "normalized_name": "Race",
+            "race_level": "Level",
+        })
+
+        # Add trend column if 2022 and at least one prior year exist
+        year_cols = [c for c in pivot.columns if c in ["2014", "2018", "2022"]]
+        if len(year_cols) >= 2:
+            def calc_trend(row):
+                vals = [row[y] for y in year_cols if pd.notna(row[y])]
+                if len(vals) >= 2:
+                    return round(vals[-1] - vals[0], 1)
+                return None
+            pivot["Trend"] = pivot.apply(calc_trend, axis=1)
+
+        pivot = pivot.sort_values("Level")
+        st.dataframe(pivot, use_container_width=True, hide_index=True, height=600)
+
+        # All races by level
+        st.markdown("---")
+        st.subheader("All 2022 Races by Level")
+        st.markdown("Complete list of races from 2022 (which will cycle again in 2026).")
+
+        level_counts = races.groupby("level").size().reset_index(name="count")
+        fig = px.bar(
+            level_counts.sort_values("count", ascending=False),
+            x="level",
+            y="count",
+            color="level",
+            title="2026 Expected Races by Level",
+            labels={"level": "Race Level", "count": "Number of Races"},
+            color_discrete_sequence=px.colors.qualitative.Set2,
+        )
+        fig.update_layout(height=350, showlegend=False)
+        st.plotly_chart(fig, use_container_width=True)
 
+        with st.expander("View all 2022 races (2026 preview)"):
+            all_display = races[["race", "level", "parties_2022", "candidates_2022"]].rename(columns={
+                "race": "Race", "level": "Level", "parties_2022": "Parties (2022)",
+                "candidates_2022": "Candidates (2022)",
+            })
+            st.dataframe(all_display, use_container_width=True, hide_index=True, height=500)
 
-# ============================================================
-# TAB 8: 2026 ELECTION PREP
-# ============================================================
-with tab8:
+
+def _render_2026_prep():
     st.header("2026 Election Prep")
     st.markdown("""
     **Indiana 2026 Midterm: Primary May 5 · General Nov 3**
@@ -1909,7 +2750,7 @@ with tab8:
         key="prep_section",
     )
 
-    target_data = get_2026_target_races()
+    target_data = _fetch_2026_targets(_data_version())
 
     if target_data["races"].empty:
         st.warning("Could not load 2026 target data.")
@@ -1921,250 +2762,462 @@ with tab8:
         history = target_data["history"]
 
         if prep_section == "Target Board":
-            st.subheader("2026 Target Board")
-            st.markdown("All expected 2026 races, prioritized by D competitiveness.")
-
-            # KPI row
-            kpi1, kpi2, kpi3, kpi4 = st.columns(4)
-            with kpi1:
-                st.metric("Total Races", len(races))
-            with kpi2:
-                high_count = len(races[races["priority"] == "High"])
-                st.metric("High Priority", high_count)
-            with kpi3:
-                recruit_count = len(races[races["priority"] == "Recruit"])
-                st.metric("Need Candidate", recruit_count)
-            with kpi4:
-                trending = len(trend_races)
-                st.metric("Trending D", trending)
-
-            # Priority filter
-            priority_filter = st.multiselect(
-                "Filter by priority",
-                ["High", "Medium", "Recruit", "Low"],
-                default=["High", "Medium", "Recruit"],
-                key="prep_priority_filter",
-            )
+            _target_board_section(races, top_opps, trend_races)
+        elif prep_section == "Recruitment Targets":
+            _recruitment_section(uncontested)
+        elif prep_section == "Trending Races":
+            _trending_races_section(trend_races, history)
+        elif prep_section == "Historical Detail":
+            _historical_detail_section(races, history)
 
-            level_filter = st.multiselect(
-                "Filter by level",
-                sorted(races["level"].unique()),
-                default=sorted(races["level"].unique()),
-                key="prep_level_filter",
-            )
 
-            filtered = races[
-                (races["priority"].isin(priority_filter)) &
-                (races["level"].isin(level_filter))
-            ].copy()
-
-            # Display columns
-            display_cols = ["race", "level", "priority", "latest_d_pct", "d_trend", "d_contested", "action"]
-            display_df = filtered[display_cols].copy()
-            display_df = display_df.rename(columns={
-                "race": "Race",
-                "level": "Level",
-                "priority": "Priority",
-                "latest_d_pct": "Last D%",
-                "d_trend": "D Trend",
-                "d_contested": "D Contested",
-                "action": "Recommended Action",
-            })
+# ============================================================
+# TAB 9: VOTER FILE ANALYSIS
+# ============================================================
+# Sections are fragments, as in Precinct Intel.
+
+@st.fragment
+def _voter_universe_section(vf):
+    st.subheader("Voter Universe Overview")
+
+    summary = get_voter_universe_summary(vf)
+
+    # KPI row
+    k1, k2, k3, k4 = st.columns(4)
+    with k1:
+        st.metric("Total Registered", f"{summary['total']:,}")
+    with k2:
+        st.metric("Active Voters", f"{summary['active']:,}")
+    with k3:
+        d_count = summary["party"].get("D", 0)
+        r_count = summary["party"].get("R", 0)
+        unaffiliated = summary["party"].get("", 0)
+        st.metric("D Primary Pullers", f"{d_count:,}")
+    with k4:
+        st.metric("Avg Turnout Score", f"{summary['avg_general_score']}/4")
+
+    # Party breakdown
+    col1, col2 = st.columns(2)
+    with col1:
+        party_data = pd.DataFrame([
+            {"Party": "Republican", "Count": r_count},
+            {"Party": "Democratic", "Count": d_count},
+            {"Party": "Unaffiliated", "Count": unaffiliated},
+        ])
+        fig_party = px.pie(
+            party_data,
+            names="Party",
+            values="Count",
+            title="Voter Registration by Primary Pull",
+            color="Party",
+            color_discrete_map={
+                "Republican": "#e74c3c",
+                "Democratic": "#3498db",
+                "Unaffiliated": "#95a5a6",
+            },
+        )
+        fig_party.update_layout(height=350)
+        st.plotly_chart(fig_party, use_container_width=True)
+
+    with col2:
+        vt_data = pd.DataFrame([
+            {"Type": t, "Count": summary["voter_type"].get(t, 0)}
+            for t in ["Super Voter", "Regular", "Occasional", "Inactive"]
+        ])
+        fig_vt = px.pie(
+            vt_data,
+            names="Type",
+            values="Count",
+            title="Voter Engagement Types",
+            color="Type",
+            color_discrete_map={
+                "Super Voter": "#27ae60",
+                "Regular": "#2ecc71",
+                "Occasional": "#f39c12",
+                "Inactive": "#e74c3c",
+            },
+        )
+        fig_vt.update_layout(height=350)
+        st.plotly_chart(fig_vt, use_container_width=True)
+
+    # Area summary table
+    st.subheader("Voter Summary by Area")
+    area_summary = get_area_voter_summary(vf)
+    if not area_summary.empty:
+        st.dataframe(area_summary, use_container_width=True, hide_index=True)
+
+    # Age distribution
+    col3, col4 = st.columns(2)
+    with col3:
+        age_data = pd.DataFrame([
+            {"Age Group": ag, "Count": summary["age_group"].get(ag, 0)}
+            for ag in ["18-29", "30-44", "45-64", "65+"]
+        ])
+        fig_age = px.bar(
+            age_data,
+            x="Age Group",
+            y="Count",
+            title="Voter Age Distribution",
+            color="Age Group",
+            color_discrete_sequence=px.colors.qualitative.Set2,
+        )
+        fig_age.update_layout(height=350, showlegend=False)
+        st.plotly_chart(fig_age, use_container_width=True)
+
+    with col4:
+        gender_data = pd.DataFrame([
+            {"Gender": g, "Count": summary["gender"].get(g, 0)}
+            for g in ["F", "M"]
+        ])
+        fig_gender = px.pie(
+            gender_data,
+            names="Gender",
+            values="Count",
+            title="Voter Gender Distribution",
+            color="Gender",
+            color_discrete_map={"F": "#9b59b6", "M": "#3498db"},
+        )
+        fig_gender.update_layout(height=350)
+        st.plotly_chart(fig_gender, use_container_width=True)
 
-            st.dataframe(
-                display_df.sort_values(["Priority", "Last D%"], ascending=[True, False]),
-                use_container_width=True,
-                hide_index=True,
-                height=600,
-            )
 
-            # Top opportunities chart
-            chart_data = top_opps[top_opps["latest_d_pct"].notna()].copy()
-            if not chart_data.empty:
-                st.subheader("Top D Opportunities (by Last D Vote Share)")
-                fig = px.bar(
-                    chart_data.sort_values("latest_d_pct"),
-                    x="latest_d_pct",
-                    y="race",
-                    orientation="h",
-                    color="latest_d_pct",
-                    color_continuous_scale=["#e74c3c", "#f39c12", "#2ecc71"],
-                    range_color=[25, 55],
-                    title="",
-                    labels={"latest_d_pct": "D Two-Party %", "race": ""},
-                )
-                fig.add_vline(x=50, line_dash="dash", line_color="gray",
-                              annotation_text="50% (Win)", annotation_position="top")
-                fig.update_layout(height=max(400, len(chart_data) * 35), showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
+@st.fragment
+def _turnout_scoring_section(vf):
+    st.subheader("Voter Turnout Analysis")
+    st.markdown("""
+    Voters scored by how many of the last 4 general elections they voted in (0-4).
+    **Super Voters** (4/4) are the reliable base. **Surge voters** (voted 2020 but
+    not 2022) are the #1 mobilization target for 2026.
+    """)
 
-        elif prep_section == "Recruitment Targets":
-            st.subheader("Candidate Recruitment Targets")
-            st.markdown("""
-            These races had **no Democratic candidate in 2022**. Fielding a candidate — even in
-            a tough race — builds name recognition, develops the bench, and forces R to spend resources.
-            Races with historical D performance are higher-priority recruitment targets.
-            """)
+    scored = get_turnout_scored_voters(vf)
 
-            if uncontested.empty:
-                st.info("All 2022 races were contested by D candidates!")
-            else:
-                # Split into tiers
-                has_history = uncontested[uncontested["latest_d_pct"].notna()]
-                no_history = uncontested[uncontested["latest_d_pct"].isna()]
-
-                if not has_history.empty:
-                    st.markdown("#### Previously Contested — Need Candidate Again")
-                    st.markdown("These races had a D candidate in a prior cycle but went uncontested in 2022.")
-                    display_cols = ["race", "level", "latest_d_pct", "latest_d_year", "d_contested", "action"]
-                    display_df = has_history[display_cols].rename(columns={
-                        "race": "Race", "level": "Level", "latest_d_pct": "Last D%",
-                        "latest_d_year": "Last D Year", "d_contested": "D Contested",
-                        "action": "Recommended Action",
-                    })
-                    st.dataframe(display_df, use_container_width=True, hide_index=True)
-
-                if not no_history.empty:
-                    st.markdown("#### Never Contested — New Territory")
-                    st.markdown("These races have never had a D challenger in our data (2014-2022). "
-                                "Township boards and trustees are often good entry-level races for new candidates.")
-                    display_cols = ["race", "level", "action"]
-                    display_df = no_history[display_cols].rename(columns={
-                        "race": "Race", "level": "Level", "action": "Recommended Action",
-                    })
-                    st.dataframe(display_df, use_container_width=True, hide_index=True)
-
-                # Summary stats
-                st.markdown("---")
-                col1, col2 = st.columns(2)
-                with col1:
-                    by_level = uncontested.groupby("level").size().reset_index(name="count")
-                    fig = px.pie(
-                        by_level,
-                        names="level",
-                        values="count",
-                        title="Uncontested R Races by Level",
-                        color_discrete_sequence=px.colors.qualitative.Set2,
-                    )
-                    fig.update_layout(height=350)
-                    st.plotly_chart(fig, use_container_width=True)
-                with col2:
-                    st.markdown("#### Recruitment Priority")
-                    st.markdown(f"- **{len(has_history)}** races with prior D performance — re-recruit")
-                    st.markdown(f"- **{len(no_history)}** races never contested — build from scratch")
-                    st.markdown(f"- **{len(uncontested)}** total recruitment targets")
-                    st.markdown("")
-                    st.markdown("**Tip:** Township trustee and board races are low-cost, high-value "
-                                "recruitment targets. They require minimal fundraising and build the "
-                                "local candidate pipeline.")
+    # KPI row
+    k1, k2, k3, k4 = st.columns(4)
+    with k1:
+        st.metric(
+            "Super Voters (4/4)",
+            f"{len(scored[scored['voter_type'] == 'Super Voter']):,}",
+        )
+    with k2:
+        surge_count = int(scored["surge_2020"].sum())
+        st.metric("Surge 2020 Voters", f"{surge_count:,}")
+    with k3:
+        dropoff_count = int(scored["dropoff"].sum())
+        st.metric("Drop-Off Voters", f"{dropoff_count:,}")
+    with k4:
+        activator_count = int(scored["new_activator"].sum())
+        st.metric("New Activators", f"{activator_count:,}")
+
+    # Propensity distribution by area
+    col1, col2 = st.columns(2)
+    with col1:
+        prop_area = scored.groupby(["Area", "propensity"]).size().reset_index(name="count")
+        fig_prop = px.bar(
+            prop_area,
+            x="Area",
+            y="count",
+            color="propensity",
+            title="Voter Propensity by Area",
+            barmode="stack",
+            color_discrete_map={
+                "High": "#27ae60", "Medium": "#f39c12",
+                "Low": "#e67e22", "None": "#e74c3c",
+            },
+            category_orders={"propensity": ["High", "Medium", "Low", "None"]},
+        )
+        fig_prop.update_layout(height=400)
+        st.plotly_chart(fig_prop, use_container_width=True)
+
+    with col2:
+        gs_dist = scored["general_score"].value_counts().sort_index().reset_index()
+        gs_dist.columns = ["Elections Voted (of 4)", "Voters"]
+        fig_gs = px.bar(
+            gs_dist,
+            x="Elections Voted (of 4)",
+            y="Voters",
+            title="General Election Participation Distribution",
+            color="Elections Voted (of 4)",
+            color_continuous_scale=["#e74c3c", "#f39c12", "#27ae60"],
+        )
+        fig_gs.update_layout(height=400, showlegend=False)
+        st.plotly_chart(fig_gs, use_container_width=True)
 
-        elif prep_section == "Trending Races":
-            st.subheader("Races Trending Democratic")
-            st.markdown("These races show D vote share **increasing** across midterm cycles (2014→2018→2022).")
+    # Surge voters breakdown
+    st.subheader("Surge 2020 Voters (Mobilization Targets)")
+    st.markdown("""
+    These voters showed up for the 2020 presidential election but **skipped
+    the 2022 midterm**. They're proven voters who can be re-activated with
+    the right outreach. This is your #1 GOTV target list for 2026.
+    """)
+    surge = scored[scored["surge_2020"]].copy()
+    surge_by_area = surge.groupby("Area").agg(
+        count=("VANID", "count"),
+        d_primary=("Party", lambda x: (x == "D").sum()),
+        unaffiliated=("Party", lambda x: (x == "").sum()),
+        avg_age=("Age", "mean"),
+    ).reset_index()
+    surge_by_area["avg_age"] = surge_by_area["avg_age"].round(1)
+    surge_by_area = surge_by_area.sort_values("count", ascending=False)
+    surge_by_area.columns = ["Area", "Surge Voters", "D Primary", "Unaffiliated", "Avg Age"]
+    st.dataframe(surge_by_area, use_container_width=True, hide_index=True)
+
+    # Election-by-election participation
+    st.subheader("Election-by-Election Participation")
+    election_rates = []
+    for ename in ["General2024", "General2022", "General2020", "General2018",
+                  "Primary2024", "Primary2022", "Primary2020", "Primary2018"]:
+        voted = (scored[ename] == "Y").sum()
+        rate = voted / len(scored) * 100
+        etype = "General" if "General" in ename else "Primary"
+        election_rates.append({
+            "Election": ename, "Type": etype,
+            "Voted": voted, "Rate %": round(rate, 1),
+        })
+    er_df = pd.DataFrame(election_rates)
+    fig_er = px.bar(
+        er_df,
+        x="Election",
+        y="Rate %",
+        color="Type",
+        title="Participation Rate by Election",
+        color_discrete_map={"General": "#3498db", "Primary": "#e67e22"},
+    )
+    fig_er.update_layout(height=400)
+    st.plotly_chart(fig_er, use_container_width=True)
 
-            if trend_races.empty:
-                st.info("No races with measurable D trend across multiple cycles.")
-            else:
-                display_cols = ["race", "level", "latest_d_pct", "d_trend", "d_contested", "priority"]
-                display_df = trend_races[display_cols].rename(columns={
-                    "race": "Race", "level": "Level", "latest_d_pct": "Last D%",
-                    "d_trend": "D Trend (pts)", "d_contested": "D Contested", "priority": "Priority",
-                })
-                st.dataframe(display_df, use_container_width=True, hide_index=True)
-
-                # Trend chart: show D% across cycles for trending races
-                trending_names = trend_races["race"].head(10).tolist()
-                trend_history = history[
-                    (history["normalized_name"].isin(trending_names)) &
-                    (history["d_2party_pct"].notna()) &
-                    (history["d_2party_pct"] > 0)
-                ].copy()
-
-                if not trend_history.empty:
-                    fig = px.line(
-                        trend_history,
-                        x="year",
-                        y="d_2party_pct",
-                        color="normalized_name",
-                        markers=True,
-                        title="D Vote Share Trend Across Midterm Cycles",
-                        labels={"d_2party_pct": "D Two-Party %", "year": "Election Year",
-                                "normalized_name": "Race"},
-                    )
-                    fig.add_hline(y=50, line_dash="dash", line_color="gray")
-                    fig.update_layout(height=500)
-                    st.plotly_chart(fig, use_container_width=True)
 
-                    st.caption("Only races with D candidates in 2+ midterm cycles are shown. "
-                               "Trend = change from first to last contested midterm cycle.")
+@st.fragment
+def _persuasion_section(vf):
+    st.subheader("Persuasion Target Universe")
+    st.markdown("""
+    Voters who are **unaffiliated or D-leaning**, **actively voting**, and live
+    in **competitive areas**. These are the people worth knocking doors for.
+    Sorted by priority score (higher = more valuable to contact).
+    """)
 
-        elif prep_section == "Historical Detail":
-            st.subheader("Full Historical Race Data")
-            st.markdown("Browse D performance for every race across midterm generals (2014, 2018, 2022).")
+    targets = get_persuasion_targets(vf)
 
-            # Pivot: race × year → D%
-            contested_history = history[
-                (history["d_2party_pct"].notna()) &
-                (history["d_2party_pct"] > 0)
-            ].copy()
+    if targets.empty:
+        st.info("No persuasion targets identified.")
+    else:
+        # KPI row
+        k1, k2, k3, k4 = st.columns(4)
+        with k1:
+            st.metric("Total Targets", f"{len(targets):,}")
+        with k2:
+            high_priority = len(targets[targets["priority_score"] >= 8])
+            st.metric("High Priority (8+)", f"{high_priority:,}")
+        with k3:
+            in_zville = len(targets[targets["Area"] == "Zionsville/Whitestown"])
+            st.metric("In Zionsville Area", f"{in_zville:,}")
+        with k4:
+            has_phone = targets["Phone"].notna().sum()
+            st.metric("Have Phone #", f"{int(has_phone):,}")
 
-            if contested_history.empty:
-                st.info("No contested D vs R race data available.")
-            else:
-                pivot = contested_history.pivot_table(
-                    index=["normalized_name", "race_level"],
-                    columns="year",
-                    values="d_2party_pct",
-                ).reset_index()
-                pivot.columns.name = None
-                pivot = pivot.rename(columns={
-                    "normalized_name": "Race",
-                    "race_level": "Level",
-                })
-
-                # Add trend column if 2022 and at least one prior year exist
-                year_cols = [c for c in pivot.columns if c in ["2014", "2018", "2022"]]
-                if len(year_cols) >= 2:
-                    def calc_trend(row):
-                        vals = [row[y] for y in year_cols if pd.notna(row[y])]
-                        if len(vals) >= 2:
-                            return round(vals[-1] - vals[0], 1)
-                        return None
-                    pivot["Trend"] = pivot.apply(calc_trend, axis=1)
-
-                pivot = pivot.sort_values("Level")
-                st.dataframe(pivot, use_container_width=True, hide_index=True, height=600)
-
-                # All races by level
-                st.markdown("---")
-                st.subheader("All 2022 Races by Level")
-                st.markdown("Complete list of races from 2022 (which will cycle again in 2026).")
-
-                level_counts = races.groupby("level").size().reset_index(name="count")
-                fig = px.bar(
-                    level_counts.sort_values("count", ascending=False),
-                    x="level",
-                    y="count",
-                    color="level",
-                    title="2026 Expected Races by Level",
-                    labels={"level": "Race Level", "count": "Number of Races"},
-                    color_discrete_sequence=px.colors.qualitative.Set2,
-                )
-                fig.update_layout(height=350, showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            target_area = targets["Area"].value_counts().reset_index()
+            target_area.columns = ["Area", "Targets"]
+            fig_ta = px.bar(
+                target_area.sort_values("Targets"),
+                x="Targets",
+                y="Area",
+                orientation="h",
+                title="Persuasion Targets by Area",
+                color="Targets",
+                color_continuous_scale=["#f39c12", "#27ae60"],
+            )
+            fig_ta.update_layout(height=350, showlegend=False)
+            st.plotly_chart(fig_ta, use_container_width=True)
 
-                with st.expander("View all 2022 races (2026 preview)"):
-                    all_display = races[["race", "level", "parties_2022", "candidates_2022"]].rename(columns={
-                        "race": "Race", "level": "Level", "parties_2022": "Parties (2022)",
-                        "candidates_2022": "Candidates (2022)",
-                    })
-                    st.dataframe(all_display, use_container_width=True, hide_index=True, height=500)
+        with col2:
+            score_dist = targets["priority_score"].value_counts().sort_index().reset_index()
+            score_dist.columns = ["Priority Score", "Count"]
+            fig_sd = px.bar(
+                score_dist,
+                x="Priority Score",
+                y="Count",
+                title="Target Priority Score Distribution",
+                color="Priority Score",
+                color_continuous_scale=["#e74c3c", "#f39c12", "#27ae60"],
+            )
+            fig_sd.update_layout(height=350, showlegend=False)
+            st.plotly_chart(fig_sd, use_container_width=True)
 
+        col3, col4 = st.columns(2)
+        with col3:
+            target_age = targets["age_group"].value_counts().reset_index()
+            target_age.columns = ["Age Group", "Count"]
+            fig_tage = px.pie(
+                target_age,
+                names="Age Group",
+                values="Count",
+                title="Target Age Distribution",
+                color_discrete_sequence=px.colors.qualitative.Set2,
+            )
+            fig_tage.update_layout(height=350)
+            st.plotly_chart(fig_tage, use_container_width=True)
+
+        with col4:
+            target_party = targets["Party"].value_counts().reset_index()
+            target_party.columns = ["Party", "Count"]
+            target_party["Party"] = target_party["Party"].replace("", "Unaffiliated")
+            fig_tp = px.pie(
+                target_party,
+                names="Party",
+                values="Count",
+                title="Target Party Affiliation",
+                color="Party",
+                color_discrete_map={
+                    "D": "#3498db",
+                    "Unaffiliated": "#95a5a6",
+                },
+            )
+            fig_tp.update_layout(height=350)
+            st.plotly_chart(fig_tp, use_container_width=True)
+
+        # Sample of top targets
+        st.subheader("Top Priority Targets (Sample)")
+        display_cols = [
+            "PrecinctName", "Area", "Party", "Age", "Gender",
+            "general_score", "voter_type", "priority_score",
+            "surge_2020",
+        ]
+        rename_map = {
+            "PrecinctName": "Precinct", "general_score": "Gen Score (0-4)",
+            "voter_type": "Voter Type", "priority_score": "Priority",
+            "surge_2020": "Surge 2020",
+        }
+        top_sample = targets.head(100)[display_cols].rename(columns=rename_map)
+        st.dataframe(top_sample, use_container_width=True, hide_index=True, height=400)
+
+        st.caption("Priority score combines area competitiveness, turnout history, "
+                   "party affiliation, surge voter status, and age. "
+                   "Higher = more valuable to contact.")
+
+
+@st.fragment
+def _precinct_drilldown_section(vf):
+    st.subheader("Precinct Voter Profile")
+
+    precinct_list = sorted(vf["PrecinctName"].unique())
+    selected_precinct = st.selectbox(
+        "Select Precinct",
+        precinct_list,
+        key="vf_precinct_select",
+    )
 
-# ============================================================
-# TAB 9: VOTER FILE ANALYSIS
-# ============================================================
-with tab9:
+    profile = get_precinct_voter_profile(vf, selected_precinct)
+
+    if not profile:
+        st.warning("No data for this precinct.")
+    else:
+        # KPI row
+        k1, k2, k3, k4 = st.columns(4)
+        with k1:
+            st.metric("Total Voters", f"{profile['total_voters']:,}")
+        with k2:
+            st.metric("Active", f"{profile['active']:,}")
+        with k3:
+            st.metric("D Primary %", f"{profile['d_primary_pct']}%")
+        with k4:
+            st.metric("2024 Turnout", f"{profile['general_2024_turnout']}%")
+
+        st.markdown(f"**Area:** {profile['area']} | "
+                    f"**Avg Age:** {profile['avg_age']} | "
+                    f"**Avg General Score:** {profile['avg_general_score']}/4 | "
+                    f"**Surge 2020 Voters:** {profile['surge_2020_count']}")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            party_bd = profile["party_breakdown"]
+            party_data = pd.DataFrame([
+                {"Party": "Republican", "Count": party_bd.get("R", 0)},
+                {"Party": "Democratic", "Count": party_bd.get("D", 0)},
+                {"Party": "Unaffiliated", "Count": party_bd.get("", 0)},
+            ])
+            fig_pp = px.pie(
+                party_data,
+                names="Party",
+                values="Count",
+                title="Party (Primary Pull)",
+                color="Party",
+                color_discrete_map={
+                    "Republican": "#e74c3c",
+                    "Democratic": "#3498db",
+                    "Unaffiliated": "#95a5a6",
+                },
+            )
+            fig_pp.update_layout(height=300)
+            st.plotly_chart(fig_pp, use_container_width=True)
+
+        with col2:
+            vt_bd = profile["voter_type_breakdown"]
+            vt_data = pd.DataFrame([
+                {"Type": t, "Count": vt_bd.get(t, 0)}
+                for t in ["Super Voter", "Regular", "Occasional", "Inactive"]
+            ])
+            fig_vtp = px.pie(
+                vt_data,
+                names="Type",
+                values="Count",
+                title="Voter Engagement Types",
+                color="Type",
+                color_discrete_map={
+                    "Super Voter": "#27ae60", "Regular": "#2ecc71",
+                    "Occasional": "#f39c12", "Inactive": "#e74c3c",
+                },
+            )
+            fig_vtp.update_layout(height=300)
+            st.plotly_chart(fig_vtp, use_container_width=True)
+
+        col3, col4 = st.columns(2)
+        with col3:
+            age_bd = profile["age_breakdown"]
+            age_data = pd.DataFrame([
+                {"Age Group": ag, "Count": age_bd.get(ag, 0)}
+                for ag in ["18-29", "30-44", "45-64", "65+"]
+            ])
+            fig_ap = px.bar(
+                age_data,
+                x="Age Group",
+                y="Count",
+                title="Age Distribution",
+                color="Age Group",
+                color_discrete_sequence=px.colors.qualitative.Set2,
+            )
+            fig_ap.update_layout(height=300, showlegend=False)
+            st.plotly_chart(fig_ap, use_container_width=True)
+
+        with col4:
+            st.markdown("#### Contact Info")
+            st.markdown(f"- **Has Phone:** {profile['has_phone_pct']}%")
+            st.markdown(f"- **Has Email:** {profile['has_email_pct']}%")
+            st.markdown("")
+            st.markdown("#### Voter History")
+            pct_voters = vf[vf["PrecinctName"] == selected_precinct]
+            for ename in ["General2024", "General2022", "General2020", "General2018"]:
+                rate = (pct_voters[ename] == "Y").sum() / max(len(pct_voters), 1) * 100
+                st.markdown(f"- **{ename}:** {rate:.1f}%")
+
+        # Voter detail table
+        with st.expander("View individual voter records"):
+            pct_display = vf[vf["PrecinctName"] == selected_precinct].copy()
+            display_cols = [
+                "VANID", "FirstName", "LastName", "Age", "Gender", "Party",
+                "voter_type", "general_score", "General2024", "General2022",
+                "General2020", "General2018",
+            ]
+            st.dataframe(
+                pct_display[display_cols].sort_values("general_score", ascending=False),
+                use_container_width=True,
+                hide_index=True,
+                height=400,
+            )
+
+
+def _render_voter_file():
     st.header("Voter File Analysis")
 
     # Try to load voter file
@@ -2195,7 +3248,7 @@ with tab9:
             ```
             This creates 62,000 realistic fake voter records for development.
             """)
-            st.stop()
+            return
 
     @st.cache_data(ttl=3600)
     def _load_voter_data(path):
@@ -2219,437 +3272,32 @@ with tab9:
         )
 
         if vf_section == "Voter Universe":
-            st.subheader("Voter Universe Overview")
-
-            summary = get_voter_universe_summary(vf)
-
-            # KPI row
-            k1, k2, k3, k4 = st.columns(4)
-            with k1:
-                st.metric("Total Registered", f"{summary['total']:,}")
-            with k2:
-                st.metric("Active Voters", f"{summary['active']:,}")
-            with k3:
-                d_count = summary["party"].get("D", 0)
-                r_count = summary["party"].get("R", 0)
-                unaffiliated = summary["party"].get("", 0)
-                st.metric("D Primary Pullers", f"{d_count:,}")
-            with k4:
-                st.metric("Avg Turnout Score", f"{summary['avg_general_score']}/4")
-
-            # Party breakdown
-            col1, col2 = st.columns(2)
-            with col1:
-                party_data = pd.DataFrame([
-                    {"Party": "Republican", "Count": r_count},
-                    {"Party": "Democratic", "Count": d_count},
-                    {"Party": "Unaffiliated", "Count": unaffiliated},
-                ])
-                fig_party = px.pie(
-                    party_data,
-                    names="Party",
-                    values="Count",
-                    title="Voter Registration by Primary Pull",
-                    color="Party",
-                    color_discrete_map={
-                        "Republican": "#e74c3c",
-                        "Democratic": "#3498db",
-                        "Unaffiliated": "#95a5a6",
-                    },
-                )
-                fig_party.update_layout(height=350)
-                st.plotly_chart(fig_party, use_container_width=True)
-
-            with col2:
-                vt_data = pd.DataFrame([
-                    {"Type": t, "Count": summary["voter_type"].get(t, 0)}
-                    for t in ["Super Voter", "Regular", "Occasional", "Inactive"]
-                ])
-                fig_vt = px.pie(
-                    vt_data,
-                    names="Type",
-                    values="Count",
-                    title="Voter Engagement Types",
-                    color="Type",
-                    color_discrete_map={
-                        "Super Voter": "#27ae60",
-                        "Regular": "#2ecc71",
-                        "Occasional": "#f39c12",
-                        "Inactive": "#e74c3c",
-                    },
-                )
-                fig_vt.update_layout(height=350)
-                st.plotly_chart(fig_vt, use_container_width=True)
-
-            # Area summary table
-            st.subheader("Voter Summary by Area")
-            area_summary = get_area_voter_summary(vf)
-            if not area_summary.empty:
-                st.dataframe(area_summary, use_container_width=True, hide_index=True)
-
-            # Age distribution
-            col3, col4 = st.columns(2)
-            with col3:
-                age_data = pd.DataFrame([
-                    {"Age Group": ag, "Count": summary["age_group"].get(ag, 0)}
-                    for ag in ["18-29", "30-44", "45-64", "65+"]
-                ])
-                fig_age = px.bar(
-                    age_data,
-                    x="Age Group",
-                    y="Count",
-                    title="Voter Age Distribution",
-                    color="Age Group",
-                    color_discrete_sequence=px.colors.qualitative.Set2,
-                )
-                fig_age.update_layout(height=350, showlegend=False)
-                st.plotly_chart(fig_age, use_container_width=True)
-
-            with col4:
-                gender_data = pd.DataFrame([
-                    {"Gender": g, "Count": summary["gender"].get(g, 0)}
-                    for g in ["F", "M"]
-                ])
-                fig_gender = px.pie(
-                    gender_data,
-                    names="Gender",
-                    values="Count",
-                    title="Voter Gender Distribution",
-                    color="Gender",
-                    color_discrete_map={"F": "#9b59b6", "M": "#3498db"},
-                )
-                fig_gender.update_layout(height=350)
-                st.plotly_chart(fig_gender, use_container_width=True)
-
+            _voter_universe_section(vf)
         elif vf_section == "Turnout Scoring":
-            st.subheader("Voter Turnout Analysis")
-            st.markdown("""
-            Voters scored by how many of the last 4 general elections they voted in (0-4).
-            **Super Voters** (4/4) are the reliable base. **Surge voters** (voted 2020 but
-            not 2022) are the #1 mobilization target for 2026.
-            """)
-
-            scored = get_turnout_scored_voters(vf)
-
-            # KPI row
-            k1, k2, k3, k4 = st.columns(4)
-            with k1:
-                st.metric(
-                    "Super Voters (4/4)",
-                    f"{len(scored[scored['voter_type'] == 'Super Voter']):,}",
-                )
-            with k2:
-                surge_count = int(scored["surge_2020"].sum())
-                st.metric("Surge 2020 Voters", f"{surge_count:,}")
-            with k3:
-                dropoff_count = int(scored["dropoff"].sum())
-                st.metric("Drop-Off Voters", f"{dropoff_count:,}")
-            with k4:
-                activator_count = int(scored["new_activator"].sum())
-                st.metric("New Activators", f"{activator_count:,}")
-
-            # Propensity distribution by area
-            col1, col2 = st.columns(2)
-            with col1:
-                prop_area = scored.groupby(["Area", "propensity"]).size().reset_index(name="count")
-                fig_prop = px.bar(
-                    prop_area,
-                    x="Area",
-                    y="count",
-                    color="propensity",
-                    title="Voter Propensity by Area",
-                    barmode="stack",
-                    color_discrete_map={
-                        "High": "#27ae60", "Medium": "#f39c12",
-                        "Low": "#e67e22", "None": "#e74c3c",
-                    },
-                    category_orders={"propensity": ["High", "Medium", "Low", "None"]},
-                )
-                fig_prop.update_layout(height=400)
-                st.plotly_chart(fig_prop, use_container_width=True)
-
-            with col2:
-                gs_dist = scored["general_score"].value_counts().sort_index().reset_index()
-                gs_dist.columns = ["Elections Voted (of 4)", "Voters"]
-                fig_gs = px.bar(
-                    gs_dist,
-                    x="Elections Voted (of 4)",
-                    y="Voters",
-                    title="General Election Participation Distribution",
-                    color="Elections Voted (of 4)",
-                    color_continuous_scale=["#e74c3c", "#f39c12", "#27ae60"],
-                )
-                fig_gs.update_layout(height=400, showlegend=False)
-                st.plotly_chart(fig_gs, use_container_width=True)
-
-            # Surge voters breakdown
-            st.subheader("Surge 2020 Voters (Mobilization Targets)")
-            st.markdown("""
-            These voters showed up for the 2020 presidential election but **skipped
-            the 2022 midterm**. They're proven voters who can be re-activated with
-            the right outreach. This is your #1 GOTV target list for 2026.
-            """)
-            surge = scored[scored["surge_2020"]].copy()
-            surge_by_area = surge.groupby("Area").agg(
-                count=("VANID", "count"),
-                d_primary=("Party", lambda x: (x == "D").sum()),
-                unaffiliated=("Party", lambda x: (x == "").sum()),
-                avg_age=("Age", "mean"),
-            ).reset_index()
-            surge_by_area["avg_age"] = surge_by_area["avg_age"].round(1)
-            surge_by_area = surge_by_area.sort_values("count", ascending=False)
-            surge_by_area.columns = ["Area", "Surge Voters", "D Primary", "Unaffiliated", "Avg Age"]
-            st.dataframe(surge_by_area, use_container_width=True, hide_index=True)
-
-            # Election-by-election participation
-            st.subheader("Election-by-Election Participation")
-            election_rates = []
-            for ename in ["General2024", "General2022", "General2020", "General2018",
-                          "Primary2024", "Primary2022", "Primary2020", "Primary2018"]:
-                voted = (scored[ename] == "Y").sum()
-                rate = voted / len(scored) * 100
-                etype = "General" if "General" in ename else "Primary"
-                election_rates.append({
-                    "Election": ename, "Type": etype,
-                    "Voted": voted, "Rate %": round(rate, 1),
-                })
-            er_df = pd.DataFrame(election_rates)
-            fig_er = px.bar(
-                er_df,
-                x="Election",
-                y="Rate %",
-                color="Type",
-                title="Participation Rate by Election",
-                color_discrete_map={"General": "#3498db", "Primary": "#e67e22"},
-            )
-            fig_er.update_layout(height=400)
-            st.plotly_chart(fig_er, use_container_width=True)
-
+            _turnout_scoring_section(vf)
         elif vf_section == "Persuasion Targets":
-            st.subheader("Persuasion Target Universe")
-            st.markdown("""
-            Voters who are **unaffiliated or D-leaning**, **actively voting**, and live
-            in **competitive areas**. These are the people worth knocking doors for.
-            Sorted by priority score (higher = more valuable to contact).
-            """)
-
-            targets = get_persuasion_targets(vf)
-
-            if targets.empty:
-                st.info("No persuasion targets identified.")
-            else:
-                # KPI row
-                k1, k2, k3, k4 = st.columns(4)
-                with k1:
-                    st.metric("Total Targets", f"{len(targets):,}")
-                with k2:
-                    high_priority = len(targets[targets["priority_score"] >= 8])
-                    st.metric("High Priority (8+)", f"{high_priority:,}")
-                with k3:
-                    in_zville = len(targets[targets["Area"] == "Zionsville/Whitestown"])
-                    st.metric("In Zionsville Area", f"{in_zville:,}")
-                with k4:
-                    has_phone = targets["Phone"].notna().sum()
-                    st.metric("Have Phone #", f"{int(has_phone):,}")
-
-                col1, col2 = st.columns(2)
-                with col1:
-                    target_area = targets["Area"].value_counts().reset_index()
-                    target_area.columns = ["Area", "Targets"]
-                    fig_ta = px.bar(
-                        target_area.sort_values("Targets"),
-                        x="Targets",
-                        y="Area",
-                        orientation="h",
-                        title="Persuasion Targets by Area",
-                        color="Targets",
-                        color_continuous_scale=["#f39c12", "#27ae60"],
-                    )
-                    fig_ta.update_layout(height=350, showlegend=False)
-                    st.plotly_chart(fig_ta, use_container_width=True)
-
-                with col2:
-                    score_dist = targets["priority_score"].value_counts().sort_index().reset_index()
-                    score_dist.columns = ["Priority Score", "Count"]
-                    fig_sd = px.bar(
-                        score_dist,
-                        x="Priority Score",
-                        y="Count",
-                        title="Target Priority Score Distribution",
-                        color="Priority Score",
-                        color_continuous_scale=["#e74c3c", "#f39c12", "#27ae60"],
-                    )
-                    fig_sd.update_layout(height=350, showlegend=False)
-                    st.plotly_chart(fig_sd, use_container_width=True)
-
-                col3, col4 = st.columns(2)
-                with col3:
-                    target_age = targets["age_group"].value_counts().reset_index()
-                    target_age.columns = ["Age Group", "Count"]
-                    fig_tage = px.pie(
-                        target_age,
-                        names="Age Group",
-                        values="Count",
-                        title="Target Age Distribution",
-                        color_discrete_sequence=px.colors.qualitative.Set2,
-                    )
-                    fig_tage.update_layout(height=350)
-                    st.plotly_chart(fig_tage, use_container_width=True)
-
-                with col4:
-                    target_party = targets["Party"].value_counts().reset_index()
-                    target_party.columns = ["Party", "Count"]
-                    target_party["Party"] = target_party["Party"].replace("", "Unaffiliated")
-                    fig_tp = px.pie(
-                        target_party,
-                        names="Party",
-                        values="Count",
-                        title="Target Party Affiliation",
-                        color="Party",
-                        color_discrete_map={
-                            "D": "#3498db",
-                            "Unaffiliated": "#95a5a6",
-                        },
-                    )
-                    fig_tp.update_layout(height=350)
-                    st.plotly_chart(fig_tp, use_container_width=True)
-
-                # Sample of top targets
-                st.subheader("Top Priority Targets (Sample)")
-                display_cols = [
-                    "PrecinctName", "Area", "Party", "Age", "Gender",
-                    "general_score", "voter_type", "priority_score",
-                    "surge_2020",
-                ]
-                rename_map = {
-                    "PrecinctName": "Precinct", "general_score": "Gen Score (0-4)",
-                    "voter_type": "Voter Type", "priority_score": "Priority",
-                    "surge_2020": "Surge 2020",
-                }
-                top_sample = targets.head(100)[display_cols].rename(columns=rename_map)
-                st.dataframe(top_sample, use_container_width=True, hide_index=True, height=400)
-
-                st.caption("Priority score combines area competitiveness, turnout history, "
-                           "party affiliation, surge voter status, and age. "
-                           "Higher = more valuable to contact.")
-
+            _persuasion_section(vf)
         elif vf_section == "Precinct Drill-Down":
-            st.subheader("Precinct Voter Profile")
+            _precinct_drilldown_section(vf)
 
-            precinct_list = sorted(vf["PrecinctName"].unique())
-            selected_precinct = st.selectbox(
-                "Select Precinct",
-                precinct_list,
-                key="vf_precinct_select",
-            )
 
-            profile = get_precinct_voter_profile(vf, selected_precinct)
+# ============================================================
+# NAVIGATION
+# ============================================================
+VIEWS = {
+    "The Big Picture": _render_big_picture,
+    "Precinct Intel": _render_precinct_intel,
+    "Where to Win": _render_where_to_win,
+    "Voting Patterns": _render_voting_patterns,
+    "Data Explorer": _render_data_explorer,
+    "Demographics": _render_demographics,
+    "Campaign Finance": _render_campaign_finance,
+    "2026 Prep": _render_2026_prep,
+    "Voter File": _render_voter_file,
+}
 
-            if not profile:
-                st.warning("No data for this precinct.")
-            else:
-                # KPI row
-                k1, k2, k3, k4 = st.columns(4)
-                with k1:
-                    st.metric("Total Voters", f"{profile['total_voters']:,}")
-                with k2:
-                    st.metric("Active", f"{profile['active']:,}")
-                with k3:
-                    st.metric("D Primary %", f"{profile['d_primary_pct']}%")
-                with k4:
-                    st.metric("2024 Turnout", f"{profile['general_2024_turnout']}%")
-
-                st.markdown(f"**Area:** {profile['area']} | "
-                            f"**Avg Age:** {profile['avg_age']} | "
-                            f"**Avg General Score:** {profile['avg_general_score']}/4 | "
-                            f"**Surge 2020 Voters:** {profile['surge_2020_count']}")
-
-                col1, col2 = st.columns(2)
-                with col1:
-                    party_bd = profile["party_breakdown"]
-                    party_data = pd.DataFrame([
-                        {"Party": "Republican", "Count": party_bd.get("R", 0)},
-                        {"Party": "Democratic", "Count": party_bd.get("D", 0)},
-                        {"Party": "Unaffiliated", "Count": party_bd.get("", 0)},
-                    ])
-                    fig_pp = px.pie(
-                        party_data,
-                        names="Party",
-                        values="Count",
-                        title="Party (Primary Pull)",
-                        color="Party",
-                        color_discrete_map={
-                            "Republican": "#e74c3c",
-                            "Democratic": "#3498db",
-                            "Unaffiliated": "#95a5a6",
-                        },
-                    )
-                    fig_pp.update_layout(height=300)
-                    st.plotly_chart(fig_pp, use_container_width=True)
-
-                with col2:
-                    vt_bd = profile["voter_type_breakdown"]
-                    vt_data = pd.DataFrame([
-                        {"Type": t, "Count": vt_bd.get(t, 0)}
-                        for t in ["Super Voter", "Regular", "Occasional", "Inactive"]
-                    ])
-                    fig_vtp = px.pie(
-                        vt_data,
-                        names="Type",
-                        values="Count",
-                        title="Voter Engagement Types",
-                        color="Type",
-                        color_discrete_map={
-                            "Super Voter": "#27ae60", "Regular": "#2ecc71",
-                            "Occasional": "#f39c12", "Inactive": "#e74c3c",
-                        },
-                    )
-                    fig_vtp.update_layout(height=300)
-                    st.plotly_chart(fig_vtp, use_container_width=True)
-
-                col3, col4 = st.columns(2)
-                with col3:
-                    age_bd = profile["age_breakdown"]
-                    age_data = pd.DataFrame([
-                        {"Age Group": ag, "Count": age_bd.get(ag, 0)}
-                        for ag in ["18-29", "30-44", "45-64", "65+"]
-                    ])
-                    fig_ap = px.bar(
-                        age_data,
-                        x="Age Group",
-                        y="Count",
-                        title="Age Distribution",
-                        color="Age Group",
-                        color_discrete_sequence=px.colors.qualitative.Set2,
-                    )
-                    fig_ap.update_layout(height=300, showlegend=False)
-                    st.plotly_chart(fig_ap, use_container_width=True)
-
-                with col4:
-                    st.markdown("#### Contact Info")
-                    st.markdown(f"- **Has Phone:** {profile['has_phone_pct']}%")
-                    st.markdown(f"- **Has Email:** {profile['has_email_pct']}%")
-                    st.markdown("")
-                    st.markdown("#### Voter History")
-                    pct_voters = vf[vf["PrecinctName"] == selected_precinct]
-                    for ename in ["General2024", "General2022", "General2020", "General2018"]:
-                        rate = (pct_voters[ename] == "Y").sum() / max(len(pct_voters), 1) * 100
-                        st.markdown(f"- **{ename}:** {rate:.1f}%")
-
-                # Voter detail table
-                with st.expander("View individual voter records"):
-                    pct_display = vf[vf["PrecinctName"] == selected_precinct].copy()
-                    display_cols = [
-                        "VANID", "FirstName", "LastName", "Age", "Gender", "Party",
-                        "voter_type", "general_score", "General2024", "General2022",
-                        "General2020", "General2018",
-                    ]
-                    st.dataframe(
-                        pct_display[display_cols].sort_values("general_score", ascending=False),
-                        use_container_width=True,
-                        hide_index=True,
-                        height=400,
-                    )
+view = st.sidebar.radio("View", list(VIEWS), key="view")
+VIEWS[view]()
 
 
 # Footer
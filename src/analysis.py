@@ -14,7 +14,127 @@ import pandas as pd
 import numpy as np
 import sqlite3
 import os
-from database import get_connection, DB_PATH
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from pathlib import Path
+from database import DB_PATH, PRECINCT_DEM_SHARE_SQL, ensure_precinct_dem_share
+
+# pyarrow backs the string columns handed to st.dataframe; only its
+# presence matters here, so it is looked up rather than imported
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+try:
+    import xlsxwriter
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: kernels run as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+_thread_conns = threading.local()
+
+
+def _read_conn(db_path=None):
+    """
+    Read-only connection reused by the analysis queries instead of opening
+    one per call. Kept per thread (Streamlit runs each session on its own)
+    and per database file, and reopened if the file is replaced. Pragmas as
+    in get_connection, with a larger page cache and in-memory temp tables.
+    """
+    path = os.path.abspath(db_path or DB_PATH)
+    inode = os.stat(path).st_ino
+    conns = _thread_conns.__dict__.setdefault("conns", {})
+    if path in conns and conns[path][1] == inode:
+        return conns[path][0]
+    if path in conns:
+        conns[path][0].close()
+    conn = sqlite3.connect(Path(path).as_uri() + "?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA mmap_size = 268435456")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conns[path] = (conn, inode)
+    return conn
+
+
+def _read_sql(query, conn, params=None):
+    """
+    read_sql_query without the per-row sqlite3.Row objects: plain tuples
+    built straight into a frame, same dtypes (as the dashboard's _read_sql).
+    """
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(query, params or ())
+    columns = [d[0] for d in cur.description]
+    return pd.DataFrame.from_records(cur.fetchall(), columns=columns, coerce_float=True)
+
+
+# Rows fetched per batch in _read_sql_chunked
+READ_CHUNK_ROWS = 50_000
+
+
+def _read_sql_chunked(query, conn, params=None, transform=None):
+    """
+    _read_sql in READ_CHUNK_ROWS batches, applying transform to each
+    batch before the batches are concatenated, so a large result never has
+    to sit in memory twice (raw and transformed) at once.
+    """
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(query, params or ())
+    columns = [d[0] for d in cur.description]
+
+    def batches():
+        rows = cur.fetchmany(READ_CHUNK_ROWS)
+        yield pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+        while rows := cur.fetchmany(READ_CHUNK_ROWS):
+            yield pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+    chunks = batches()
+    if transform is not None:
+        chunks = (transform(chunk) for chunk in chunks)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _db_mtime(db_path):
+    """(path, mtime) key for the lru caches below; a re-import changes the mtime."""
+    path = db_path or DB_PATH
+    return path, os.path.getmtime(path)
+
+
+def _cached_by_db_mtime(fn):
+    """
+    Memoize a get_* analysis on _db_mtime like the lru caches below, for the
+    analyses that get_top_opportunities and the Excel export re-run. Callers
+    get copies of the cached frame (or tuple of frames).
+    """
+    @lru_cache(maxsize=8)
+    def cached(db_path, mtime, args, kwargs):
+        return fn(*args, db_path=db_path, **dict(kwargs))
+
+    @wraps(fn)
+    def wrapper(*args, db_path=None, **kwargs):
+        result = cached(*_db_mtime(db_path), args, tuple(sorted(kwargs.items())))
+        if isinstance(result, tuple):
+            return tuple(part.copy() for part in result)
+        return result.copy()
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
 
 
 def get_dem_vote_share_by_election(race_level=None, db_path=None):
@@ -22,53 +142,87 @@ def get_dem_vote_share_by_election(race_level=None, db_path=None):
     Calculate Democratic vote share for each election over time.
     This is the core "shifting blue" metric.
     """
-    conn = get_connection(db_path)
+    return _dem_vote_share_cached(*_db_mtime(db_path), race_level).copy()
+
 
+@lru_cache(maxsize=8)
+def _dem_vote_share_cached(db_path, mtime, race_level):
+    conn = _read_conn(db_path)
+
+    # D/R/total votes per race pivoted in SQL; only the share arithmetic is left
     query = """
         SELECT
             e.election_date,
-            e.election_type,
-            e.election_name,
             r.race_name,
-            r.race_level,
-            c.name as candidate_name,
-            c.party,
-            SUM(res.votes) as total_votes
+            SUM(res.votes) as total_votes,
+            SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as dem_votes,
+            SUM(CASE WHEN c.party = 'R' THEN res.votes ELSE 0 END) as rep_votes
         FROM results res
         JOIN races r ON res.race_id = r.id
         JOIN candidates c ON res.candidate_id = c.id
         JOIN elections e ON r.election_id = e.id
         WHERE r.race_level IN ('federal', 'state', 'county', 'local')
     """
+    params = []
     if race_level:
-        query += f" AND r.race_level = '{race_level}'"
-    query += " GROUP BY e.election_date, r.race_name, c.party ORDER BY e.election_date"
+        query += " AND r.race_level = ?"
+        params.append(race_level)
+    query += " GROUP BY e.election_date, r.race_name ORDER BY e.election_date, r.race_name"
 
-    df = pd.read_sql_query(query, conn)
-    conn.close()
+    df = _read_sql(query, conn, params=params)
 
     if df.empty:
         return df
 
     # Calculate D vs R vote share per race per election
-    results = []
-    for (date, race), group in df.groupby(["election_date", "race_name"]):
-        total = group["total_votes"].sum()
-        dem_votes = group[group["party"] == "D"]["total_votes"].sum()
-        rep_votes = group[group["party"] == "R"]["total_votes"].sum()
-
-        results.append({
-            "election_date": date,
-            "race_name": race,
-            "total_votes": total,
-            "dem_votes": dem_votes,
-            "rep_votes": rep_votes,
-            "dem_share": round(dem_votes / total * 100, 2) if total > 0 else 0,
-            "rep_share": round(rep_votes / total * 100, 2) if total > 0 else 0,
-            "margin": round((dem_votes - rep_votes) / total * 100, 2) if total > 0 else 0,
-        })
-
-    return pd.DataFrame(results)
+    total = df["total_votes"].to_numpy(dtype=np.float64)
+    dem = df["dem_votes"].to_numpy(dtype=np.float64)
+    rep = df["rep_votes"].to_numpy(dtype=np.float64)
+    has_votes = total > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        df["dem_share"] = np.where(has_votes, np.round(dem / total * 100, 2), 0.0)
+        df["rep_share"] = np.where(has_votes, np.round(rep / total * 100, 2), 0.0)
+        df["margin"] = np.where(has_votes, np.round((dem - rep) / total * 100, 2), 0.0)
+
+    return shrink_dtypes(df)
+
+
+def get_avg_vote_share_by_election(race_level=None, db_path=None):
+    """
+    Average D/R vote share and margin across races, one row per election.
+    Same per-race shares as get_dem_vote_share_by_election(), aggregated
+    in a single SQL pass for the Blue Shift charts.
+    """
+    conn = _read_conn(db_path)
+
+    level_filter = "AND r.race_level = ?" if race_level else ""
+    query = f"""
+        WITH race_totals AS (
+            SELECT
+                e.election_date,
+                r.race_name,
+                SUM(res.votes) as total_votes,
+                SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as dem_votes,
+                SUM(CASE WHEN c.party = 'R' THEN res.votes ELSE 0 END) as rep_votes
+            FROM results res
+            JOIN races r ON res.race_id = r.id
+            JOIN candidates c ON res.candidate_id = c.id
+            JOIN elections e ON r.election_id = e.id
+            WHERE r.race_level IN ('federal', 'state', 'county', 'local')
+              {level_filter}
+            GROUP BY e.election_date, r.race_name
+        )
+        SELECT
+            election_date,
+            AVG(CASE WHEN total_votes > 0 THEN dem_votes * 100.0 / total_votes ELSE 0 END) as dem_share,
+            AVG(CASE WHEN total_votes > 0 THEN rep_votes * 100.0 / total_votes ELSE 0 END) as rep_share,
+            AVG(CASE WHEN total_votes > 0 THEN (dem_votes - rep_votes) * 100.0 / total_votes ELSE 0 END) as margin
+        FROM race_totals
+        GROUP BY election_date
+        ORDER BY election_date
+    """
+    df = _read_sql(query, conn, params=(race_level,) if race_level else None)
+    return shrink_dtypes(df)
 
 
 def get_precinct_shift(election_date_1, election_date_2, db_path=None):
@@ -76,7 +230,7 @@ def get_precinct_shift(election_date_1, election_date_2, db_path=None):
     Compare Democratic performance between two elections at the precinct level.
     Identifies which precincts are shifting blue/red.
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     query = """
         SELECT
@@ -93,51 +247,54 @@ def get_precinct_shift(election_date_1, election_date_2, db_path=None):
         WHERE e.election_date IN (?, ?)
         GROUP BY p.precinct_name, e.election_date, r.race_name, c.party
     """
-    df = pd.read_sql_query(query, conn, params=[election_date_1, election_date_2])
-    conn.close()
+    df = _read_sql(query, conn, params=[election_date_1, election_date_2])
 
     if df.empty:
         return df
 
-    # Calculate shift per precinct
-    shifts = []
-    for precinct in df["precinct_name"].unique():
-        pct_data = df[df["precinct_name"] == precinct]
-
-        for race in pct_data["race_name"].unique():
-            race_data = pct_data[pct_data["race_name"] == race]
-
-            e1 = race_data[race_data["election_date"] == election_date_1]
-            e2 = race_data[race_data["election_date"] == election_date_2]
-
-            e1_total = e1["votes"].sum()
-            e2_total = e2["votes"].sum()
-            e1_dem = e1[e1["party"] == "D"]["votes"].sum()
-            e2_dem = e2[e2["party"] == "D"]["votes"].sum()
-
-            e1_dem_share = (e1_dem / e1_total * 100) if e1_total > 0 else 0
-            e2_dem_share = (e2_dem / e2_total * 100) if e2_total > 0 else 0
-
-            shifts.append({
-                "precinct": precinct,
-                "race": race,
-                f"dem_share_{election_date_1}": round(e1_dem_share, 2),
-                f"dem_share_{election_date_2}": round(e2_dem_share, 2),
-                "shift": round(e2_dem_share - e1_dem_share, 2),
-                "direction": "BLUE" if e2_dem_share > e1_dem_share else "RED",
-                f"turnout_{election_date_1}": e1_total,
-                f"turnout_{election_date_2}": e2_total,
-            })
-
-    return pd.DataFrame(shifts).sort_values("shift", ascending=False)
-
-
+    # One row per (precinct, race), in the order they first appear per
+    # precinct; each election's total and D votes are bincounts over the
+    # pair codes instead of boolean-mask scans per pair
+    pair_codes, pairs = pd.MultiIndex.from_frame(df[["precinct_name", "race_name"]]).factorize()
+    precinct_codes = pd.factorize(pairs.get_level_values(0))[0]
+    order = np.lexsort((np.arange(len(pairs)), precinct_codes))
+
+    votes = df["votes"].to_numpy(dtype=np.float64)
+    is_dem = (df["party"] == "D").to_numpy()
+    dates = df["election_date"].to_numpy()
+
+    def election_sums(election_date):
+        in_election = dates == election_date
+        total = np.bincount(pair_codes, weights=votes * in_election, minlength=len(pairs))
+        dem = np.bincount(pair_codes, weights=votes * (in_election & is_dem), minlength=len(pairs))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            share = np.where(total > 0, dem / total * 100, 0.0)
+        return total[order], share[order]
+
+    e1_total, e1_dem_share = election_sums(election_date_1)
+    e2_total, e2_dem_share = election_sums(election_date_2)
+
+    shifts = pd.DataFrame({
+        "precinct": pairs.get_level_values(0)[order],
+        "race": pairs.get_level_values(1)[order],
+        f"dem_share_{election_date_1}": np.round(e1_dem_share, 2),
+        f"dem_share_{election_date_2}": np.round(e2_dem_share, 2),
+        "shift": np.round(e2_dem_share - e1_dem_share, 2),
+        "direction": np.where(e2_dem_share > e1_dem_share, "BLUE", "RED"),
+        f"turnout_{election_date_1}": e1_total.astype(np.int64),
+        f"turnout_{election_date_2}": e2_total.astype(np.int64),
+    })
+
+    return shrink_dtypes(shifts.sort_values("shift", ascending=False))
+
+
+@_cached_by_db_mtime
 def get_turnout_analysis(db_path=None):
     """
     Analyze turnout patterns to identify mobilization opportunities.
     Low-turnout precincts with Democratic lean = biggest opportunities.
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     query = """
         SELECT
@@ -152,53 +309,56 @@ def get_turnout_analysis(db_path=None):
         JOIN precincts p ON t.precinct_id = p.id
         ORDER BY p.precinct_name, e.election_date
     """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-    return df
+    return _read_sql_chunked(query, conn)
 
 
+@_cached_by_db_mtime
 def get_competitive_races(min_margin=15, db_path=None):
     """
     Identify races where the margin was close enough to be competitive.
     Default: races decided by less than 15 points.
     Only includes races where both D and R received votes (actual contests).
     """
+    # The per-race shares are memoized per db mtime, so each new margin
+    # threshold is a mask over that frame rather than another results scan
     vote_shares = get_dem_vote_share_by_election(db_path=db_path)
     if vote_shares.empty:
         return vote_shares
 
-    # Filter to actual contested races (both D and R got votes)
-    contested = vote_shares[(vote_shares["dem_votes"] > 0) & (vote_shares["rep_votes"] > 0)].copy()
-    competitive = contested[abs(contested["margin"]) <= min_margin].copy()
-    competitive = competitive.sort_values("margin", ascending=False)
-    return competitive
+    # Actual contests (both D and R got votes) within the margin, in one mask
+    competitive = vote_shares[
+        (vote_shares["dem_votes"].to_numpy() > 0)
+        & (vote_shares["rep_votes"].to_numpy() > 0)
+        & (np.abs(vote_shares["margin"].to_numpy()) <= min_margin)
+    ]
+    return competitive.sort_values("margin", ascending=False)
 
 
 def generate_summary_report(db_path=None):
     """
     Generate an overall summary of the database contents and key metrics.
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     report = {}
 
-    # Basic counts
-    for table in ["elections", "races", "candidates", "results", "precincts"]:
-        cursor = conn.execute(f"SELECT COUNT(*) as cnt FROM {table}")
-        report[f"total_{table}"] = cursor.fetchone()["cnt"]
-
-    # Date range
-    cursor = conn.execute("SELECT MIN(election_date) as earliest, MAX(election_date) as latest FROM elections")
-    row = cursor.fetchone()
-    report["earliest_election"] = row["earliest"]
-    report["latest_election"] = row["latest"]
+    # Basic counts and date range, in one statement
+    row = conn.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM elections) as total_elections,
+            (SELECT COUNT(*) FROM races) as total_races,
+            (SELECT COUNT(*) FROM candidates) as total_candidates,
+            (SELECT COUNT(*) FROM results) as total_results,
+            (SELECT COUNT(*) FROM precincts) as total_precincts,
+            (SELECT MIN(election_date) FROM elections) as earliest_election,
+            (SELECT MAX(election_date) FROM elections) as latest_election
+    """).fetchone()
+    report.update(dict(row))
 
     # Party breakdown of candidates
     cursor = conn.execute("SELECT party, COUNT(*) as cnt FROM candidates GROUP BY party")
     report["candidates_by_party"] = {row["party"]: row["cnt"] for row in cursor.fetchall()}
 
-    conn.close()
-
     print("=" * 60)
     print("BCD ELECTION DATA SUMMARY")
     print("=" * 60)
@@ -214,41 +374,121 @@ def generate_summary_report(db_path=None):
     return report
 
 
-def _get_precinct_dem_share_base(db_path=None):
+# Straight-ticket dependency classes, strongest party brand first
+DEPENDENCY_LEVELS = ("Brand-Dependent", "Mixed", "Candidate-Dependent")
+
+# Turnout/D-share quadrants indexed by (high D share) | (high turnout) << 1
+QUADRANT_LABELS = np.array(
+    ["Low Priority", "Mobilization Goldmine", "R Stronghold", "D Stronghold"], dtype=object
+)
+
+# Low-cardinality label columns worth storing as categoricals
+CATEGORY_COLUMNS = (
+    "precinct", "category", "quadrant", "dependency", "race_level",
+    "race_type", "party", "confidence_level", "source_type",
+)
+
+
+def _categorize(df, category_cols=CATEGORY_COLUMNS):
     """
-    Shared base query: D share per precinct per election.
-    Used by precinct typology, turnout crossref, and heatmap views.
-    Normalizes precinct names to UPPER() to avoid duplicates.
+    Label columns of a freshly read query frame -> category, so the
+    groupbys, pivots and merges that follow hash int codes, not strings.
     """
-    conn = get_connection(db_path)
-    query = """
-        SELECT
-            UPPER(p.precinct_name) as precinct,
-            e.election_date,
-            e.election_type,
-            SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as dem_votes,
-            SUM(CASE WHEN c.party = 'R' THEN res.votes ELSE 0 END) as rep_votes,
-            SUM(CASE WHEN c.party IN ('D', 'R') THEN res.votes ELSE 0 END) as dr_total
-        FROM results res
-        JOIN races r ON res.race_id = r.id
-        JOIN candidates c ON res.candidate_id = c.id
-        JOIN elections e ON r.election_id = e.id
-        JOIN precincts p ON res.precinct_id = p.id
-        WHERE c.party IN ('D', 'R')
-          AND res.precinct_id IS NOT NULL
-        GROUP BY UPPER(p.precinct_name), e.election_date
-        ORDER BY UPPER(p.precinct_name), e.election_date
+    for col in category_cols:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _downcast_ints(df):
+    """
+    int64 -> narrowest int (vote counts fit in int32, 0/1 flags in int8).
+    Applied to raw query results before merges and groupbys so they move
+    less memory; floats are left alone until the caller has rounded them.
     """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
+    for col in df.select_dtypes(include="int64").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def shrink_dtypes(df, category_cols=CATEGORY_COLUMNS):
+    """
+    Downcast a display frame: int64 -> narrowest int, float64 -> float32 and
+    repeated labels -> category. Halves what gets pickled into the dashboard
+    cache and shipped to plotly; rounding is already done by the caller.
+    Remaining text columns become Arrow-backed strings so st.dataframe can
+    hand them to the browser without a per-render object -> Arrow pass
+    (numeric and categorical columns already map onto Arrow directly).
+    """
+    _downcast_ints(df)
+    float_cols = df.select_dtypes(include="float64").columns
+    if len(float_cols):
+        df[float_cols] = df[float_cols].astype(np.float32)
+    for col in category_cols:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    if HAS_PYARROW:
+        for col in df.select_dtypes(include="object").columns:
+            # All-None columns are empty numerics (e.g. no local races), not text
+            if df[col].notna().any():
+                df[col] = df[col].astype("string[pyarrow]")
+    return df
 
-    if df.empty:
-        return df
 
-    # Avoid division by zero; drop rows where no D or R votes exist
-    df = df[df["dr_total"] > 0].copy()
-    df["d_share"] = (df["dem_votes"] / df["dr_total"] * 100).round(2)
-    df["d_margin"] = ((df["dem_votes"] - df["rep_votes"]) / df["dr_total"] * 100).round(2)
+def _get_precinct_dem_share_base(db_path=None, election_date=None):
+    """
+    Shared base query: D share per precinct per election.
+    Used by precinct typology, turnout crossref, and heatmap views.
+    Normalizes precinct names to UPPER() to avoid duplicates.
+    With election_date, only that election is read (filtered in SQL).
+    Memoized per database file and mtime; callers get their own copy.
+    """
+    _ensure_dem_share_table(db_path)
+    return _dem_share_base_cached(*_db_mtime(db_path), election_date).copy()
+
+
+_dem_share_checked = set()
+_dem_share_lock = threading.Lock()
+
+
+def _ensure_dem_share_table(db_path=None):
+    """
+    Build the precinct_dem_share table once per process for a database that
+    predates it, so later reads skip the aggregation. The build bumps the
+    mtime, so the caches keyed on it start fresh afterwards.
+    """
+    path = os.path.abspath(db_path or DB_PATH)
+    if path in _dem_share_checked:
+        return
+    with _dem_share_lock:
+        if path not in _dem_share_checked:
+            ensure_precinct_dem_share(path)
+            _dem_share_checked.add(path)
+
+
+@lru_cache(maxsize=32)
+def _dem_share_base_cached(db_path, mtime, election_date):
+    conn = _read_conn(db_path)
+    # Importers keep a pre-aggregated precinct_dem_share table; databases
+    # that predate it and could not be upgraded run the aggregation here
+    has_table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'precinct_dem_share'"
+    ).fetchone()
+    source = "precinct_dem_share" if has_table else f"({PRECINCT_DEM_SHARE_SQL})"
+    date_filter = "WHERE election_date = ?" if election_date else ""
+    query = f"SELECT * FROM {source} {date_filter} ORDER BY precinct, election_date"
+    return _read_sql_chunked(query, conn, params=(election_date,) if election_date else None,
+                             transform=_add_dem_shares)
+
+
+def _add_dem_shares(df):
+    """d_share / d_margin for a chunk of the base query."""
+    # Rows without D or R votes were dropped by HAVING, so no zero division
+    dem = df["dem_votes"].to_numpy(dtype=np.float64)
+    rep = df["rep_votes"].to_numpy(dtype=np.float64)
+    dr_total = df["dr_total"].to_numpy(dtype=np.float64)
+    df["d_share"] = np.round(dem / dr_total * 100, 2)
+    df["d_margin"] = np.round((dem - rep) / dr_total * 100, 2)
     return df
 
 
@@ -261,30 +501,105 @@ def get_precinct_heatmap_data(min_elections=3, db_path=None):
     if base.empty:
         return base
 
-    # Filter precincts with fewer than min_elections data points
-    election_counts = base.groupby("precinct")["election_date"].nunique()
-    valid_precincts = election_counts[election_counts >= min_elections].index
-    base = base[base["precinct"].isin(valid_precincts)]
-
-    if base.empty:
-        return base
-
-    # Pivot: rows = precinct, columns = election_date, values = d_margin
-    heatmap = base.pivot_table(
-        index="precinct",
-        columns="election_date",
-        values="d_margin",
-        aggfunc="first"
+    # The base has one row per (precinct, election), so the grid is filled
+    # straight from factorized codes instead of a groupby + pivot_table.
+    # Precincts with fewer than min_elections data points are dropped.
+    rows, precincts = pd.factorize(base["precinct"], sort=True)
+    keep = np.bincount(rows, minlength=len(precincts))[rows] >= min_elections
+    if not keep.any():
+        return base.iloc[:0]
+    base = base[keep]
+    rows, precincts = pd.factorize(base["precinct"], sort=True)
+    cols, elections = pd.factorize(base["election_date"], sort=True)
+    grid = np.full((len(precincts), len(elections)), np.nan)
+    grid[rows, cols] = base["d_margin"].to_numpy(dtype=np.float64)
+
+    # Sort precincts by average D margin (most D-leaning at top). The
+    # margins only need 0.01 resolution, so the grid is handed to the chart
+    # as a single float32 block.
+    order = np.argsort(-np.nanmean(grid, axis=1), kind="stable")
+    heatmap = pd.DataFrame(
+        grid[order].astype(np.float32),
+        index=pd.Index(precincts[order], name="precinct"),
+        columns=pd.Index(elections, name="election_date"),
     )
 
-    # Sort precincts by average D margin (most D-leaning at top)
-    heatmap["_avg_margin"] = heatmap.mean(axis=1)
-    heatmap = heatmap.sort_values("_avg_margin", ascending=False)
-    heatmap = heatmap.drop(columns=["_avg_margin"])
-
     return heatmap
 
 
+@njit(parallel=True, cache=True)
+def _trend_kernel(M):
+    """
+    Per-row typology stats over a (precinct x election) matrix of D shares.
+    NaN marks elections a precinct did not vote in. The trend is the
+    least-squares slope of D share against the precinct's own election
+    sequence (0, 1, 2, ...), in closed form around the sequence midpoint;
+    it is 0 with fewer than 3 elections.
+    Returns (trend, elections_counted, avg, latest, min, max).
+    """
+    n, t = M.shape
+    trend = np.zeros(n)
+    counted = np.zeros(n, np.int64)
+    avg = np.full(n, np.nan)
+    latest = np.full(n, np.nan)
+    lo = np.full(n, np.nan)
+    hi = np.full(n, np.nan)
+    for i in prange(n):
+        total = 0.0
+        k = 0
+        for j in range(t):
+            v = M[i, j]
+            if np.isnan(v):
+                continue
+            if k == 0 or v < lo[i]:
+                lo[i] = v
+            if k == 0 or v > hi[i]:
+                hi[i] = v
+            latest[i] = v
+            total += v
+            k += 1
+        counted[i] = k
+        if k > 0:
+            avg[i] = total / k
+        if k >= 3:
+            mid = (k - 1) / 2.0
+            sxy = 0.0
+            sxx = 0.0
+            x = 0
+            for j in range(t):
+                v = M[i, j]
+                if np.isnan(v):
+                    continue
+                sxy += (x - mid) * v
+                sxx += (x - mid) * (x - mid)
+                x += 1
+            trend[i] = sxy / sxx
+    return trend, counted, avg, latest, lo, hi
+
+
+def _trend_stats(M):
+    """
+    _trend_kernel, or without numba the same stats from whole-matrix sums,
+    since the kernel's per-precinct loop is slow as plain Python.
+    """
+    if HAS_NUMBA:
+        return _trend_kernel(M)
+    valid = ~np.isnan(M)
+    counted = valid.sum(axis=1)
+    vals = np.where(valid, M, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg = vals.sum(axis=1) / counted
+        # Each precinct's own election sequence 0, 1, 2, ... centered on its midpoint
+        x = np.where(valid, np.cumsum(valid, axis=1) - 1 - (counted[:, None] - 1) / 2.0, 0.0)
+        trend = np.where(counted >= 3, (x * vals).sum(axis=1) / (x * x).sum(axis=1), 0.0)
+    last = M.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+    has = counted > 0
+    latest = np.where(has, M[np.arange(len(M)), last], np.nan)
+    lo = np.where(has, np.where(valid, M, np.inf).min(axis=1, initial=np.inf), np.nan)
+    hi = np.where(has, np.where(valid, M, -np.inf).max(axis=1, initial=-np.inf), np.nan)
+    return trend, counted, avg, latest, lo, hi
+
+
 def get_precinct_typology(recent_elections=6, top_pctile=75, mid_pctile=50,
                           trend_threshold=1.0, db_path=None):
     """
@@ -310,80 +625,62 @@ def get_precinct_typology(recent_elections=6, top_pctile=75, mid_pctile=50,
     recent_dates = all_dates[-recent_elections:] if len(all_dates) >= recent_elections else all_dates
     recent = base[base["election_date"].isin(recent_dates)]
 
-    # Compute per-precinct stats first to determine thresholds
-    precinct_stats = []
-    for precinct, group in recent.groupby("precinct"):
-        group = group.sort_values("election_date")
-        n_elections = len(group)
-        avg_d = group["d_share"].mean()
-
-        if n_elections >= 3:
-            valid = group.dropna(subset=["d_share"])
-            if len(valid) >= 3:
-                x = np.arange(len(valid))
-                y = valid["d_share"].values
-                slope, _ = np.polyfit(x, y, 1)
-            else:
-                slope = 0.0
-        else:
-            slope = 0.0
-
-        precinct_stats.append({
-            "precinct": precinct,
-            "avg_d_share": round(avg_d, 2),
-            "d_trend": round(slope, 2),
-            "elections_counted": n_elections,
-            "latest_d_share": group["d_share"].iloc[-1],
-            "min_d_share": group["d_share"].min(),
-            "max_d_share": group["d_share"].max(),
-        })
-
-    result_df = pd.DataFrame(precinct_stats)
+    # Per-precinct stats first, to determine thresholds
+    matrix = recent.pivot(index="precinct", columns="election_date", values="d_share")
+    trend, counted, avg, latest, lo, hi = _trend_stats(matrix.to_numpy(dtype=np.float64))
+
+    result_df = pd.DataFrame({
+        "precinct": matrix.index,
+        "avg_d_share": np.round(avg, 2),
+        "d_trend": np.round(trend, 2),
+        "elections_counted": counted,
+        "latest_d_share": latest,
+        "min_d_share": lo,
+        "max_d_share": hi,
+    })
     if result_df.empty:
         return result_df
 
     # Calculate percentile thresholds from precincts with enough data
-    valid = result_df[result_df["elections_counted"] >= 3]
-    if valid.empty:
+    avg = result_df["avg_d_share"].to_numpy()
+    insufficient = counted < 3
+    if insufficient.all():
         result_df["category"] = "Insufficient Data"
-        return result_df.sort_values("avg_d_share", ascending=False)
-
-    top_thresh = np.percentile(valid["avg_d_share"], top_pctile)
-    mid_thresh = np.percentile(valid["avg_d_share"], mid_pctile)
-    bot_thresh = np.percentile(valid["avg_d_share"], 100 - top_pctile)
-
-    def classify(row):
-        if row["elections_counted"] < 3:
-            return "Insufficient Data"
-        avg = row["avg_d_share"]
-        trend = row["d_trend"]
-        if avg >= top_thresh:
-            return "Best D"
-        elif avg >= mid_thresh and trend >= trend_threshold:
-            return "Trending D"
-        elif avg >= mid_thresh:
-            return "Competitive"
-        elif avg >= bot_thresh:
-            return "Lean R"
-        else:
-            return "Strong R"
-
-    result_df["category"] = result_df.apply(classify, axis=1)
+        return shrink_dtypes(result_df.sort_values("avg_d_share", ascending=False))
+
+    # All three thresholds from one sort of the array
+    top_thresh, mid_thresh, bot_thresh = np.percentile(
+        avg[~insufficient], [top_pctile, mid_pctile, 100 - top_pctile]
+    )
+
+    trending = result_df["d_trend"].to_numpy() >= trend_threshold
+    result_df["category"] = np.select(
+        [
+            insufficient,
+            avg >= top_thresh,
+            (avg >= mid_thresh) & trending,
+            avg >= mid_thresh,
+            avg >= bot_thresh,
+        ],
+        ["Insufficient Data", "Best D", "Trending D", "Competitive", "Lean R"],
+        "Strong R",
+    )
 
     # Store thresholds as DataFrame attribute for display
     result_df.attrs["top_threshold"] = round(top_thresh, 1)
     result_df.attrs["mid_threshold"] = round(mid_thresh, 1)
     result_df.attrs["bot_threshold"] = round(bot_thresh, 1)
 
-    return result_df.sort_values("avg_d_share", ascending=False)
+    return shrink_dtypes(result_df.sort_values("avg_d_share", ascending=False))
 
 
+@_cached_by_db_mtime
 def get_turnout_vs_dem_share(election_date=None, turnout_cap=100.0, db_path=None):
     """
     Cross-reference turnout with Dem vote share per precinct.
     Identifies mobilization goldmine precincts (low turnout + high D share).
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     # Turnout data
     turnout_query = """
@@ -402,20 +699,16 @@ def get_turnout_vs_dem_share(election_date=None, turnout_cap=100.0, db_path=None
         params.append(election_date)
     turnout_query += " GROUP BY UPPER(p.precinct_name)"
 
-    turnout_df = pd.read_sql_query(turnout_query, conn, params=params)
-    conn.close()
+    turnout_df = _read_sql(turnout_query, conn, params=params)
 
     if turnout_df.empty:
         return turnout_df
 
-    # D vote share data
-    base = _get_precinct_dem_share_base(db_path)
+    # D vote share data, for the selected election only if there is one
+    base = _get_precinct_dem_share_base(db_path, election_date=election_date)
     if base.empty:
         return pd.DataFrame()
 
-    if election_date:
-        base = base[base["election_date"] == election_date]
-
     dem_share_by_precinct = base.groupby("precinct").agg(
         avg_d_share=("d_share", "mean")
     ).reset_index()
@@ -429,47 +722,43 @@ def get_turnout_vs_dem_share(election_date=None, turnout_cap=100.0, db_path=None
     merged["avg_turnout"] = merged["avg_turnout"].round(2)
     merged["avg_registered"] = merged["avg_registered"].round(0)
 
-    # Assign quadrants based on medians
-    med_turnout = merged["avg_turnout"].median()
-    med_d_share = merged["avg_d_share"].median()
-
-    def assign_quadrant(row):
-        low_turnout = row["avg_turnout"] < med_turnout
-        high_d = row["avg_d_share"] >= med_d_share
-        if low_turnout and high_d:
-            return "Mobilization Goldmine"
-        elif not low_turnout and high_d:
-            return "D Stronghold"
-        elif not low_turnout and not high_d:
-            return "R Stronghold"
-        else:
-            return "Low Priority"
+    # Assign quadrants based on medians (both in one pass)
+    med_turnout, med_d_share = np.nanmedian(
+        merged[["avg_turnout", "avg_d_share"]].to_numpy(dtype=np.float64), axis=0
+    )
 
-    merged["quadrant"] = merged.apply(assign_quadrant, axis=1)
+    turnout = merged["avg_turnout"].to_numpy(dtype=np.float64)
+    d_share = merged["avg_d_share"].to_numpy(dtype=np.float64)
+    high_turnout = ~(turnout < med_turnout)
+    quadrant_code = (d_share >= med_d_share).astype(np.int8) | (high_turnout.astype(np.int8) << 1)
+    merged["quadrant"] = QUADRANT_LABELS[quadrant_code]
 
     # Potential votes gained for goldmine precincts
-    merged["potential_votes_gained"] = 0.0
-    goldmine_mask = merged["quadrant"] == "Mobilization Goldmine"
-    merged.loc[goldmine_mask, "potential_votes_gained"] = (
-        merged.loc[goldmine_mask, "avg_registered"]
-        * (med_turnout - merged.loc[goldmine_mask, "avg_turnout"]) / 100
-        * merged.loc[goldmine_mask, "avg_d_share"] / 100
-    ).round(1)
+    goldmine = quadrant_code == 1
+    merged["potential_votes_gained"] = np.where(
+        goldmine,
+        (merged["avg_registered"].to_numpy(dtype=np.float64)
+         * (med_turnout - turnout) / 100 * d_share / 100).round(1),
+        0.0,
+    )
 
-    # Store medians for chart reference lines
-    merged.attrs["median_turnout"] = med_turnout
-    merged.attrs["median_d_share"] = med_d_share
+    # Store medians for chart reference lines as hidden columns (unlike
+    # .attrs, these survive caching round-trips)
+    merged["_med_turnout"] = med_turnout
+    merged["_med_d_share"] = med_d_share
 
-    return merged
+    return shrink_dtypes(merged)
 
 
-def get_downballot_dropoff(election_date=None, db_path=None):
+def get_downballot_dropoff(election_date=None, db_path=None, election_dates=None):
     """
     Compare Dem performance across race levels (federal -> state -> county -> local).
     Only for 2016+ general elections where race_level labels exist.
+    Restrict to one election with election_date, or to several with
+    election_dates (one IN (...) query); neither means all of them.
     Returns (detail_df, summary_df).
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     query = """
         SELECT
@@ -487,68 +776,54 @@ def get_downballot_dropoff(election_date=None, db_path=None):
           AND e.election_type = 'general'
           AND e.election_date >= '2016-01-01'
     """
-    params = []
+    params = list(election_dates or [])
     if election_date:
-        query += " AND e.election_date = ?"
         params.append(election_date)
+    if params:
+        query += f" AND e.election_date IN ({','.join('?' * len(params))})"
 
     query += " GROUP BY e.election_date, r.race_level, c.party ORDER BY e.election_date, r.race_level"
 
-    df = pd.read_sql_query(query, conn, params=params)
-    conn.close()
+    df = _categorize(_read_sql(query, conn, params=params))
 
     if df.empty:
         return pd.DataFrame(), pd.DataFrame()
 
-    # Calculate D share per (election, race_level)
-    detail_rows = []
-    for (date, level), group in df.groupby(["election_date", "race_level"]):
-        d_votes = group[group["party"] == "D"]["total_votes"].sum()
-        r_votes = group[group["party"] == "R"]["total_votes"].sum()
-        total = d_votes + r_votes
-        d_share = round(d_votes / total * 100, 2) if total > 0 else None
-
-        ename = group["election_name"].iloc[0] if "election_name" in group.columns else ""
-
-        detail_rows.append({
-            "election_date": date,
-            "election_name": ename,
-            "race_level": level,
-            "d_votes": d_votes,
-            "r_votes": r_votes,
-            "total_votes": total,
-            "d_share": d_share,
-        })
-
-    detail_df = pd.DataFrame(detail_rows)
-
-    # Build summary with drop-off calculations
+    # D and R votes side by side per (election, race_level)
+    detail_df = (
+        df.pivot_table(index=["election_date", "election_name", "race_level"], columns="party",
+                       values="total_votes", aggfunc="sum", fill_value=0, observed=True)
+        .reindex(columns=["D", "R"], fill_value=0)
+        .rename(columns={"D": "d_votes", "R": "r_votes"})
+        .rename_axis(columns=None)
+        .reset_index()
+    )
+    d_votes = detail_df["d_votes"].to_numpy(dtype=np.float64)
+    total = d_votes + detail_df["r_votes"].to_numpy(dtype=np.float64)
+    detail_df["total_votes"] = detail_df["d_votes"] + detail_df["r_votes"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        detail_df["d_share"] = np.where(total > 0, np.round(d_votes / total * 100, 2), np.nan)
+
+    # Summary: one row per election with each level's D share, and the
+    # drop-off from federal (NaN where either level is missing)
     level_order = ["federal", "state", "county", "local"]
-    summary_rows = []
-    for date, group in detail_df.groupby("election_date"):
-        row = {"election_date": date}
-        shares = {}
-        for level in level_order:
-            level_data = group[group["race_level"] == level]
-            shares[level] = level_data["d_share"].iloc[0] if not level_data.empty else None
-            row[f"{level}_d_share"] = shares[level]
-
-        # Calculate drop-off from federal
-        fed = shares.get("federal")
-        if fed is not None:
-            for level in ["state", "county", "local"]:
-                if shares.get(level) is not None:
-                    row[f"fed_to_{level}_dropoff"] = round(fed - shares[level], 2)
-                else:
-                    row[f"fed_to_{level}_dropoff"] = None
-        else:
-            for level in ["state", "county", "local"]:
-                row[f"fed_to_{level}_dropoff"] = None
-
-        summary_rows.append(row)
-
-    summary_df = pd.DataFrame(summary_rows)
-    return detail_df, summary_df
+    wide = detail_df.pivot(index="election_date", columns="race_level", values="d_share")
+    wide = wide.reindex(columns=level_order)
+    summary_df = wide.add_suffix("_d_share").rename_axis(columns=None)
+    for level in level_order[1:]:
+        summary_df[f"fed_to_{level}_dropoff"] = np.round(wide["federal"] - wide[level], 2)
+    summary_df = summary_df.reset_index()
+    return shrink_dtypes(detail_df), shrink_dtypes(summary_df)
+
+
+def _add_straight_pcts(df, d_col, straight_col, ballots_col, d_pct_col):
+    """D share of straight-party votes, and straight votes as % of ballots (NaN where undefined)."""
+    d = df[d_col].to_numpy(dtype=np.float64)
+    straight = df[straight_col].to_numpy(dtype=np.float64)
+    ballots = df[ballots_col].to_numpy(dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        df[d_pct_col] = np.where(straight > 0, np.round(d / straight * 100, 2), np.nan)
+        df["straight_pct_of_ballots"] = np.where(ballots > 0, np.round(straight / ballots * 100, 2), np.nan)
 
 
 def get_straight_ticket_analysis(db_path=None):
@@ -556,7 +831,7 @@ def get_straight_ticket_analysis(db_path=None):
     Analyze straight-party voting patterns over time and by precinct.
     Returns (precinct_detail_df, trend_summary_df).
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     # Straight party votes by precinct and election
     query = """
@@ -576,9 +851,13 @@ def get_straight_ticket_analysis(db_path=None):
         GROUP BY UPPER(p.precinct_name), e.election_date, c.party
         ORDER BY UPPER(p.precinct_name), e.election_date
     """
-    df = pd.read_sql_query(query, conn)
+    df = _categorize(_read_sql_chunked(query, conn))
+
+    if df.empty:
+        return pd.DataFrame(), pd.DataFrame()
 
-    # Turnout data for context (straight as % of ballots)
+    # Turnout data for context (straight as % of ballots), only for the
+    # dates that had a straight-party line since nothing else is matched
     turnout_query = """
         SELECT
             UPPER(p.precinct_name) as precinct,
@@ -587,62 +866,166 @@ def get_straight_ticket_analysis(db_path=None):
         FROM turnout t
         JOIN elections e ON t.election_id = e.id
         JOIN precincts p ON t.precinct_id = p.id
+        WHERE e.election_date IN (
+            SELECT e2.election_date
+            FROM races r2
+            JOIN elections e2 ON r2.election_id = e2.id
+            WHERE r2.race_name = 'Straight Party'
+        )
         GROUP BY UPPER(p.precinct_name), e.election_date
     """
-    turnout_df = pd.read_sql_query(turnout_query, conn)
-    conn.close()
-
-    if df.empty:
-        return pd.DataFrame(), pd.DataFrame()
-
-    # Build precinct-level detail
-    precinct_rows = []
-    for (precinct, date), group in df.groupby(["precinct", "election_date"]):
-        d_votes = group[group["party"] == "D"]["votes"].sum()
-        r_votes = group[group["party"] == "R"]["votes"].sum()
-        total = d_votes + r_votes
-
-        # Get ballots cast for this precinct/election
-        turnout_match = turnout_df[
-            (turnout_df["precinct"] == precinct) & (turnout_df["election_date"] == date)
-        ]
-        ballots = turnout_match["ballots_cast"].sum() if not turnout_match.empty else None
-
-        precinct_rows.append({
-            "precinct": precinct,
-            "election_date": date,
-            "d_straight": d_votes,
-            "r_straight": r_votes,
-            "total_straight": total,
-            "d_straight_pct": round(d_votes / total * 100, 2) if total > 0 else None,
-            "ballots_cast": ballots,
-            "straight_pct_of_ballots": round(total / ballots * 100, 2) if ballots and ballots > 0 else None,
-        })
-
-    precinct_detail = pd.DataFrame(precinct_rows)
-
-    # Build county-wide trend summary
-    trend_rows = []
-    for date, group in precinct_detail.groupby("election_date"):
-        total_d = group["d_straight"].sum()
-        total_r = group["r_straight"].sum()
-        total_straight = group["total_straight"].sum()
-        total_ballots = group["ballots_cast"].sum() if group["ballots_cast"].notna().any() else None
-
-        trend_rows.append({
-            "election_date": date,
-            "total_d_straight": total_d,
-            "total_r_straight": total_r,
-            "total_straight": total_straight,
-            "d_straight_pct": round(total_d / total_straight * 100, 2) if total_straight > 0 else None,
-            "total_ballots": total_ballots,
-            "straight_pct_of_ballots": round(total_straight / total_ballots * 100, 2) if total_ballots and total_ballots > 0 else None,
-        })
-
-    trend_summary = pd.DataFrame(trend_rows)
-    return precinct_detail, trend_summary
-
-
+    turnout_df = _categorize(_read_sql_chunked(turnout_query, conn))
+
+    # Precinct-level detail: D and R straight votes side by side, with
+    # ballots cast joined on (precinct, election_date)
+    precinct_detail = (
+        df.pivot_table(index=["precinct", "election_date"], columns="party",
+                       values="votes", aggfunc="sum", fill_value=0, observed=True)
+        .reindex(columns=["D", "R"], fill_value=0)
+        .rename(columns={"D": "d_straight", "R": "r_straight"})
+        .rename_axis(columns=None)
+        .reset_index()
+    )
+    precinct_detail["total_straight"] = precinct_detail["d_straight"] + precinct_detail["r_straight"]
+    precinct_detail = precinct_detail.merge(turnout_df, on=["precinct", "election_date"], how="left")
+    _add_straight_pcts(precinct_detail, "d_straight", "total_straight", "ballots_cast", "d_straight_pct")
+    precinct_detail = precinct_detail[[
+        "precinct", "election_date", "d_straight", "r_straight", "total_straight",
+        "d_straight_pct", "ballots_cast", "straight_pct_of_ballots",
+    ]]
+
+    # County-wide trend summary
+    trend_summary = (
+        precinct_detail.groupby("election_date")
+        .agg(
+            total_d_straight=("d_straight", "sum"),
+            total_r_straight=("r_straight", "sum"),
+            total_straight=("total_straight", "sum"),
+            total_ballots=("ballots_cast", lambda b: b.sum(min_count=1)),
+        )
+        .reset_index()
+    )
+    _add_straight_pcts(trend_summary, "total_d_straight", "total_straight", "total_ballots", "d_straight_pct")
+    trend_summary = trend_summary[[
+        "election_date", "total_d_straight", "total_r_straight", "total_straight",
+        "d_straight_pct", "total_ballots", "straight_pct_of_ballots",
+    ]]
+    return shrink_dtypes(precinct_detail), shrink_dtypes(trend_summary)
+
+
+@njit(parallel=True, cache=True)
+def _swing_kernel(M):
+    """
+    Per-row swing stats over a (precinct x election) matrix of D shares.
+    NaN marks elections a precinct did not vote in; swings are measured
+    between consecutive elections the precinct actually has.
+    Returns (volatility, max_swing, elections_counted, avg, latest).
+    """
+    n, t = M.shape
+    volatility = np.full(n, np.nan)
+    max_swing = np.full(n, np.nan)
+    counted = np.zeros(n, np.int64)
+    avg = np.full(n, np.nan)
+    latest = np.full(n, np.nan)
+    for i in prange(n):
+        prev = np.nan
+        swing_sum = 0.0
+        swing_max = 0.0
+        swings = 0
+        total = 0.0
+        k = 0
+        for j in range(t):
+            v = M[i, j]
+            if np.isnan(v):
+                continue
+            if k > 0:
+                d = abs(v - prev)
+                swing_sum += d
+                swings += 1
+                if d > swing_max:
+                    swing_max = d
+            total += v
+            k += 1
+            prev = v
+        counted[i] = k
+        if swings > 0:
+            volatility[i] = swing_sum / swings
+            max_swing[i] = swing_max
+        if k > 0:
+            avg[i] = total / k
+            latest[i] = prev
+    return volatility, max_swing, counted, avg, latest
+
+
+def _swing_stats(M):
+    """
+    _swing_kernel, or without numba the same stats from whole-matrix ops:
+    each election is compared with the precinct's last earlier election
+    present (a running max of present column indexes).
+    """
+    if HAS_NUMBA:
+        return _swing_kernel(M)
+    n, t = M.shape
+    valid = ~np.isnan(M)
+    counted = valid.sum(axis=1)
+    last = np.maximum.accumulate(np.where(valid, np.arange(t), -1), axis=1)
+    prev = np.take_along_axis(M, np.maximum(last[:, :-1], 0), axis=1)
+    has_swing = valid[:, 1:] & (last[:, :-1] >= 0)
+    swing = np.abs(M[:, 1:] - prev)
+    swings = has_swing.sum(axis=1)
+    # cumsum adds left to right like the kernel, so 2-decimal rounding agrees
+    with np.errstate(invalid="ignore", divide="ignore"):
+        swing_sum = np.where(has_swing, swing, 0.0).cumsum(axis=1)[:, -1] if t > 1 else np.zeros(n)
+        volatility = np.where(swings > 0, swing_sum / swings, np.nan)
+        avg = np.where(valid, M, 0.0).cumsum(axis=1)[:, -1] / counted
+    max_swing = np.where(swings > 0, np.where(has_swing, swing, 0.0).max(axis=1, initial=0.0), np.nan)
+    latest = np.where(counted > 0, M[np.arange(n), np.maximum(last[:, -1], 0)], np.nan)
+    return volatility, max_swing, counted, avg, latest
+
+
+@njit(parallel=True, cache=True)
+def _pvi_kernel(M):
+    """
+    Per-row PVI stats over a (precinct x election) matrix of D shares.
+    Each column's county average is the mean over precincts present;
+    PVI is the row's mean deviation from those averages.
+    Returns (pvi, avg, elections_counted).
+    """
+    n, t = M.shape
+    col_avg = np.full(t, np.nan)
+    for j in prange(t):
+        total = 0.0
+        k = 0
+        for i in range(n):
+            v = M[i, j]
+            if not np.isnan(v):
+                total += v
+                k += 1
+        if k > 0:
+            col_avg[j] = total / k
+
+    pvi = np.full(n, np.nan)
+    avg = np.full(n, np.nan)
+    counted = np.zeros(n, np.int64)
+    for i in prange(n):
+        dev = 0.0
+        total = 0.0
+        k = 0
+        for j in range(t):
+            v = M[i, j]
+            if np.isnan(v):
+                continue
+            dev += v - col_avg[j]
+            total += v
+            k += 1
+        counted[i] = k
+        if k > 0:
+            pvi[i] = dev / k
+            avg[i] = total / k
+    return pvi, avg, counted
+
+
+@_cached_by_db_mtime
 def get_precinct_volatility(min_elections=4, db_path=None):
     """
     Measures average election-to-election D share swing per precinct.
@@ -652,22 +1035,24 @@ def get_precinct_volatility(min_elections=4, db_path=None):
     if base.empty:
         return base
 
-    results = []
-    for precinct, group in base.sort_values("election_date").groupby("precinct"):
-        if len(group) < min_elections:
-            continue
-        shares = group["d_share"].values
-        swings = np.abs(np.diff(shares))
-        results.append({
-            "precinct": precinct,
-            "volatility": round(float(np.mean(swings)), 2),
-            "max_swing": round(float(np.max(swings)), 2),
-            "elections_counted": len(group),
-            "avg_d_share": round(float(group["d_share"].mean()), 2),
-            "latest_d_share": round(float(shares[-1]), 2),
-        })
+    matrix = base.pivot(index="precinct", columns="election_date", values="d_share")
+    volatility, max_swing, counted, avg, latest = _swing_stats(
+        matrix.to_numpy(dtype=np.float64)
+    )
 
-    return pd.DataFrame(results).sort_values("volatility", ascending=False) if results else pd.DataFrame()
+    results = pd.DataFrame({
+        "precinct": matrix.index,
+        "volatility": np.round(volatility, 2),
+        "max_swing": np.round(max_swing, 2),
+        "elections_counted": counted,
+        "avg_d_share": np.round(avg, 2),
+        "latest_d_share": np.round(latest, 2),
+    })
+    results = results[results["elections_counted"] >= min_elections]
+
+    if results.empty:
+        return pd.DataFrame()
+    return shrink_dtypes(results.sort_values("volatility", ascending=False))
 
 
 def get_precinct_pvi(db_path=None):
@@ -676,7 +1061,7 @@ def get_precinct_pvi(db_path=None):
     compared to the county average, expressed as D+X or R+X.
     Uses general election presidential races only.
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
     query = """
         SELECT
             UPPER(p.precinct_name) as precinct,
@@ -696,44 +1081,38 @@ def get_precinct_pvi(db_path=None):
         GROUP BY UPPER(p.precinct_name), e.election_date
         HAVING dr_total > 0
     """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
+    df = _read_sql(query, conn)
 
     if df.empty:
         return df
 
-    df["d_share"] = (df["dem_votes"] / df["dr_total"] * 100).round(2)
-
-    # County average D share per presidential election
-    county_avg = df.groupby("election_date")["d_share"].mean().reset_index()
-    county_avg.columns = ["election_date", "county_d_share"]
+    # Per-election shares stay unrounded; only the returned stats are rounded
+    df["d_share"] = df["dem_votes"].to_numpy(dtype=np.float64) / df["dr_total"].to_numpy(dtype=np.float64) * 100
 
-    # Merge and compute deviation
-    merged = df.merge(county_avg, on="election_date")
-    merged["deviation"] = merged["d_share"] - merged["county_d_share"]
+    # Deviation from the county average per presidential election, averaged = PVI
+    matrix = df.pivot(index="precinct", columns="election_date", values="d_share")
+    pvi_values, avg, counted = _pvi_kernel(matrix.to_numpy(dtype=np.float64))
 
-    # Average deviation across all presidential elections = PVI
-    pvi = merged.groupby("precinct").agg(
-        pvi=("deviation", "mean"),
-        avg_d_share=("d_share", "mean"),
-        elections_counted=("election_date", "nunique"),
-    ).reset_index()
-
-    pvi["pvi"] = pvi["pvi"].round(1)
-    pvi["avg_d_share"] = pvi["avg_d_share"].round(2)
+    pvi = pd.DataFrame({
+        "precinct": matrix.index,
+        "pvi": np.round(pvi_values, 1),
+        "avg_d_share": np.round(avg, 2),
+        "elections_counted": counted,
+    })
     pvi["pvi_label"] = pvi["pvi"].apply(
         lambda x: f"D+{abs(x):.1f}" if x >= 0 else f"R+{abs(x):.1f}"
     )
 
-    return pvi.sort_values("pvi", ascending=False)
+    return shrink_dtypes(pvi.sort_values("pvi", ascending=False))
 
 
+@_cached_by_db_mtime
 def get_surge_voter_analysis(db_path=None):
     """
     Track registration growth per precinct vs D share change.
     Identifies 'Growing + Bluing' precincts = long-term investments.
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     turnout_query = """
         SELECT
@@ -748,8 +1127,7 @@ def get_surge_voter_analysis(db_path=None):
         GROUP BY UPPER(p.precinct_name), e.election_date
         ORDER BY UPPER(p.precinct_name), e.election_date
     """
-    turnout_df = pd.read_sql_query(turnout_query, conn)
-    conn.close()
+    turnout_df = _read_sql(turnout_query, conn)
 
     if turnout_df.empty:
         return pd.DataFrame()
@@ -759,62 +1137,48 @@ def get_surge_voter_analysis(db_path=None):
     if base.empty:
         return pd.DataFrame()
 
-    # Compute growth: earliest vs latest registered_voters
-    growth_rows = []
-    for precinct, group in turnout_df.sort_values("election_date").groupby("precinct"):
-        if len(group) < 2:
-            continue
-        earliest_reg = group.iloc[0]["registered_voters"]
-        latest_reg = group.iloc[-1]["registered_voters"]
-        earliest_date = group.iloc[0]["election_date"]
-        latest_date = group.iloc[-1]["election_date"]
-
-        reg_growth_pct = round((latest_reg - earliest_reg) / earliest_reg * 100, 2) if earliest_reg > 0 else 0.0
-
-        # Get D share change for same precinct
-        pct_base = base[base["precinct"] == precinct].sort_values("election_date")
-        if len(pct_base) < 2:
-            d_share_change = 0.0
-        else:
-            d_share_change = round(float(pct_base.iloc[-1]["d_share"] - pct_base.iloc[0]["d_share"]), 2)
-
-        growth_rows.append({
-            "precinct": precinct,
-            "earliest_registered": int(earliest_reg),
-            "latest_registered": int(latest_reg),
-            "reg_growth_pct": reg_growth_pct,
-            "d_share_change": d_share_change,
-            "earliest_date": earliest_date,
-            "latest_date": latest_date,
-        })
-
-    result = pd.DataFrame(growth_rows)
+    # Compute growth: earliest vs latest registered_voters (both queries
+    # come back ordered by precinct, then election_date)
+    result = turnout_df.groupby("precinct").agg(
+        earliest_registered=("registered_voters", "first"),
+        latest_registered=("registered_voters", "last"),
+        earliest_date=("election_date", "first"),
+        latest_date=("election_date", "last"),
+        n=("election_date", "size"),
+    )
+    result = result[result["n"] >= 2].drop(columns="n")
     if result.empty:
-        return result
+        return pd.DataFrame()
 
-    # Assign quadrants
-    med_growth = result["reg_growth_pct"].median()
-    med_d_change = result["d_share_change"].median()
+    earliest = result["earliest_registered"].to_numpy(dtype=np.float64)
+    latest = result["latest_registered"].to_numpy(dtype=np.float64)
+    result.insert(2, "reg_growth_pct", np.round((latest - earliest) / earliest * 100, 2))
 
-    def assign_quadrant(row):
-        growing = row["reg_growth_pct"] >= med_growth
-        bluing = row["d_share_change"] >= med_d_change
-        if growing and bluing:
-            return "Growing + Bluing"
-        elif growing and not bluing:
-            return "Growing + Reddening"
-        elif not growing and bluing:
-            return "Stable + Bluing"
-        else:
-            return "Stable + Reddening"
+    # D share change over the same precinct's elections (0 with fewer than 2)
+    shares = base.groupby("precinct")["d_share"].agg(["first", "last", "size"]).reindex(result.index)
+    change = (shares["last"] - shares["first"]).to_numpy(dtype=np.float64)
+    result.insert(3, "d_share_change", np.where(shares["size"].to_numpy() >= 2, np.round(change, 2), 0.0))
+    result = result.reset_index()
+
+    # Assign quadrants based on medians (both in one pass)
+    med_growth, med_d_change = np.nanmedian(
+        result[["reg_growth_pct", "d_share_change"]].to_numpy(dtype=np.float64), axis=0
+    )
 
-    result["quadrant"] = result.apply(assign_quadrant, axis=1)
-    result.attrs["median_growth"] = med_growth
-    result.attrs["median_d_change"] = med_d_change
+    growing = result["reg_growth_pct"].to_numpy() >= med_growth
+    bluing = result["d_share_change"].to_numpy() >= med_d_change
+    result["quadrant"] = np.select(
+        [growing & bluing, growing, bluing],
+        ["Growing + Bluing", "Growing + Reddening", "Stable + Bluing"],
+        default="Stable + Reddening",
+    )
+    result["_med_growth"] = med_growth
+    result["_med_d_change"] = med_d_change
 
-    return result
+    return shrink_dtypes(result)
 
 
+@_cached_by_db_mtime
 def get_uncontested_race_mapping(db_path=None):
     """
     Map contested vs uncontested races per election.
@@ -822,37 +1186,60 @@ def get_uncontested_race_mapping(db_path=None):
     contested races at the same level in the same election.
     Returns (summary_pivot, uncontested_r_detail).
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
-    # Identify contested vs uncontested races
+    # Contested vs uncontested races, with each race's latent-D baseline:
+    # the D share of contested races at the same level in the same election.
+    # total_votes counts every party's votes in the race.
     query = """
-        SELECT
-            r.id as race_id,
-            r.race_name,
-            r.race_level,
-            e.election_date,
-            e.election_type,
-            GROUP_CONCAT(DISTINCT c.party) as parties
-        FROM races r
-        JOIN results res ON res.race_id = r.id
-        JOIN candidates c ON res.candidate_id = c.id
-        JOIN elections e ON r.election_id = e.id
-        WHERE r.race_level IN ('federal', 'state', 'county', 'local')
-          AND e.election_type = 'general'
-          AND c.party IN ('D', 'R')
-        GROUP BY r.id
+        WITH race_parties AS (
+            SELECT
+                r.id as race_id,
+                r.race_name,
+                r.race_level,
+                e.election_date,
+                e.election_type,
+                MAX(CASE WHEN c.party = 'D' THEN 1 ELSE 0 END) as has_d,
+                MAX(CASE WHEN c.party = 'R' THEN 1 ELSE 0 END) as has_r,
+                SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as d_votes,
+                SUM(CASE WHEN c.party IN ('D', 'R') THEN res.votes ELSE 0 END) as dr_votes,
+                SUM(res.votes) as total_votes
+            FROM races r
+            JOIN results res ON res.race_id = r.id
+            JOIN candidates c ON res.candidate_id = c.id
+            JOIN elections e ON r.election_id = e.id
+            WHERE r.race_level IN ('federal', 'state', 'county', 'local')
+              AND e.election_type = 'general'
+            GROUP BY r.id
+            HAVING has_d OR has_r
+        ),
+        contested_share AS (
+            SELECT
+                election_date,
+                race_level,
+                SUM(d_votes) as baseline_d_votes,
+                SUM(dr_votes) as baseline_dr_total
+            FROM race_parties
+            WHERE has_d AND has_r
+            GROUP BY election_date, race_level
+            HAVING baseline_dr_total > 0
+        )
+        SELECT rp.*, cs.baseline_d_votes, cs.baseline_dr_total
+        FROM race_parties rp
+        LEFT JOIN contested_share cs
+          ON cs.election_date = rp.election_date AND cs.race_level = rp.race_level
+        ORDER BY rp.race_id
     """
-    races_df = pd.read_sql_query(query, conn)
+    races_df = _downcast_ints(_read_sql(query, conn))
 
     if races_df.empty:
-        conn.close()
         return pd.DataFrame(), pd.DataFrame()
 
-    # Classify each race
-    races_df["status"] = races_df["parties"].apply(
-        lambda p: "Contested" if "D" in str(p) and "R" in str(p)
-        else ("Uncontested D" if "D" in str(p) else "Uncontested R")
-    )
+    # Classify each race from the D/R flags (every race has at least one)
+    has_d = races_df["has_d"].to_numpy(dtype=bool)
+    has_r = races_df["has_r"].to_numpy(dtype=bool)
+    contested = has_d & has_r
+    races_df["status"] = np.select([contested, has_d], ["Contested", "Uncontested D"], "Uncontested R")
 
     # Summary: contested vs uncontested by election year
     summary = races_df.groupby(["election_date", "status"]).size().reset_index(name="count")
@@ -861,65 +1248,26 @@ def get_uncontested_race_mapping(db_path=None):
     ).reset_index()
 
     # For uncontested R races, estimate latent D support
-    uncontested_r = races_df[races_df["status"] == "Uncontested R"].copy()
+    uncontested_r = races_df[races_df["status"].to_numpy() == "Uncontested R"]
+    race_cols = ["race_id", "race_name", "race_level", "election_date", "election_type", "status"]
+    if (contested & (races_df["dr_votes"].to_numpy() > 0)).any():
+        baseline = np.round(
+            uncontested_r["baseline_d_votes"].to_numpy(dtype=np.float64)
+            / uncontested_r["baseline_dr_total"].to_numpy(dtype=np.float64) * 100, 2
+        )
+        uncontested_r = uncontested_r[race_cols + ["total_votes"]].assign(baseline_d_share=baseline)
+        uncontested_r["estimated_latent_d_votes"] = np.round(
+            uncontested_r["total_votes"].to_numpy(dtype=np.float64) * np.nan_to_num(baseline) / 100, 0
+        )
+    else:
+        # No contested race to take a baseline from
+        uncontested_r = uncontested_r[race_cols]
 
-    if not uncontested_r.empty:
-        # Get D share from contested races per election per race_level
-        contested_share_query = """
-            SELECT
-                e.election_date,
-                r.race_level,
-                SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as d_votes,
-                SUM(CASE WHEN c.party IN ('D','R') THEN res.votes ELSE 0 END) as dr_total
-            FROM results res
-            JOIN races r ON res.race_id = r.id
-            JOIN candidates c ON res.candidate_id = c.id
-            JOIN elections e ON r.election_id = e.id
-            WHERE r.race_level IN ('federal', 'state', 'county', 'local')
-              AND e.election_type = 'general'
-              AND c.party IN ('D', 'R')
-              AND r.id IN (
-                  SELECT r2.id FROM races r2
-                  JOIN results res2 ON res2.race_id = r2.id
-                  JOIN candidates c2 ON res2.candidate_id = c2.id
-                  WHERE c2.party IN ('D','R')
-                  GROUP BY r2.id
-                  HAVING COUNT(DISTINCT c2.party) = 2
-              )
-            GROUP BY e.election_date, r.race_level
-            HAVING dr_total > 0
-        """
-        contested_shares = pd.read_sql_query(contested_share_query, conn)
-        if not contested_shares.empty:
-            contested_shares["baseline_d_share"] = (
-                contested_shares["d_votes"] / contested_shares["dr_total"] * 100
-            ).round(2)
-
-            # Get total votes for uncontested R races
-            unc_race_ids = ",".join(str(x) for x in uncontested_r["race_id"].tolist())
-            unc_votes_query = f"""
-                SELECT r.id as race_id, SUM(res.votes) as total_votes
-                FROM results res
-                JOIN races r ON res.race_id = r.id
-                WHERE r.id IN ({unc_race_ids})
-                GROUP BY r.id
-            """
-            unc_votes = pd.read_sql_query(unc_votes_query, conn)
-
-            uncontested_r = uncontested_r.merge(unc_votes, on="race_id", how="left")
-            uncontested_r = uncontested_r.merge(
-                contested_shares[["election_date", "race_level", "baseline_d_share"]],
-                on=["election_date", "race_level"],
-                how="left"
-            )
-            uncontested_r["estimated_latent_d_votes"] = (
-                uncontested_r["total_votes"].fillna(0) * uncontested_r["baseline_d_share"].fillna(0) / 100
-            ).round(0)
-
-    conn.close()
-    return summary_pivot, uncontested_r.sort_values(
-        "estimated_latent_d_votes", ascending=False
-    ) if not uncontested_r.empty else (summary_pivot, pd.DataFrame())
+    if uncontested_r.empty:
+        return shrink_dtypes(summary_pivot), pd.DataFrame()
+    if "estimated_latent_d_votes" in uncontested_r.columns:
+        uncontested_r = uncontested_r.sort_values("estimated_latent_d_votes", ascending=False)
+    return shrink_dtypes(summary_pivot), shrink_dtypes(uncontested_r)
 
 
 def get_third_party_persuadability(db_path=None):
@@ -928,38 +1276,48 @@ def get_third_party_persuadability(db_path=None):
     Flags 'flippable' precincts where third-party vote exceeds D-R margin.
     Returns (aggregate_df, detail_df).
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
+    # Shares are computed in SQL over the vote sums (same operation order as
+    # numpy, so only the rounding is left for pandas)
     query = """
         SELECT
-            UPPER(p.precinct_name) as precinct,
-            e.election_date,
-            SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as dem_votes,
-            SUM(CASE WHEN c.party = 'R' THEN res.votes ELSE 0 END) as rep_votes,
-            SUM(CASE WHEN c.party IN ('L', 'I', 'WTP')
-                THEN res.votes ELSE 0 END) as third_party_votes,
-            SUM(res.votes) as total_votes
-        FROM results res
-        JOIN races r ON res.race_id = r.id
-        JOIN candidates c ON res.candidate_id = c.id
-        JOIN elections e ON r.election_id = e.id
-        JOIN precincts p ON res.precinct_id = p.id
-        WHERE e.election_type = 'general'
-          AND r.race_name <> 'Straight Party'
-          AND r.race_level IN ('federal', 'state', 'county', 'local')
-          AND res.precinct_id IS NOT NULL
-        GROUP BY UPPER(p.precinct_name), e.election_date
+            *,
+            third_party_votes * 1.0 / total_votes * 100 as third_party_pct,
+            (dem_votes - rep_votes) * 1.0 / total_votes * 100 as dr_margin
+        FROM (
+            SELECT
+                UPPER(p.precinct_name) as precinct,
+                e.election_date,
+                SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as dem_votes,
+                SUM(CASE WHEN c.party = 'R' THEN res.votes ELSE 0 END) as rep_votes,
+                SUM(CASE WHEN c.party IN ('L', 'I', 'WTP')
+                    THEN res.votes ELSE 0 END) as third_party_votes,
+                SUM(res.votes) as total_votes
+            FROM results res
+            JOIN races r ON res.race_id = r.id
+            JOIN candidates c ON res.candidate_id = c.id
+            JOIN elections e ON r.election_id = e.id
+            JOIN precincts p ON res.precinct_id = p.id
+            WHERE e.election_type = 'general'
+              AND r.race_name <> 'Straight Party'
+              AND r.race_level IN ('federal', 'state', 'county', 'local')
+              AND res.precinct_id IS NOT NULL
+            GROUP BY UPPER(p.precinct_name), e.election_date
+            HAVING SUM(res.votes) > 0
+        )
     """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
+    df = _downcast_ints(_read_sql(query, conn))
 
     if df.empty:
         return pd.DataFrame(), pd.DataFrame()
 
-    df = df[df["total_votes"] > 0].copy()
-    df["third_party_pct"] = (df["third_party_votes"] / df["total_votes"] * 100).round(2)
-    df["dr_margin"] = ((df["dem_votes"] - df["rep_votes"]) / df["total_votes"] * 100).round(2)
-    df["margin_abs"] = df["dr_margin"].abs()
-    df["flippable"] = df["third_party_pct"] > df["margin_abs"]
+    # Rounded in numpy: SQLite's ROUND() breaks exact .xx5 ties the other way
+    third_party_pct = np.round(df["third_party_pct"].to_numpy(dtype=np.float64), 2)
+    dr_margin = np.round(df["dr_margin"].to_numpy(dtype=np.float64), 2)
+    df["third_party_pct"] = third_party_pct
+    df["dr_margin"] = dr_margin
+    df["margin_abs"] = np.abs(dr_margin)
+    df["flippable"] = third_party_pct > df["margin_abs"].to_numpy()
 
     # Aggregate across elections
     agg = df.groupby("precinct").agg(
@@ -973,7 +1331,33 @@ def get_third_party_persuadability(db_path=None):
     agg["avg_margin"] = agg["avg_margin"].round(2)
     agg = agg.sort_values("avg_third_party_pct", ascending=False)
 
-    return agg, df
+    return shrink_dtypes(agg), shrink_dtypes(df)
+
+
+@njit(parallel=True, cache=True)
+def _rolloff_kernel(ballots, votes):
+    """
+    Rolloff % per race row, (ballots - votes) / ballots * 100 rounded to 2
+    decimals and clamped at 0 (multi-vote races can exceed ballots_cast),
+    in one pass over both columns.
+    """
+    out = np.empty(ballots.size)
+    for i in prange(ballots.size):
+        v = np.round((ballots[i] - votes[i]) / ballots[i] * 100, 2)
+        out[i] = 0.0 if v < 0 else v
+    return out
+
+
+def _rolloff_pct(ballots, votes):
+    """_rolloff_kernel, or without numba the same steps in place on one array."""
+    if HAS_NUMBA:
+        return _rolloff_kernel(ballots, votes)
+    out = np.subtract(ballots, votes, dtype=np.float64)
+    out /= ballots
+    out *= 100
+    np.round(out, 2, out=out)
+    out[out < 0] = 0.0
+    return out
 
 
 def get_rolloff_analysis(db_path=None):
@@ -982,7 +1366,7 @@ def get_rolloff_analysis(db_path=None):
     rolloff = (ballots_cast - race_votes) / ballots_cast per precinct per election.
     Returns (avg_rolloff_df, heatmap_df).
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     turnout_query = """
         SELECT
@@ -996,7 +1380,7 @@ def get_rolloff_analysis(db_path=None):
           AND t.ballots_cast > 0
         GROUP BY UPPER(p.precinct_name), e.election_date
     """
-    turnout_df = pd.read_sql_query(turnout_query, conn)
+    turnout_df = _downcast_ints(_read_sql(turnout_query, conn))
 
     votes_query = """
         SELECT
@@ -1014,8 +1398,7 @@ def get_rolloff_analysis(db_path=None):
           AND r.race_level IN ('federal', 'state', 'county', 'local')
         GROUP BY UPPER(p.precinct_name), e.election_date, r.id
     """
-    votes_df = pd.read_sql_query(votes_query, conn)
-    conn.close()
+    votes_df = _downcast_ints(_read_sql(votes_query, conn))
 
     if turnout_df.empty or votes_df.empty:
         return pd.DataFrame(), pd.DataFrame()
@@ -1024,11 +1407,10 @@ def get_rolloff_analysis(db_path=None):
     merged = votes_df.merge(turnout_df, on=["precinct", "election_date"], how="inner")
 
     # Compute rolloff per race, clamp at 0 (multi-vote races can exceed ballots_cast)
-    merged["rolloff"] = (
-        (merged["ballots_cast"] - merged["race_total_votes"])
-        / merged["ballots_cast"] * 100
-    ).round(2)
-    merged["rolloff"] = merged["rolloff"].clip(lower=0)
+    merged["rolloff"] = _rolloff_pct(
+        merged["ballots_cast"].to_numpy(dtype=np.float64),
+        merged["race_total_votes"].to_numpy(dtype=np.float64),
+    )
 
     # Average rolloff per precinct per election
     avg_rolloff = merged.groupby(["precinct", "election_date"]).agg(
@@ -1045,11 +1427,11 @@ def get_rolloff_analysis(db_path=None):
         values="avg_rolloff",
         aggfunc="first"
     )
-    heatmap["_avg"] = heatmap.mean(axis=1)
-    heatmap = heatmap.sort_values("_avg", ascending=False)
-    heatmap = heatmap.drop(columns=["_avg"])
+    # Highest average rolloff first, ordered from the row means directly
+    order = np.argsort(-heatmap.mean(axis=1).to_numpy(), kind="stable")
+    heatmap = heatmap.iloc[order]
 
-    return avg_rolloff, heatmap
+    return shrink_dtypes(avg_rolloff), shrink_dtypes(heatmap)
 
 
 def get_straight_ticket_geography(db_path=None):
@@ -1057,7 +1439,7 @@ def get_straight_ticket_geography(db_path=None):
     Straight-ticket D votes as % of total D votes per precinct per election.
     Classifies: Brand-Dependent (>=40%), Mixed (20-40%), Candidate-Dependent (<20%).
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     query = """
         SELECT
@@ -1077,8 +1459,7 @@ def get_straight_ticket_geography(db_path=None):
         GROUP BY UPPER(p.precinct_name), e.election_date
         HAVING total_d_votes > 0
     """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
+    df = _read_sql(query, conn)
 
     if df.empty:
         return df
@@ -1087,13 +1468,13 @@ def get_straight_ticket_geography(db_path=None):
         df["straight_d_votes"] / df["total_d_votes"] * 100
     ).round(2)
 
-    df["dependency"] = df["straight_d_pct_of_total"].apply(
-        lambda x: "Brand-Dependent" if x >= 40 else (
-            "Mixed" if x >= 20 else "Candidate-Dependent"
-        )
-    )
+    # Category codes straight from the thresholds (0 = Brand-Dependent at
+    # >= 40, 1 = Mixed at >= 20, 2 = Candidate-Dependent), no label strings
+    pct = df["straight_d_pct_of_total"].to_numpy()
+    codes = (pct < 40).astype(np.int8) + (pct < 20)
+    df["dependency"] = pd.Categorical.from_codes(codes, categories=DEPENDENCY_LEVELS)
 
-    return df
+    return shrink_dtypes(df)
 
 
 def get_headline_kpis(db_path=None):
@@ -1101,122 +1482,104 @@ def get_headline_kpis(db_path=None):
     Generate headline KPIs with deltas comparing latest vs prior general election.
     Returns dict with D share, turnout, straight-ticket D%, contested race counts.
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
+    # The two elections are resolved to ids once, so the KPI query below
+    # filters on election_id without joining elections again
     elections_query = """
-        SELECT DISTINCT election_date FROM elections
+        SELECT id, election_date FROM elections
         WHERE election_type = 'general'
         ORDER BY election_date DESC LIMIT 2
     """
-    elections = pd.read_sql_query(elections_query, conn)
+    elections = conn.execute(elections_query).fetchall()
 
     if len(elections) < 2:
-        conn.close()
         return {}
 
-    latest = elections.iloc[0]["election_date"]
-    prior = elections.iloc[1]["election_date"]
+    (latest_id, latest), (prior_id, prior) = elections
 
-    # D vote share
-    share_query = """
+    # D vote share, turnout, straight-ticket D% and D contested races for
+    # both elections in one round trip, as (metric, election_id, value, total)
+    # rows; value / total is the percentage for the two share metrics.
+    kpi_query = """
         SELECT
-            e.election_date,
-            SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as dem_votes,
-            SUM(CASE WHEN c.party IN ('D', 'R') THEN res.votes ELSE 0 END) as dr_total
+            'd_share' as metric,
+            r.election_id,
+            SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as value,
+            SUM(res.votes) as total
         FROM results res
         JOIN races r ON res.race_id = r.id
         JOIN candidates c ON res.candidate_id = c.id
-        JOIN elections e ON r.election_id = e.id
-        WHERE e.election_date IN (?, ?)
+        WHERE r.election_id IN (?, ?)
           AND c.party IN ('D', 'R')
           AND r.race_level IN ('federal', 'state', 'county', 'local')
-        GROUP BY e.election_date
-    """
-    share_df = pd.read_sql_query(share_query, conn, params=[latest, prior])
+        GROUP BY r.election_id
 
-    # Turnout
-    turnout_query = """
-        SELECT
-            e.election_date,
-            AVG(t.turnout_percentage) as avg_turnout
+        UNION ALL
+
+        SELECT 'turnout', t.election_id, AVG(t.turnout_percentage), NULL
         FROM turnout t
-        JOIN elections e ON t.election_id = e.id
-        WHERE e.election_date IN (?, ?)
+        WHERE t.election_id IN (?, ?)
           AND t.precinct_id IS NOT NULL
           AND t.turnout_percentage > 0 AND t.turnout_percentage <= 100
-        GROUP BY e.election_date
-    """
-    turnout_df = pd.read_sql_query(turnout_query, conn, params=[latest, prior])
+        GROUP BY t.election_id
+
+        UNION ALL
 
-    # Straight-ticket D%
-    straight_query = """
         SELECT
-            e.election_date,
-            SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as d_straight,
-            SUM(res.votes) as total_straight
+            'straight_d_pct',
+            r.election_id,
+            SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END),
+            SUM(res.votes)
         FROM results res
         JOIN races r ON res.race_id = r.id
         JOIN candidates c ON res.candidate_id = c.id
-        JOIN elections e ON r.election_id = e.id
         WHERE r.race_name = 'Straight Party'
           AND c.party IN ('D', 'R')
-          AND e.election_date IN (?, ?)
-        GROUP BY e.election_date
-    """
-    straight_df = pd.read_sql_query(straight_query, conn, params=[latest, prior])
+          AND r.election_id IN (?, ?)
+        GROUP BY r.election_id
 
-    # D contested races
-    contested_query = """
-        SELECT
-            e.election_date,
-            COUNT(DISTINCT r.id) as d_contested
+        UNION ALL
+
+        SELECT 'd_contested', r.election_id, COUNT(DISTINCT r.id), NULL
         FROM races r
         JOIN results res ON res.race_id = r.id
         JOIN candidates c ON res.candidate_id = c.id
-        JOIN elections e ON r.election_id = e.id
         WHERE c.party = 'D'
-          AND e.election_date IN (?, ?)
+          AND r.election_id IN (?, ?)
           AND r.race_level IN ('federal', 'state', 'county', 'local')
-        GROUP BY e.election_date
-    """
-    contested_df = pd.read_sql_query(contested_query, conn, params=[latest, prior])
-
-    conn.close()
+        GROUP BY r.election_id
+    """
+    df = _read_sql(kpi_query, conn, params=[latest_id, prior_id] * 4)
+
+    value = df["value"].to_numpy(dtype=float)
+    total = df["total"].to_numpy(dtype=float)
+    is_share = df["metric"].isin(["d_share", "straight_d_pct"]).to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = np.where(total > 0, value / total * 100, 0.0)
+    df["value"] = np.where(is_share, share, value)
+
+    # metric -> delta key; a metric an election has no rows for is left out
+    deltas = {
+        "d_share": "d_share_delta",
+        "turnout": "turnout_delta",
+        "straight_d_pct": "straight_d_delta",
+        "d_contested": "d_contested_delta",
+    }
+    grid = df.pivot(index="metric", columns="election_id", values="value").reindex(
+        index=list(deltas), columns=[latest_id, prior_id]
+    )
 
     # Build KPI dict
     kpis = {"latest_election": latest, "prior_election": prior}
 
-    for _, row in share_df.iterrows():
-        d_share = round(row["dem_votes"] / row["dr_total"] * 100, 1) if row["dr_total"] > 0 else 0
-        if row["election_date"] == latest:
-            kpis["d_share_latest"] = d_share
-        else:
-            kpis["d_share_prior"] = d_share
-    kpis["d_share_delta"] = round(kpis.get("d_share_latest", 0) - kpis.get("d_share_prior", 0), 1)
-
-    for _, row in turnout_df.iterrows():
-        if row["election_date"] == latest:
-            kpis["turnout_latest"] = round(row["avg_turnout"], 1)
-        else:
-            kpis["turnout_prior"] = round(row["avg_turnout"], 1)
-    kpis["turnout_delta"] = round(kpis.get("turnout_latest", 0) - kpis.get("turnout_prior", 0), 1)
-
-    for _, row in straight_df.iterrows():
-        d_pct = round(row["d_straight"] / row["total_straight"] * 100, 1) if row["total_straight"] > 0 else 0
-        if row["election_date"] == latest:
-            kpis["straight_d_pct_latest"] = d_pct
-        else:
-            kpis["straight_d_pct_prior"] = d_pct
-    kpis["straight_d_delta"] = round(
-        kpis.get("straight_d_pct_latest", 0) - kpis.get("straight_d_pct_prior", 0), 1
-    )
-
-    for _, row in contested_df.iterrows():
-        if row["election_date"] == latest:
-            kpis["d_contested_latest"] = int(row["d_contested"])
-        else:
-            kpis["d_contested_prior"] = int(row["d_contested"])
-    kpis["d_contested_delta"] = kpis.get("d_contested_latest", 0) - kpis.get("d_contested_prior", 0)
+    for metric, delta_key in deltas.items():
+        for suffix, election_id in (("latest", latest_id), ("prior", prior_id)):
+            val = grid.at[metric, election_id]
+            if pd.notna(val):
+                kpis[f"{metric}_{suffix}"] = int(val) if metric == "d_contested" else round(float(val), 1)
+        delta = kpis.get(f"{metric}_latest", 0) - kpis.get(f"{metric}_prior", 0)
+        kpis[delta_key] = delta if metric == "d_contested" else round(delta, 1)
 
     return kpis
 
@@ -1226,11 +1589,22 @@ def get_top_opportunities(db_path=None):
     Auto-generate top 3 strategic opportunities by synthesizing other analyses.
     Returns list of dicts: [{"title": str, "detail": str, "source": str}, ...]
     """
+    # The source analyses are independent, so they run side by side (sqlite3
+    # releases the GIL while a query runs), each worker on its own _read_conn.
+    # An analysis that failed raises from .result() in its block below.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {
+            "turnout_dem": pool.submit(get_turnout_vs_dem_share, db_path=db_path),
+            "volatility": pool.submit(get_precinct_volatility, db_path=db_path),
+            "uncontested": pool.submit(get_uncontested_race_mapping, db_path=db_path),
+            "surge": pool.submit(get_surge_voter_analysis, db_path=db_path),
+        }
+
     opportunities = []
 
     # 1: Best mobilization goldmine precinct
     try:
-        turnout_dem = get_turnout_vs_dem_share(db_path=db_path)
+        turnout_dem = futures["turnout_dem"].result()
         if not turnout_dem.empty:
             goldmines = turnout_dem[turnout_dem["quadrant"] == "Mobilization Goldmine"]
             if not goldmines.empty:
@@ -1248,7 +1622,7 @@ def get_top_opportunities(db_path=None):
 
     # 2: Highest volatility D-leaning precinct
     try:
-        volatility = get_precinct_volatility(db_path=db_path)
+        volatility = futures["volatility"].result()
         if not volatility.empty:
             persuadable = volatility[volatility["avg_d_share"] >= 35].head(1)
             if not persuadable.empty:
@@ -1266,7 +1640,7 @@ def get_top_opportunities(db_path=None):
 
     # 3: Best uncontested R seat to contest
     try:
-        _, uncontested_detail = get_uncontested_race_mapping(db_path=db_path)
+        _, uncontested_detail = futures["uncontested"].result()
         if not uncontested_detail.empty and "estimated_latent_d_votes" in uncontested_detail.columns:
             latest_unc = uncontested_detail[
                 uncontested_detail["election_date"] == uncontested_detail["election_date"].max()
@@ -1288,7 +1662,7 @@ def get_top_opportunities(db_path=None):
     # 4 (fallback): Fastest-growing D-trending precinct
     if len(opportunities) < 3:
         try:
-            surge = get_surge_voter_analysis(db_path=db_path)
+            surge = futures["surge"].result()
             if not surge.empty:
                 growing_blue = surge[surge["quadrant"] == "Growing + Bluing"]
                 if not growing_blue.empty:
@@ -1312,7 +1686,7 @@ def get_election_overview(db_path=None):
     Get a summary overview of all elections for the Data Explorer tab.
     Returns one row per election with counts and quality scores.
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     query = """
         SELECT
@@ -1345,9 +1719,8 @@ def get_election_overview(db_path=None):
         ORDER BY e.election_date
     """
 
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-    return df
+    df = _read_sql(query, conn)
+    return shrink_dtypes(df)
 
 
 def get_area_election_summary(db_path=None):
@@ -1357,7 +1730,7 @@ def get_area_election_summary(db_path=None):
 
     Returns DataFrame with: area, avg_d_share, avg_turnout, elections_counted
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     # Get precinct-level D share across all general elections
     query = """
@@ -1378,7 +1751,7 @@ def get_area_election_summary(db_path=None):
           AND r.race_level IN ('federal', 'state', 'county')
         GROUP BY p.precinct_name, e.election_date
     """
-    df = pd.read_sql_query(query, conn)
+    df = _read_sql(query, conn)
 
     # Get turnout data
     turnout_query = """
@@ -1393,8 +1766,7 @@ def get_area_election_summary(db_path=None):
           AND t.turnout_percentage <= 100
         GROUP BY p.precinct_name
     """
-    turnout_df = pd.read_sql_query(turnout_query, conn)
-    conn.close()
+    turnout_df = _read_sql(turnout_query, conn)
 
     if df.empty:
         return pd.DataFrame()
@@ -1478,10 +1850,10 @@ def get_2026_target_races(db_path=None):
         - 'uncontested_history': DataFrame of races R held uncontested in 2022
         - 'trend_races': DataFrame of races where D share is trending up
     """
-    conn = get_connection(db_path)
+    conn = _read_conn(db_path)
 
     # --- 1. Get all races from the last 3 midterm generals (2022, 2018, 2014) ---
-    history = pd.read_sql_query("""
+    history = _read_sql("""
         WITH race_party_votes AS (
             SELECT
                 e.election_date,
@@ -1520,7 +1892,7 @@ def get_2026_target_races(db_path=None):
     """, conn)
 
     # --- 2. Build expected 2026 race list from 2022 races ---
-    races_2022 = pd.read_sql_query("""
+    races_2022 = _read_sql("""
         SELECT
             r.normalized_name, r.race_level,
             GROUP_CONCAT(DISTINCT c.party) as parties_2022,
@@ -1536,8 +1908,6 @@ def get_2026_target_races(db_path=None):
         ORDER BY r.race_level, r.normalized_name
     """, conn)
 
-    conn.close()
-
     if history.empty or races_2022.empty:
         return {
             "races": pd.DataFrame(),
@@ -1547,75 +1917,81 @@ def get_2026_target_races(db_path=None):
         }
 
     # --- 3. For each 2022 race, compute historical D performance ---
-    race_list = []
-    for _, row in races_2022.iterrows():
-        race_name = row["normalized_name"]
-        race_level = row["race_level"]
-
-        # Skip ballot measures, straight party, "No Candidate Filed", etc.
-        skip_names = ["Straight Party", "Public Question"]
-        if any(s.lower() in race_name.lower() for s in skip_names):
-            continue
-
-        # Get historical data for this race
-        race_history = history[history["normalized_name"] == race_name].sort_values("year")
-
-        # Latest D% (most recent cycle with a contested D vs R race)
-        contested = race_history[race_history["d_2party_pct"].notna() & (race_history["d_2party_pct"] > 0)]
-        latest_d_pct = contested["d_2party_pct"].iloc[-1] if len(contested) > 0 else None
-        latest_year = contested["year"].iloc[-1] if len(contested) > 0 else None
-
-        # Number of times D has contested this race
-        d_contested_count = len(contested)
-        total_cycles = len(race_history)
-
-        # Trend: is D share going up?
-        d_trend = None
-        if len(contested) >= 2:
-            d_trend = round(contested["d_2party_pct"].iloc[-1] - contested["d_2party_pct"].iloc[0], 1)
-
-        # Was it uncontested in 2022?
-        was_2022_uncontested = "D" not in (row["parties_2022"] or "")
-
-        # Classify priority
-        if latest_d_pct is not None and latest_d_pct >= 45:
-            priority = "High"
-        elif latest_d_pct is not None and latest_d_pct >= 35:
-            priority = "Medium"
-        elif was_2022_uncontested:
-            priority = "Recruit"
-        else:
-            priority = "Low"
-
-        # Classify action
-        if latest_d_pct is not None and latest_d_pct >= 45:
-            action = "Win — competitive, invest resources"
-        elif was_2022_uncontested and latest_d_pct is None:
-            action = "Recruit — never contested, need candidate"
-        elif was_2022_uncontested and latest_d_pct is not None:
-            action = f"Recruit — D got {latest_d_pct}% in {latest_year}, ran unopposed in 2022"
-        elif d_trend is not None and d_trend > 5:
-            action = f"Trending — D gained {d_trend} pts over cycle"
-        elif latest_d_pct is not None and latest_d_pct >= 35:
-            action = "Build — close enough to invest in"
-        else:
-            action = "Monitor"
-
-        race_list.append({
-            "race": race_name,
-            "level": race_level,
-            "latest_d_pct": latest_d_pct,
-            "latest_d_year": latest_year,
-            "d_contested": f"{d_contested_count}/{total_cycles}",
-            "d_trend": d_trend,
-            "uncontested_2022": was_2022_uncontested,
-            "priority": priority,
-            "action": action,
-            "parties_2022": row["parties_2022"],
-            "candidates_2022": row["candidates_2022"],
-        })
-
-    races_df = pd.DataFrame(race_list)
+    # Skip ballot measures, straight party, "No Candidate Filed", etc.
+    skip = races_2022["normalized_name"].str.contains("straight party|public question", case=False)
+    races_2022 = races_2022[~skip.to_numpy(dtype=bool)]
+
+    # Per-race history stats in one groupby (history is ordered by name, date).
+    # Latest D% is from the most recent cycle with a contested D vs R race.
+    pct = history["d_2party_pct"]
+    contested = history[pct.notna() & (pct > 0)]
+    cstats = contested.groupby("normalized_name").agg(
+        first_pct=("d_2party_pct", "first"),
+        latest_d_pct=("d_2party_pct", "last"),
+        latest_d_year=("year", "last"),
+        d_contested_count=("year", "size"),
+    )
+    names = races_2022["normalized_name"]
+    cstats = cstats.reindex(names)
+    total_cycles = history.groupby("normalized_name").size().reindex(names, fill_value=0).to_numpy()
+    contested_count = cstats["d_contested_count"].fillna(0).to_numpy(dtype=np.int64)
+
+    latest_d_pct = cstats["latest_d_pct"].to_numpy(dtype=np.float64)
+    latest_d_year = cstats["latest_d_year"]
+    # Trend: change in D share from the first to the latest contested cycle
+    d_trend = np.where(
+        contested_count >= 2,
+        np.round(latest_d_pct - cstats["first_pct"].to_numpy(dtype=np.float64), 1),
+        np.nan,
+    )
+
+    # Was it uncontested (no D candidate) in 2022?
+    parties_2022 = races_2022["parties_2022"]
+    uncontested_2022 = ~parties_2022.fillna("").str.contains("D", regex=False).to_numpy(dtype=bool)
+
+    # Classify priority (NaN latest D% fails every comparison)
+    priority = np.select(
+        [latest_d_pct >= 45, latest_d_pct >= 35, uncontested_2022],
+        ["High", "Medium", "Recruit"],
+        "Low",
+    )
+
+    # Classify action
+    has_pct = ~np.isnan(latest_d_pct)
+    pct_text = latest_d_pct.astype(str).astype(object)
+    year_text = latest_d_year.fillna("").to_numpy(dtype=object)
+    trend_text = d_trend.astype(str).astype(object)
+    action = np.select(
+        [
+            latest_d_pct >= 45,
+            uncontested_2022 & ~has_pct,
+            uncontested_2022 & has_pct,
+            d_trend > 5,
+            latest_d_pct >= 35,
+        ],
+        [
+            "Win — competitive, invest resources",
+            "Recruit — never contested, need candidate",
+            "Recruit — D got " + pct_text + "% in " + year_text + ", ran unopposed in 2022",
+            "Trending — D gained " + trend_text + " pts over cycle",
+            "Build — close enough to invest in",
+        ],
+        "Monitor",
+    )
+
+    races_df = pd.DataFrame({
+        "race": names.to_numpy(),
+        "level": races_2022["race_level"].to_numpy(),
+        "latest_d_pct": latest_d_pct,
+        "latest_d_year": latest_d_year.to_numpy(),
+        "d_contested": [f"{c}/{t}" for c, t in zip(contested_count, total_cycles)],
+        "d_trend": d_trend,
+        "uncontested_2022": uncontested_2022,
+        "priority": priority,
+        "action": action,
+        "parties_2022": parties_2022.to_numpy(),
+        "candidates_2022": races_2022["candidates_2022"].to_numpy(),
+    })
 
     # --- 4. Top opportunities: contested + competitive + trending ---
     top_opps = races_df[
@@ -1644,6 +2020,24 @@ def get_2026_target_races(db_path=None):
     }
 
 
+def _write_excel_streaming(output_path, sheets):
+    """
+    Write (sheet_name, frame) pairs with xlsxwriter in constant_memory mode,
+    which flushes each row to disk as soon as the next one starts instead of
+    holding every cell until save. Rows are written directly: to_excel
+    writes column by column, and constant_memory drops out-of-order cells.
+    """
+    workbook = xlsxwriter.Workbook(output_path, {"constant_memory": True})
+    header = workbook.add_format({"bold": True, "border": 1, "align": "center"})
+    for name, df in sheets:
+        worksheet = workbook.add_worksheet(name)
+        worksheet.write_row(0, 0, [str(col) for col in df.columns], header)
+        for i, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            # NaN (missing values) is left as an empty cell, as to_excel does
+            worksheet.write_row(i, 0, [None if pd.isna(v) else v for v in row])
+    workbook.close()
+
+
 def export_analysis_to_excel(output_path=None, db_path=None):
     """
     Export all key analyses to a single Excel workbook.
@@ -1656,21 +2050,19 @@ def export_analysis_to_excel(output_path=None, db_path=None):
             f"bcd_analysis_{pd.Timestamp.now().strftime('%Y%m%d')}.xlsx"
         )
 
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        # Dem vote share trends
-        vote_shares = get_dem_vote_share_by_election(db_path=db_path)
-        if not vote_shares.empty:
-            vote_shares.to_excel(writer, sheet_name="Dem Vote Share Trends", index=False)
-
-        # Competitive races
-        competitive = get_competitive_races(db_path=db_path)
-        if not competitive.empty:
-            competitive.to_excel(writer, sheet_name="Competitive Races", index=False)
-
-        # Turnout
-        turnout = get_turnout_analysis(db_path=db_path)
-        if not turnout.empty:
-            turnout.to_excel(writer, sheet_name="Turnout Analysis", index=False)
+    sheets = [
+        ("Dem Vote Share Trends", get_dem_vote_share_by_election(db_path=db_path)),
+        ("Competitive Races", get_competitive_races(db_path=db_path)),
+        ("Turnout Analysis", get_turnout_analysis(db_path=db_path)),
+    ]
+    sheets = [(name, df) for name, df in sheets if not df.empty]
+
+    if HAS_XLSXWRITER:
+        _write_excel_streaming(output_path, sheets)
+    else:
+        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+            for name, df in sheets:
+                df.to_excel(writer, sheet_name=name, index=False)
 
     print(f"Analysis exported to: {output_path}")
     return output_path
@@ -18,6 +18,10 @@ def get_connection(db_path=None):
     conn = sqlite3.connect(path)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    # Bigger page cache and memory-mapped reads for the analysis joins.
+    # (Journal mode is left alone: it is stored in the committed db file.)
+    conn.execute("PRAGMA cache_size = -20000")
+    conn.execute("PRAGMA mmap_size = 268435456")
     return conn
 
 
@@ -175,6 +179,21 @@ def init_db(db_path=None):
         )
     """)
 
+    # -- Indexes for the dashboard's join and filter columns --
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_races_election ON races(election_id, race_level, race_name)")
+    # votes is included so the results scans are index-only (covering);
+    # it supersedes the earlier idx_results_race on the first three columns.
+    cursor.execute("DROP INDEX IF EXISTS idx_results_race")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_race_votes ON results(race_id, candidate_id, precinct_id, votes)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_precinct ON results(precinct_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_turnout_election ON turnout(election_id, precinct_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_data_quality_election ON data_quality(election_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_elections_type_date ON elections(election_type, election_date)")
+    # No index on candidates(party) / results(candidate_id): with them the
+    # planner drives the precinct joins from the party filter instead of one
+    # results scan with primary-key lookups, which made the PVI and
+    # uncontested-race queries 2-3x slower. The other join keys are primary keys.
+
     conn.commit()
     conn.close()
     return True
@@ -195,6 +214,63 @@ def insert_county(name, state="IN", fips_code=None, clerk_website=None, db_path=
     return row["id"]
 
 
+# D/R vote totals per precinct per election, the base of the dashboard's
+# precinct views. Precinct names are normalized with UPPER() to avoid
+# duplicates; rows without D or R votes are dropped.
+PRECINCT_DEM_SHARE_SQL = """
+    SELECT
+        UPPER(p.precinct_name) as precinct,
+        e.election_date,
+        e.election_type,
+        SUM(CASE WHEN c.party = 'D' THEN res.votes ELSE 0 END) as dem_votes,
+        SUM(CASE WHEN c.party = 'R' THEN res.votes ELSE 0 END) as rep_votes,
+        SUM(CASE WHEN c.party IN ('D', 'R') THEN res.votes ELSE 0 END) as dr_total
+    FROM results res
+    JOIN races r ON res.race_id = r.id
+    JOIN candidates c ON res.candidate_id = c.id
+    JOIN elections e ON r.election_id = e.id
+    JOIN precincts p ON res.precinct_id = p.id
+    WHERE c.party IN ('D', 'R')
+      AND res.precinct_id IS NOT NULL
+    GROUP BY UPPER(p.precinct_name), e.election_date
+    HAVING dr_total > 0
+"""
+
+
+def refresh_precinct_dem_share(conn):
+    """
+    Rebuild the precinct_dem_share table from PRECINCT_DEM_SHARE_SQL so the
+    dashboard reads it instead of re-running the join. Call after any change
+    to results, inside the same transaction (the caller commits).
+    """
+    conn.execute("DROP TABLE IF EXISTS precinct_dem_share")
+    conn.execute(f"CREATE TABLE precinct_dem_share AS {PRECINCT_DEM_SHARE_SQL} ORDER BY precinct, election_date")
+    conn.execute("CREATE INDEX idx_precinct_dem_share_date ON precinct_dem_share(election_date)")
+
+
+def ensure_precinct_dem_share(db_path=None):
+    """
+    Build the precinct_dem_share table if the database does not have one yet
+    (databases imported before it existed). Returns False when it is missing
+    and cannot be written, e.g. a read-only deployment.
+    """
+    conn = None
+    try:
+        conn = get_connection(db_path)
+        has_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'precinct_dem_share'"
+        ).fetchone()
+        if not has_table:
+            refresh_precinct_dem_share(conn)
+            conn.commit()
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        if conn is not None:
+            conn.close()
+
+
 if __name__ == "__main__":
     print("Initializing BCD database...")
     init_db()
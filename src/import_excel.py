@@ -9,7 +9,7 @@ import sqlite3
 import os
 import sys
 from datetime import datetime
-from database import get_connection, init_db, insert_county, DB_PATH
+from database import get_connection, init_db, insert_county, DB_PATH, refresh_precinct_dem_share
 
 
 def preview_file(filepath):
@@ -230,6 +230,7 @@ def import_election_results(filepath, county_name="Boone", state="IN",
         (os.path.basename(filepath), ext.replace(".", ""), records_imported)
     )
 
+    refresh_precinct_dem_share(conn)
     conn.commit()
     conn.close()
 
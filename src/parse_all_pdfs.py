@@ -16,7 +16,7 @@ import re
 import pandas as pd
 import os
 import sys
-from database import get_connection, init_db, insert_county
+from database import get_connection, init_db, insert_county, refresh_precinct_dem_share
 
 
 def detect_format(text):
@@ -642,6 +642,7 @@ def load_parsed_into_db(parsed_data, db_path=None):
         (parsed_data["source_file"], records)
     )
 
+    refresh_precinct_dem_share(conn)
     conn.commit()
     conn.close()
 
@@ -17,7 +17,7 @@ import re
 import pandas as pd
 import os
 import sys
-from database import get_connection, init_db, insert_county
+from database import get_connection, init_db, insert_county, refresh_precinct_dem_share
 
 
 def parse_boone_county_pdf(filepath):
@@ -316,6 +316,7 @@ def load_into_database(parsed_data, county_name="Boone", state="IN", db_path=Non
         (os.path.basename(parsed_data.get("source_file", "allprecinctsafterprov.pdf")), records)
     )
 
+    refresh_precinct_dem_share(conn)
     conn.commit()
     conn.close()
 
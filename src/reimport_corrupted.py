@@ -16,7 +16,7 @@ import sys
 
 sys.path.insert(0, os.path.dirname(__file__))
 from parse_all_pdfs import parse_pdf_universal, classify_race_level, extract_race_party
-from database import get_connection, DB_PATH, init_db, insert_county
+from database import get_connection, DB_PATH, init_db, insert_county, refresh_precinct_dem_share
 from validate_and_fix import improved_classify_race_level
 
 
@@ -101,6 +101,7 @@ def delete_election_data(election_date, db_path=None):
     # Delete import_log entries for this source
     cur.execute("DELETE FROM import_log WHERE filename LIKE ?", (f"%{election_date[:4]}%",))
 
+    refresh_precinct_dem_share(conn)
     conn.commit()
     conn.close()
 
@@ -271,6 +272,7 @@ def load_parsed_with_improved_classification(parsed_data, db_path=None):
         (parsed_data["source_file"], records)
     )
 
+    refresh_precinct_dem_share(conn)
     conn.commit()
     conn.close()
 
@@ -0,0 +1,52 @@
+"""
+The dashboard's figure caches key their input frames on _frame_fingerprint.
+app.py runs the whole Streamlit page on import, so the function is pulled
+out of the module source and exercised on its own.
+"""
+
+import ast
+import os
+
+import pandas as pd
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "dashboards", "app.py")
+
+
+def _load_frame_fingerprint():
+    with open(APP_PATH) as f:
+        tree = ast.parse(f.read())
+    func = next(
+        node for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name == "_frame_fingerprint"
+    )
+    namespace = {"pd": pd}
+    exec(compile(ast.Module(body=[func], type_ignores=[]), APP_PATH, "exec"), namespace)
+    return namespace["_frame_fingerprint"]
+
+
+_frame_fingerprint = _load_frame_fingerprint()
+
+
+def _heatmap():
+    return pd.DataFrame(
+        {"2020-11-03": [12.5, -4.0, 30.25], "2024-11-05": [10.0, -8.5, 28.0]},
+        index=pd.Index(["EAGLE 01", "CENTER 02", "PERRY 03"], name="precinct"),
+    )
+
+
+def test_row_orderings_have_different_fingerprints():
+    heatmap = _heatmap()
+    by_margin = heatmap.sort_values("2024-11-05", ascending=False)
+    alphabetical = heatmap.sort_index()
+    assert list(by_margin.index) != list(alphabetical.index)
+    assert _frame_fingerprint(by_margin) != _frame_fingerprint(alphabetical)
+
+
+def test_equal_frames_share_a_fingerprint():
+    assert _frame_fingerprint(_heatmap()) == _frame_fingerprint(_heatmap())
+
+
+def test_changed_value_changes_the_fingerprint():
+    changed = _heatmap()
+    changed.iloc[0, 0] = 13.0
+    assert _frame_fingerprint(changed) != _frame_fingerprint(_heatmap())